@@ -3,18 +3,25 @@ import os
 import warnings
 warnings.filterwarnings("ignore") # Suppress FutureWarnings
 from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+from config import PROMPT_CHAR_BUDGET, SUMMARY_MODE, MAP_CHUNK_CHARS, MAP_WORKERS, MAP_MAX_LEVELS
+from ranking import prompt_block
+from llm_cache import CachedModel
 
 load_dotenv()
 
 # Gemini 설정
 genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
-model = genai.GenerativeModel('gemini-flash-latest')
+# 같은 키워드 확장/요약 요청은 캐시에서 응답 (재실행 시 API 지연/쿼터 절약, 캐시 DB는 첫 호출 때 열림)
+model = CachedModel(genai.GenerativeModel('gemini-flash-latest'))
 
-def expand_keywords(base_keywords):
+def expand_keywords(base_keywords, llm=None):
     """
     사용자가 입력한 기본 키워드를 AI가 더 구체적인 검색어로 확장해줍니다.
     예: "AI" -> ["Generative AI", "LLM trends", "AI Ethics", "AI Hardware"]
+    llm: generate_content(prompt)를 가진 모델 객체 (기본값은 Gemini)
     """
+    llm = llm or model
     prompt = f"""
     당신은 테크 트렌드 사냥꾼입니다.
     사용자가 입력한 다음 키워드를 바탕으로, **뉴스 및 유튜브 검색에 적합한 구체적인 연관 키워드 5개**를 영어로 생성해주세요.
@@ -26,7 +33,7 @@ def expand_keywords(base_keywords):
     """
     
     try:
-        response = model.generate_content(prompt)
+        response = llm.generate_content(prompt)
         # 단순 파싱 (대괄호 안의 내용 추출)
         text = response.text.strip()
         if '[' in text and ']' in text:
@@ -40,19 +47,82 @@ def expand_keywords(base_keywords):
         print(f"[ERROR] Keyword expansion failed: {e}")
         return base_keywords
 
-def summarize_content(content_list):
+def chunk_texts(blocks, chunk_chars=MAP_CHUNK_CHARS):
+    """
+    텍스트 블록들을 chunk_chars 이하 배치로 순서대로 묶습니다. (너무 긴 블록은 잘라서 단독 배치)
+    """
+    chunks, current, size = [], [], 0
+    for block in blocks:
+        block = block[:chunk_chars]
+        if current and size + len(block) > chunk_chars:
+            chunks.append("".join(current))
+            current, size = [], 0
+        current.append(block)
+        size += len(block)
+    if current:
+        chunks.append("".join(current))
+    return chunks
+
+
+def summarize_chunk(chunk, llm, note_chars):
+    """
+    map 단계: 배치 1개를 요약 노트로 압축합니다. 실패하면 원문 앞부분을 그대로 사용합니다.
+    """
+    prompt = f"""
+    아래 수집된 뉴스/영상 목록을 뉴스레터 에디터가 참고할 **요약 노트**로 압축하세요.
+    - 항목마다 Title, Link, Image 줄은 그대로 유지하고, Summary는 핵심 사실 1~2문장으로 줄이세요.
+    - 비즈니스 관점에서 의미 없는 항목은 빼도 됩니다.
+    - 전체 {note_chars}자 이내, 형식은 입력과 같게 (항목 사이 ---).
+
+    **수집된 데이터:**
+    {chunk}
+    """
+    try:
+        return llm.generate_content(prompt).text.strip() + "\n---"
+    except Exception as e:
+        print(f"[WARN] Map summary failed, using raw text: {e}")
+        return chunk[:note_chars]
+
+
+def map_summaries(blocks, llm, budget=PROMPT_CHAR_BUDGET, chunk_chars=MAP_CHUNK_CHARS,
+                  workers=MAP_WORKERS, max_levels=MAP_MAX_LEVELS, min_levels=0):
+    """
+    블록들을 배치로 나눠 병렬로 요약(map)하고, 합친 노트가 budget 안에 들어올 때까지 반복합니다.
+    min_levels: 예산 안에 들어와도 최소한 거치는 map 단계 수 (SUMMARY_MODE="map_reduce"는 1)
+    반환된 노트는 reduce(뉴스레터 작성) 프롬프트에 그대로 들어갑니다.
+    """
+    level = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while level < max_levels and (level < min_levels or sum(len(b) for b in blocks) > budget):
+            chunks = chunk_texts(blocks, chunk_chars)
+            # 배치마다 예산을 나눠 가짐 -> 합쳐도 reduce 프롬프트에 들어감
+            note_chars = max(budget // len(chunks) - 50, 200)
+            print(f"[AI] Map step {level + 1}: {len(blocks)} blocks -> {len(chunks)} batches")
+            blocks = list(executor.map(lambda chunk: summarize_chunk(chunk, llm, note_chars), chunks))
+            level += 1
+    return "".join(blocks)
+
+
+def summarize_content(content_list, llm=None, mode=SUMMARY_MODE):
     """
     수집된 뉴스 및 유튜브 자막 리스트를 받아서 뉴스레터 섹션을 생성합니다.
+    수집 데이터가 프롬프트 예산(PROMPT_CHAR_BUDGET)을 넘으면 map-reduce로 요약합니다.
+    - map: 배치별 요약 노트를 병렬 생성 / reduce: 노트를 모아 뉴스레터 작성
+    llm: generate_content(prompt)를 가진 모델 객체 (테스트용 가짜 모델 주입 가능, 기본값은 Gemini)
     """
     if not content_list:
         return "수집된 콘텐츠가 없습니다."
+    llm = llm or model
+
+    # 텍스트 합치기 (이미지 정보도 함께 전달)
+    blocks = [prompt_block(item) for item in content_list]
+    combined_text = "".join(blocks)
 
-    # 텍스트 합치기
-    combined_text = ""
-    for item in content_list:
-        # 이미지 정보도 함께 전달
-        img_info = f"Image: {item.get('image', 'No Image')}"
-        combined_text += f"\nTitle: {item['title']}\nLink: {item['link']}\n{img_info}\nSummary: {item['summary']}\n---"
+    if mode == "map_reduce":
+        # 항상 분할: 입력이 작아도 map 단계를 한 번은 거침
+        combined_text = map_summaries(blocks, llm, min_levels=1)
+    elif mode == "auto" and len(combined_text) > PROMPT_CHAR_BUDGET:
+        combined_text = map_summaries(blocks, llm)
     
     prompt = f"""
     당신은 실리콘밸리에서 가장 날카로운 통찰력을 가진 **테크 전문 에디터**입니다.
@@ -89,11 +159,11 @@ def summarize_content(content_list):
     - 제공된 Image URL을 적절한 곳에 `<img src="URL" alt="...">` 로 넣으세요.
     
     **수집된 데이터:**
-    {combined_text[:15000]}
+    {combined_text[:PROMPT_CHAR_BUDGET]}
     """
     
     try:
-        response = model.generate_content(prompt)
+        response = llm.generate_content(prompt)
         newsletter_body = response.text
     
         # 마크다운 코드 블록 제거
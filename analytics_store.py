@@ -0,0 +1,147 @@
+import os
+import time
+import atexit
+import sqlite3
+import threading
+from collections import Counter
+from storage import load_json
+
+ANALYTICS_DB = "analytics.db"
+LEGACY_ANALYTICS_FILE = "analytics.json"
+FLUSH_EVERY = 50        # 버퍼에 이벤트가 이만큼 쌓이면 저장
+FLUSH_INTERVAL = 5.0    # 초, 마지막 저장 후 이만큼 지나면 저장
+
+VISITS_KEY = "visits"
+LIKE_PREFIX = "like:"
+
+
+class AnalyticsStore:
+    """
+    방문/좋아요 카운터 저장소 (SQLite WAL).
+    - 이벤트는 메모리 버퍼(Counter)에 모았다가 한 트랜잭션으로 더함 (value = value + n)
+      -> 여러 세션/프로세스가 동시에 써도 증가분이 사라지지 않음
+    - counters 테이블이 곧 집계 결과라서 관리자 화면은 행 몇 개만 읽음
+    - 처음 만들 때 예전 analytics.json 값을 한 번 가져옴
+    """
+    def __init__(self, path=ANALYTICS_DB, flush_every=FLUSH_EVERY, flush_interval=FLUSH_INTERVAL,
+                 legacy_path=LEGACY_ANALYTICS_FILE, clock=time.monotonic):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.clock = clock
+        self._buffer = Counter()
+        self._buffered = 0
+        self._last_flush = clock()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS counters (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS analytics_state (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+        self._conn.commit()
+        if legacy_path:
+            self._migrate_legacy(legacy_path)
+        atexit.register(self.flush)
+
+    def _migrate_legacy(self, legacy_path):
+        with self._lock:
+            # BEGIN IMMEDIATE: 두 프로세스가 동시에 시작해도 한 번만 가져옴
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                done = self._conn.execute("SELECT 1 FROM analytics_state WHERE key = 'legacy_migrated'").fetchone()
+                if not done:
+                    legacy = load_json(legacy_path, {}) or {}
+                    rows = [(VISITS_KEY, int(legacy.get('visits', 0)))]
+                    rows += [(LIKE_PREFIX + name, int(count)) for name, count in legacy.get('likes', {}).items()]
+                    self._add(rows)
+                    self._conn.execute("INSERT INTO analytics_state (key, value) VALUES ('legacy_migrated', ?)",
+                                       (legacy_path,))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _add(self, rows):
+        self._conn.executemany(
+            "INSERT INTO counters (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = value + excluded.value",
+            [row for row in rows if row[1]],
+        )
+
+    # ---------------------------------------------------------------
+    # 기록
+    # ---------------------------------------------------------------
+    def _record(self, key, amount=1):
+        with self._lock:
+            self._buffer[key] += amount
+            self._buffered += 1
+            due = self._buffered >= self.flush_every or self.clock() - self._last_flush >= self.flush_interval
+        if due:
+            self.flush()
+
+    def record_visit(self):
+        self._record(VISITS_KEY)
+
+    def record_like(self, filename):
+        self._record(LIKE_PREFIX + filename)
+
+    def flush(self):
+        """
+        버퍼에 쌓인 증가분을 한 트랜잭션으로 저장합니다.
+        """
+        with self._lock:
+            if not self._buffer:
+                self._last_flush = self.clock()
+                return 0
+            pending = self._buffer
+            self._buffer = Counter()
+            self._buffered = 0
+            try:
+                with self._conn:
+                    self._add(pending.items())
+            except sqlite3.Error as e:
+                # 저장 실패 시 버퍼로 되돌려 다음 flush에서 다시 시도
+                self._buffer.update(pending)
+                print(f"[ANALYTICS] Flush failed, will retry: {e}")
+                return 0
+            self._last_flush = self.clock()
+            return sum(pending.values())
+
+    # ---------------------------------------------------------------
+    # 조회 (저장된 값 + 아직 저장 안 된 버퍼)
+    # ---------------------------------------------------------------
+    def _value(self, key):
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM counters WHERE key = ?", (key,)).fetchone()
+            return (row[0] if row else 0) + self._buffer.get(key, 0)
+
+    def visits(self):
+        return self._value(VISITS_KEY)
+
+    def like_count(self, filename):
+        return self._value(LIKE_PREFIX + filename)
+
+    def likes(self):
+        """
+        {파일명: 좋아요 수} (관리자 차트용)
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT key, value FROM counters WHERE key LIKE ?", (LIKE_PREFIX + '%',)).fetchall()
+            totals = Counter({key[len(LIKE_PREFIX):]: value for key, value in rows})
+            for key, value in self._buffer.items():
+                if key.startswith(LIKE_PREFIX):
+                    totals[key[len(LIKE_PREFIX):]] += value
+        return dict(totals)
+
+    def close(self):
+        self.flush()
+        atexit.unregister(self.flush)
+        self._conn.close()
@@ -1,9 +1,15 @@
 import streamlit as st
 import pandas as pd
 import os
-import glob
-import json
-from datetime import datetime
+import html
+import time
+from archive_index import ArchiveIndex, ARCHIVE_DIR, ARCHIVE_PAGE_SIZE
+from fragments import load_fragments, newsletter_markup, fragment_path
+from app_cache import STATS as CACHE_STATS, tracked_cache_data, tracked_cache_resource, load_asset, file_mtime
+from archive_cards import ARCHIVE_CARD_CSS, render_card, card_title
+from subscriber_store import SubscriberStore
+from analytics_store import AnalyticsStore
+from subscriber_repo import SubscriberRepository, SheetSyncWorker
 
 # -------------------------------------------------------------------------
 # 1. Page Config & CSS
@@ -15,7 +21,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-st.markdown("""
+@tracked_cache_resource("css")
+def page_css():
+    # 페이지 전체 CSS (한 번 조립해서 재사용)
+    return """
 <style>
     /* 전체 배경 */
     .reportview-container { background: #f9fafb; }
@@ -77,33 +86,26 @@ st.markdown("""
         border: none !important;
         box-shadow: none !important;
     }
+""" + ARCHIVE_CARD_CSS + """
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(page_css(), unsafe_allow_html=True)
 
 # -------------------------------------------------------------------------
 # 2. File & Data Management
 # -------------------------------------------------------------------------
 SUBSCRIBERS_FILE = 'subscribers.csv'
-ANALYTICS_FILE = 'analytics.json'
-
-def load_analytics():
-    if not os.path.exists(ANALYTICS_FILE):
-        return {"visits": 0, "likes": {}}
-    try:
-        with open(ANALYTICS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, ValueError):
-        return {"visits": 0, "likes": {}}
+LOGO_FILE = 'unicorn_signal_logo.png'
 
-def save_analytics(data):
-    with open(ANALYTICS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
+@st.cache_resource
+def get_analytics_store():
+    # 방문/좋아요 카운터 (SQLite WAL, 버퍼 후 일괄 저장). 모든 세션이 공유
+    return AnalyticsStore()
 
 def increment_visit():
     if 'visited' not in st.session_state:
-        data = load_analytics()
-        data['visits'] = data.get('visits', 0) + 1
-        save_analytics(data)
+        get_analytics_store().record_visit()
         st.session_state['visited'] = True
 
 def toggle_like(filename):
@@ -112,77 +114,74 @@ def toggle_like(filename):
     if st.session_state.get(liked_key, False):
         return False, "이미 좋아요를 누르셨습니다! (중복 방지) 😉"
     
-    data = load_analytics()
-    if 'likes' not in data: data['likes'] = {}
-    
-    if filename not in data['likes']:
-        data['likes'][filename] = 0
-    data['likes'][filename] += 1
-    
-    save_analytics(data)
+    get_analytics_store().record_like(filename)
     st.session_state[liked_key] = True
     return True, "소중한 피드백 감사합니다! ❤️"
 
 # [New] 구글 시트 연동 모듈
 import google_sheet
 
+@tracked_cache_data("card_html", max_entries=1000, show_spinner=False)
+def cached_card_html(filename, updated_at, _meta):
+    # 아카이브 카드 HTML (발행호 파일명 + 인덱스 갱신 시각이 키)
+    return render_card(_meta)
+
+@tracked_cache_data("newsletter", max_entries=64, show_spinner=False)
+def cached_newsletter_markup(filename, mtime):
+    # 뉴스레터 본문 HTML (조각 파일 수정 시각이 키)
+    return newsletter_markup(load_fragments(filename))
+
+def newsletter_html(filename):
+    return cached_newsletter_markup(filename, file_mtime(fragment_path(filename)))
+
+# 아카이브 조회 결과: 인덱스 버전(upsert/재색인마다 증가)이 키 -> 새 발행호가 생기면 자동으로 새로 조회
+@tracked_cache_data("archive_overview", max_entries=8, show_spinner=False)
+def archive_overview(version):
+    index = get_archive_index()
+    return {'count': index.count(), 'cards': index.count(with_meta_only=True), 'latest': index.latest()}
+
+@tracked_cache_data("archive_page", max_entries=64, show_spinner=False)
+def archive_page(page, version):
+    return get_archive_index().page(page, ARCHIVE_PAGE_SIZE)
+
+@tracked_cache_data("archive_search", max_entries=256, show_spinner=False)
+def archive_search(query, version):
+    return get_archive_index().search(query)
+
+@st.cache_resource
+def get_archive_index():
+    # 발행호 목록 인덱스 (SQLite). 세션/재실행 간에 연결 1개를 공유
+    return ArchiveIndex()
+
+@st.cache_resource
+def get_subscriber_repo():
+    # 구독자 원본(로컬 SQLite) + 구글 시트 백그라운드 양방향 동기화 (프로세스당 1개)
+    repo = SubscriberRepository()
+    repo.import_csv(SUBSCRIBERS_FILE)  # 예전 CSV 구독자 가져오기 (바뀌었을 때만)
+    sync_worker = SheetSyncWorker(repo, google_sheet.SheetSubscriberSource()).start()
+    return repo, sync_worker
+
 def load_subscribers():
-    # 1. Google Sheet 시도
-    # (주의: 인증 파일이 없으면 빈 DataFrame을 반환함)
-    df_cloud = google_sheet.load_subscribers_gsheet()
-    
-    # 2. Local CSV 로드
-    if not os.path.exists(SUBSCRIBERS_FILE):
-        df_local = pd.DataFrame(columns=['email', 'nickname', 'date'])
-        df_local.to_csv(SUBSCRIBERS_FILE, index=False)
-    else:
-        df_local = pd.read_csv(SUBSCRIBERS_FILE)
-    
-    # 두 데이터를 합쳐서 보여줄지, 하나만 보여줄지 결정
-    # 인증이 되어 있다면 Cloud 데이터가 '진본'임.
-    # 하지만 로컬 테스트 중일 수 있으므로, 만약 Cloud가 비어있고 Local이 있으면 Local 반환?
-    # 간단하게: Cloud에서 데이터를 가져왔으면(헤더가 있으면) Cloud 우선.
-    if not df_cloud.empty:
-        return df_cloud
-        
-    return df_local
+    repo, _ = get_subscriber_repo()
+    return pd.DataFrame(repo.rows(), columns=['email', 'nickname', 'date'])
 
 def save_subscriber(email, nickname):
-    # 1. 구글 시트 저장 시도 (우선순위)
-    gs_success, gs_msg = google_sheet.save_subscriber_gsheet(email, nickname)
-    
-    # 구글 시트 저장이 성공했거나, '이미 구독 중' 같은 논리적 결과라면 바로 반환
-    if gs_success or "이미" in gs_msg:
-        return gs_success, gs_msg
+    if "@" not in email:
+        return False, "이메일 형식을 확인해주세요."
 
-    # 2. 구글 시트 실패(인증 없음 등) 시 -> 로컬 CSV 저장 (Fallback)
-    df = load_subscribers() # 로컬 로드 (위 함수 로직에 따라 Cloud일수도 있으나, 여기서 다시 로컬 처리)
-    
-    # 로컬 파일 직접 핸들링
-    if os.path.exists(SUBSCRIBERS_FILE):
-        df_local = pd.read_csv(SUBSCRIBERS_FILE)
-    else:
-        df_local = pd.DataFrame(columns=['email', 'nickname', 'date'])
-        
-    if email in df_local['email'].values:
-        # 구글 시트 실패하고 로컬에는 이미 있는 경우
-        if "인증 키" in gs_msg:
-             return False, f"구글 시트 연동 필요 ({gs_msg}). 로컬엔 이미 있습니다."
-        return False, "이미 구독 중인 이메일입니다! (Local)"
-    
-    new_entry = pd.DataFrame([{
-        'email': email, 
-        'nickname': nickname, 
-        'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    }])
-    df_local = pd.concat([df_local, new_entry], ignore_index=True)
-    df_local.to_csv(SUBSCRIBERS_FILE, index=False)
-    
-    # 메시지 분기
-    if "인증 키" in gs_msg:
-        return True, "구독 완료! (로컬 저장됨 - 구글 시트 연동을 설정해주세요)"
-        
-    return True, "구독 신청이 완료되었습니다! (Local Saved)"
+    # 로컬 저장소에 바로 저장 (이메일 PRIMARY KEY로 중복 확인)
+    repo, sync_worker = get_subscriber_repo()
+    if not repo.add(email.strip(), nickname):
+        return False, "이미 구독 중인 이메일입니다!"
+
+    # 구글 시트 반영은 백그라운드에서 (가입 응답은 시트를 기다리지 않음)
+    sync_worker.request()
+    return True, "구독 신청이 완료되었습니다!"
+
+@st.cache_resource
+def get_subscriber_store():
+    # 모든 세션이 공유하는 구독자 캐시 (TTL 지나면 백그라운드로 새로고침)
+    return SubscriberStore(load_subscribers)
 
 # 앱 실행 시 방문자 카운트
 increment_visit()
@@ -192,8 +191,8 @@ increment_visit()
 # -------------------------------------------------------------------------
 with st.sidebar:
     # [수정] 텍스트 제목 제거하고 로고만 깔끔하게
-    if os.path.exists("unicorn_signal_logo.png"):
-        st.image("unicorn_signal_logo.png", use_container_width=True)
+    if os.path.exists(LOGO_FILE):
+        st.image(load_asset(LOGO_FILE, file_mtime(LOGO_FILE)), use_container_width=True)
     else:
         st.image("https://emojigraph.org/media/apple/unicorn_1f984.png", width=80)
         st.markdown("### Unicorn Signal")
@@ -210,6 +209,7 @@ with st.sidebar:
             if email and nickname:
                 success, msg = save_subscriber(email, nickname)
                 if success:
+                    get_subscriber_store().invalidate()
                     st.success(msg)
                     st.balloons()
                 else:
@@ -236,8 +236,7 @@ with st.sidebar:
 # 4. Main Page Routing
 # -------------------------------------------------------------------------
 # 공통 데이터 로딩
-analytics = load_analytics()
-sub_df = load_subscribers()
+analytics = get_analytics_store()
 
 if st.session_state.get('is_admin', False):
     # ==========================
@@ -246,7 +245,23 @@ if st.session_state.get('is_admin', False):
     # ==========================
     st.title("📊 Admin Dashboard")
     
+    # [Perf] 구독자 목록은 관리자 화면에서만 조회 (공개 페이지는 구글 시트를 호출하지 않음)
+    subscriber_store = get_subscriber_store()
+    sub_df = subscriber_store.get()
+    if sub_df is None:
+        sub_df = pd.DataFrame(columns=['email', 'nickname', 'date'])
+    
     st.subheader("👥 구독자 현황")
+    age = subscriber_store.age()
+    c_age, c_refresh = st.columns([3, 1])
+    c_age.caption(f"마지막 동기화: {int(age)}초 전" if age is not None else "동기화 중...")
+    if c_refresh.button("🔄 새로고침", key="refresh_subscribers"):
+        try:
+            get_subscriber_repo()[0].sync(google_sheet.SheetSubscriberSource())
+        except Exception as e:
+            st.warning(f"구글 시트 동기화 실패: {e}")
+        subscriber_store.refresh(wait=True)
+        st.rerun()
     if not sub_df.empty:
         st.dataframe(sub_df, use_container_width=True)
         
@@ -271,7 +286,9 @@ if st.session_state.get('is_admin', False):
         
     st.divider()
     
-    total_visits = analytics.get('visits', 0)
+    # 관리자 화면은 버퍼를 먼저 저장한 뒤 집계 카운터를 읽음
+    analytics.flush()
+    total_visits = analytics.visits()
     sub_count = len(sub_df)
     
     # 3-Column Metrics
@@ -284,7 +301,7 @@ if st.session_state.get('is_admin', False):
     
     # Charts
     st.subheader("📈 인기 리포트 (Likes)")
-    likes_data = analytics.get('likes', {})
+    likes_data = analytics.likes()
     if likes_data:
         # Dictionary to DataFrame
         # Topic 파싱 개선: 날짜_주제.html -> 주제
@@ -302,6 +319,25 @@ if st.session_state.get('is_admin', False):
     else:
         st.info("아직 좋아요 데이터가 없습니다.")
 
+    st.divider()
+
+    # 캐시 상태 (서버 시작 후 모든 세션 합계)
+    st.subheader("⚡ 캐시 히트율")
+    cache_rows = CACHE_STATS.snapshot()
+    if cache_rows:
+        df_cache = pd.DataFrame(cache_rows)
+        total_calls = int(df_cache['calls'].sum())
+        total_hits = int(df_cache['hits'].sum())
+        st.caption(f"전체 {total_calls:,}회 조회 중 {total_hits:,}회 캐시 히트 ({total_hits / total_calls:.1%})")
+        df_cache['hit_rate'] = df_cache['hit_rate'].map(lambda r: f"{r:.1%}")
+        st.dataframe(df_cache, use_container_width=True, hide_index=True)
+    else:
+        st.info("아직 캐시 조회 기록이 없습니다.")
+    if st.button("🧹 캐시 비우기", key="clear_caches"):
+        st.cache_data.clear()
+        CACHE_STATS.reset()
+        st.rerun()
+
 else:
     # ==========================
     # PUBLIC PAGE
@@ -321,18 +357,22 @@ else:
     tab_home, tab_archive = st.tabs(["🏠 홈 (Latest)", "📚 아카이브 (History)"])
     
     # 데이터 로드
-    if not os.path.exists('archives'): os.makedirs('archives')
+    if not os.path.exists(ARCHIVE_DIR): os.makedirs(ARCHIVE_DIR)
+    # [Perf] 매 재실행마다 glob/json.load 하지 않고 인덱스만 조회 (폴더가 바뀌었을 때만 재색인)
     # [Fix] 파일명(날짜) 기준으로 정렬 (수정일 기준 X -> 내용 수정해도 순서 유지)
-    html_files = sorted(glob.glob('archives/*.html'), reverse=True)
-    json_files = sorted(glob.glob('archives/*.json'), reverse=True)
+    archive_index = get_archive_index()
+    archive_index.ensure_fresh()
+    archive_version = archive_index.version()
+    overview = archive_overview(archive_version)
+    latest_issue = overview['latest']
 
     # 1) 홈 탭
     # 1) 홈 탭
     with tab_home:
         # KPI 배지 & 최신 토픽 파싱 개선
         latest_title = "No Data"
-        if html_files:
-            filename = os.path.basename(html_files[0])
+        if latest_issue:
+            filename = latest_issue['filename']
             # 2024-02-05_Generative_AI.html -> Generative AI
             if '_' in filename:
                 parts = filename.split('_', 1)
@@ -344,84 +384,49 @@ else:
         st.markdown(f"""
         <div style="display: flex; justify-content: center; gap: 15px; margin-bottom: 20px;">
             <div class="metric-card">🔥 Topic: <b>{latest_title}</b></div>
-            <div class="metric-card">📑 Reports: <b>{len(html_files)}</b></div>
+            <div class="metric-card">📑 Reports: <b>{overview['count']}</b></div>
             <div class="metric-card" style="background:#dcfce7; color:#166534;">⚡ Status: <b>Online</b></div>
         </div>
         """, unsafe_allow_html=True)
         
         # 최신 뉴스레터 표시 (iframe 제거 -> st.markdown으로 통합 스크롤 구현)
-        if html_files:
-            with open(html_files[0], 'r', encoding='utf-8') as f:
-                raw_html = f.read()
-                
-                # [Fix] HTML 구조 파싱 후 스타일과 본문만 추출하여 렌더링 (CSS 깨짐 완벽 방지)
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(raw_html, 'html.parser')
-                
-                # 1. 스타일 추출
-                style_content = ""
-                if soup.style:
-                    style_content = soup.style.string
-                
-                # 2. 본문(Container) 추출
-                body_content = soup.find('div', class_='container')
-                if not body_content:
-                    body_content = soup.body
-                
-                if body_content:
-                    # newsletter-paper 클래스를 적용하여 스타일 통일
-                    # [Fix] f-string 들여쓰기 제거 (Markdown Code Block 인식 방지)
-                    final_html = f"""<style>{style_content}</style>
-<div class="newsletter-paper">
-{body_content.decode_contents()}
-</div>"""
-                    st.markdown(final_html, unsafe_allow_html=True)
-                else:
-                    st.error("뉴스레터 형식이 올바르지 않습니다.")
+        if latest_issue:
+            # [Perf] 발행 시 저장해 둔 style/body 조각을 그대로 표시 (요청마다 HTML 파싱 X)
+            final_html = newsletter_html(latest_issue['filename'])
+            if final_html:
+                st.markdown(final_html, unsafe_allow_html=True)
+            else:
+                st.error("뉴스레터 형식이 올바르지 않습니다.")
 
         else:
             st.info("👋 현재 발행된 뉴스레터가 없습니다. 스케줄러가 곧 첫 리포트를 배달합니다!")
 
     # 2) 아카이브 탭
     with tab_archive:
-        if 'selected_html' in st.session_state and st.session_state['selected_html']:
+        if st.session_state.get('selected_file_name'):
             # >>> 상세 보기 화면 <<<
             
             # [수정] 상단 컨트롤 바 (심플하게 뒤로가기만)
             if st.button("⬅️ 목록으로"):
-                del st.session_state['selected_html']
+                del st.session_state['selected_file_name']
                 st.rerun()
             
-            # 뉴스레터 본문
-            html_content = st.session_state['selected_html']
-            
-            # [Fix] HTML 파싱 및 렌더링
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            style_content = soup.style.string if soup.style else ""
-            body_content = soup.find('div', class_='container')
-            if not body_content: body_content = soup.body
-            
-            if body_content:
-                # [Fix] f-string 들여쓰기 제거
-                final_html = f"""<style>{style_content}</style>
-<div class="newsletter-paper">
-{body_content.decode_contents()}
-</div>"""
+            # 뉴스레터 본문 (발행 시 저장한 조각 사용)
+            final_html = newsletter_html(st.session_state['selected_file_name'])
+            if final_html:
                 st.markdown(final_html, unsafe_allow_html=True)
 
             st.divider()
             
             # [수정] 좋아요 버튼을 하단으로 이동
             current_file = st.session_state.get('selected_file_name', 'unknown')
-            like_count = analytics.get('likes', {}).get(current_file, 0)
+            like_count = analytics.like_count(current_file)
             
             st.divider()
             
             # [수정] 좋아요 버튼을 하단으로 이동
             current_file = st.session_state.get('selected_file_name', 'unknown')
-            like_count = analytics.get('likes', {}).get(current_file, 0)
+            like_count = analytics.like_count(current_file)
             
             # 하단 중앙 정렬
             c_left, c_center, c_right = st.columns([1, 2, 1])
@@ -436,137 +441,69 @@ else:
             
         else:
             # >>> 목록 화면 <<<
-            if not json_files:
+            total_cards = overview['cards']
+            search_query = st.text_input("🔍 지난 리포트 검색", placeholder="예: 휴머노이드, RAG, 마케팅 자동화",
+                                         key="archive_search").strip()
+            if search_query:
+                # >>> 검색 결과 (FTS5, bm25 순) <<<
+                started = time.perf_counter()
+                results = archive_search(search_query, archive_version)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                st.caption(f"'{search_query}' 검색 결과 {len(results)}건 ({elapsed_ms:.1f}ms)")
+                if not results:
+                    st.info("검색 결과가 없습니다. 다른 단어로 검색해보세요.")
+                for result in results:
+                    st.markdown(f"""<div class="search-result">
+<div class="archive-title" style="min-height: 0;">{card_title(result)}</div>
+<div style="color: #6b7280; font-size: 0.8rem; margin-bottom: 6px;">{result['date']} · {html.escape(result['keyword'] or '')}</div>
+<div class="archive-summ">{result['snippet']}</div>
+</div>""", unsafe_allow_html=True)
+                    if st.button("읽기 ➡️", key=f"search_read_{result['filename']}"):
+                        st.session_state['selected_file_name'] = result['filename']
+                        st.rerun()
+            elif not total_cards:
                 st.info("보관된 리포트가 없습니다.")
             else:
-                # [Fix] 정렬 (파일명 역순 = 날짜 최신순)
-                json_files = sorted(json_files, reverse=True)
-
-                # [Fix] 모던한 카드 디자인 & 이미지 폴백 CSS (Blue Theme)
-                st.markdown("""
-                <style>
-                .archive-card-container {
-                    height: 100%;
-                    min-height: 460px;
-                    display: flex;
-                    flex-direction: column;
-                    justify-content: space-between;
-                }
-                .archive-thumb-wrapper {
-                    position: relative;
-                    width: 100%;
-                    height: 200px;
-                    border-radius: 12px;
-                    overflow: hidden;
-                    /* 세련된 딥 블루 그라데이션 (기본 배경) */
-                    background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-                    margin-bottom: 12px;
-                }
-                .archive-thumb-placeholder-text {
-                    position: absolute;
-                    color: rgba(255,255,255,0.8);
-                    font-weight: 700;
-                    font-size: 1.2rem;
-                    letter-spacing: 1px;
-                    z-index: 1;
-                }
-                .archive-thumb {
-                    position: relative;
-                    width: 100%;
-                    height: 100%;
-                    object-fit: cover;
-                    z-index: 2;
-                    transition: opacity 0.3s ease;
-                }
-                .archive-title {
-                    font-size: 1.15rem;
-                    font-weight: 800;
-                    margin-bottom: 8px;
-                    line-height: 1.4;
-                    min-height: 2.8em;
-                    color: #1f2937;
-                }
-                .archive-summ {
-                    font-size: 0.9rem; 
-                    color: #4b5563; 
-                    margin-bottom: 15px; 
-                    line-height: 1.6;
-                }
-                div[data-testid="stVerticalBlockBorderWrapper"] > div {
-                    height: 100%;
-                }
-                </style>
-                """, unsafe_allow_html=True)
+                # [Perf] 페이지 단위 조회 (파일명 역순 = 날짜 최신순)
+                page_count = (total_cards + ARCHIVE_PAGE_SIZE - 1) // ARCHIVE_PAGE_SIZE
+                page = min(st.session_state.get('archive_page', 0), page_count - 1)
+                page_issues = archive_page(page, archive_version)
 
                 # [Fix] Grid System
                 def chunked(iterable, n):
                     return [iterable[i:i + n] for i in range(0, len(iterable), n)]
 
-                rows = chunked(json_files, 3)
+                rows = chunked(page_issues, 3)
                 
-                for row_files in rows:
+                for row_issues in rows:
                     cols = st.columns(3)
-                    for i, jpath in enumerate(row_files):
-                        with open(jpath, 'r', encoding='utf-8') as f:
-                            try:
-                                meta = json.load(f)
-                            except:
-                                continue
-                        
-                        # [Fix] 제목 정제
-                        title = meta.get('title', '제목 없음')
-                        for remove_str in ["유니콘 시그널:", "유니콘 시그널", "Unicorn Signal:", "Unicorn Signal", "🦄"]:
-                            title = title.replace(remove_str, "")
-                        title = title.strip()
-                        if title.startswith(":"): title = title[1:].strip()
-                        
-                        # [Fix] 썸네일 URL 검증
-                        thumb = meta.get('thumbnail')
-                        # URL이 너무 짧거나(10자 이하) http가 없으면 아예 빈 문자열로 처리하여 바로 폴백이 보이게 함
-                        if not thumb or not isinstance(thumb, str) or len(thumb) < 10 or not thumb.startswith("http"):
-                           thumb = "" 
-                        
-                        # [Fix] 요약문 정제 (불렛포인트 변환)
-                        summary = meta.get('summary', '')
-                        summary = summary.replace("🚀 3줄 요약: 왜 이걸 봐야 할까요?", "").replace("3줄 요약:", "").replace("왜 이걸 봐야 할까요?", "").strip()
-                        
-                        if "- " not in summary:
-                            sentences = summary.replace("?", "?|").replace(".", ".|").split("|")
-                            clean_sentences = [s.strip() for s in sentences if len(s.strip()) > 10]
-                            summary = "<br>".join([f"• {s}" for s in clean_sentences[:3]])
-                        else:
-                            summary = summary.replace("\n", "<br>")
-
-                        # HTML 렌더링 (이미지 로드 실패 시 투명화 -> 배경 그라데이션 노출)
-                        cols[i].markdown(f"""
-                        <div class="archive-card-container">
-                            <div class="archive-thumb-wrapper">
-                                <div class="archive-thumb-placeholder-text">Unicorn Signal</div>
-                                <img src="{thumb}" class="archive-thumb" 
-                                     onerror="this.style.opacity='0';" 
-                                     onload="this.style.opacity='1';">
-                            </div>
-                            <div>
-                                <div class="archive-title">{title}</div>
-                                <div style="color: #6b7280; font-size: 0.8rem; margin-bottom: 8px;">{meta.get('date', '')}</div>
-                                <div class="archive-summ">
-                                    {summary}
-                                </div>
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
+                    for i, meta in enumerate(row_issues):
+                        # [Perf] 카드 HTML은 발행호별로 캐시 (메타데이터가 바뀌면 updated_at이 달라져 새로 생성)
+                        cols[i].markdown(cached_card_html(meta['filename'], meta['updated_at'], meta), unsafe_allow_html=True)
                         
                         with cols[i]:
-                             unique_key = f"read_{os.path.basename(jpath)}"
+                             unique_key = f"read_{meta['filename']}"
                              if st.button("읽기 ➡️", key=unique_key):
-                                target_html = jpath.replace('.json', '.html')
+                                target_html = os.path.join(ARCHIVE_DIR, meta['filename'])
                                 if os.path.exists(target_html):
-                                    with open(target_html, 'r', encoding='utf-8') as hf:
-                                        content = hf.read()
-                                    st.session_state['selected_html'] = content
-                                    st.session_state['selected_file_name'] = os.path.basename(target_html)
+                                    st.session_state['selected_file_name'] = meta['filename']
                                     st.rerun()
+
+                # 페이지 이동 (한 화면에 ARCHIVE_PAGE_SIZE장만 렌더링)
+                if page_count > 1:
+                    c_prev, c_info, c_next = st.columns([1, 2, 1])
+                    with c_prev:
+                        if page > 0 and st.button("⬅️ 이전", key="archive_prev"):
+                            st.session_state['archive_page'] = page - 1
+                            st.rerun()
+                    with c_info:
+                        selected = st.selectbox("페이지", range(page_count), index=page,
+                                                format_func=lambda p: f"{p + 1} / {page_count}",
+                                                key=f"archive_page_select_{page}", label_visibility="collapsed")
+                        if selected != page:
+                            st.session_state['archive_page'] = selected
+                            st.rerun()
+                    with c_next:
+                        if page < page_count - 1 and st.button("다음 ➡️", key="archive_next"):
+                            st.session_state['archive_page'] = page + 1
+                            st.rerun()
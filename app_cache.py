@@ -0,0 +1,94 @@
+import os
+import threading
+import functools
+from collections import Counter
+import streamlit as st
+
+
+class CacheStats:
+    """
+    캐시별 호출/미스 횟수 (프로세스 전체, 모든 세션 합계). 히트 = 호출 - 미스.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = Counter()
+        self.misses = Counter()
+
+    def record_call(self, name):
+        with self._lock:
+            self.calls[name] += 1
+
+    def record_miss(self, name):
+        with self._lock:
+            self.misses[name] += 1
+
+    def snapshot(self):
+        """
+        관리자 화면용 [{cache, calls, hits, misses, hit_rate}]
+        """
+        with self._lock:
+            rows = []
+            for name in sorted(self.calls):
+                calls, misses = self.calls[name], self.misses[name]
+                hits = max(calls - misses, 0)
+                rows.append({'cache': name, 'calls': calls, 'hits': hits, 'misses': misses,
+                             'hit_rate': hits / calls if calls else 0.0})
+            return rows
+
+    def reset(self):
+        with self._lock:
+            self.calls.clear()
+            self.misses.clear()
+
+
+STATS = CacheStats()
+
+
+def _tracked(cache_decorator, name, **cache_kwargs):
+    """
+    st.cache_data / st.cache_resource에 히트율 집계를 붙입니다.
+    캐시된 함수 본문은 미스일 때만 실행되므로 본문에서 미스를, 바깥 래퍼에서 호출을 셉니다.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def on_miss(*args, **kwargs):
+            STATS.record_miss(name)
+            return func(*args, **kwargs)
+
+        cached = cache_decorator(**cache_kwargs)(on_miss)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            STATS.record_call(name)
+            return cached(*args, **kwargs)
+
+        wrapper.clear = cached.clear
+        return wrapper
+    return decorator
+
+
+def tracked_cache_data(name, **cache_kwargs):
+    return _tracked(st.cache_data, name, **cache_kwargs)
+
+
+def tracked_cache_resource(name, **cache_kwargs):
+    return _tracked(st.cache_resource, name, **cache_kwargs)
+
+
+def file_mtime(path):
+    """
+    캐시 키용 파일 수정 시각 (파일이 바뀌면 키가 바뀌어 다시 읽음). 파일이 없으면 0.
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+@tracked_cache_data("asset", max_entries=32, show_spinner=False)
+def load_asset(path, mtime):
+    """
+    로고 등 정적 파일의 바이트 (mtime이 키에 포함).
+    """
+    with open(path, 'rb') as f:
+        return f.read()
@@ -0,0 +1,124 @@
+import html
+
+# [Fix] 모던한 카드 디자인 & 이미지 폴백 CSS (Blue Theme) - 페이지 전체 CSS에 한 번만 포함
+ARCHIVE_CARD_CSS = """
+    .archive-card-container {
+        height: 100%;
+        min-height: 460px;
+        display: flex;
+        flex-direction: column;
+        justify-content: space-between;
+    }
+    .archive-thumb-wrapper {
+        position: relative;
+        width: 100%;
+        height: 200px;
+        border-radius: 12px;
+        overflow: hidden;
+        /* 세련된 딥 블루 그라데이션 (기본 배경) */
+        background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        margin-bottom: 12px;
+    }
+    .archive-thumb-placeholder-text {
+        position: absolute;
+        color: rgba(255,255,255,0.8);
+        font-weight: 700;
+        font-size: 1.2rem;
+        letter-spacing: 1px;
+        z-index: 1;
+    }
+    .archive-thumb {
+        position: relative;
+        width: 100%;
+        height: 100%;
+        object-fit: cover;
+        z-index: 2;
+        transition: opacity 0.3s ease;
+    }
+    .archive-title {
+        font-size: 1.15rem;
+        font-weight: 800;
+        margin-bottom: 8px;
+        line-height: 1.4;
+        min-height: 2.8em;
+        color: #1f2937;
+    }
+    .archive-summ {
+        font-size: 0.9rem;
+        color: #4b5563;
+        margin-bottom: 15px;
+        line-height: 1.6;
+    }
+    .search-result {
+        border-bottom: 1px solid #e5e7eb;
+        padding: 12px 0 4px;
+    }
+    .search-result mark {
+        background: #ede9fe;
+        color: #5b21b6;
+        padding: 0 2px;
+        border-radius: 3px;
+    }
+    div[data-testid="stVerticalBlockBorderWrapper"] > div {
+        height: 100%;
+    }
+"""
+
+
+def card_title(meta):
+    # [Fix] 제목 정제
+    title = meta.get('title') or '제목 없음'
+    for remove_str in ["유니콘 시그널:", "유니콘 시그널", "Unicorn Signal:", "Unicorn Signal", "🦄"]:
+        title = title.replace(remove_str, "")
+    title = title.strip()
+    if title.startswith(":"): title = title[1:].strip()
+    return title
+
+
+def card_thumbnail(meta):
+    # [Fix] 썸네일 URL 검증
+    thumb = meta.get('thumbnail')
+    # URL이 너무 짧거나(10자 이하) http가 없으면 아예 빈 문자열로 처리하여 바로 폴백이 보이게 함
+    if not thumb or not isinstance(thumb, str) or len(thumb) < 10 or not thumb.startswith("http"):
+        return ""
+    return html.escape(thumb, quote=True)
+
+
+def card_summary(meta):
+    # [Fix] 요약문 정제 (불렛포인트 변환)
+    summary = meta.get('summary') or ''
+    summary = summary.replace("🚀 3줄 요약: 왜 이걸 봐야 할까요?", "").replace("3줄 요약:", "").replace("왜 이걸 봐야 할까요?", "").strip()
+
+    if "- " not in summary:
+        sentences = summary.replace("?", "?|").replace(".", ".|").split("|")
+        clean_sentences = [s.strip() for s in sentences if len(s.strip()) > 10]
+        return "<br>".join([f"• {s}" for s in clean_sentences[:3]])
+    return summary.replace("\n", "<br>")
+
+
+def render_card(meta):
+    """
+    아카이브 카드 1장의 HTML (이미지 로드 실패 시 투명화 -> 배경 그라데이션 노출).
+    발행호 메타데이터만으로 결정되므로 app.py에서 발행호별로 캐시합니다.
+    """
+    return f"""
+<div class="archive-card-container">
+    <div class="archive-thumb-wrapper">
+        <div class="archive-thumb-placeholder-text">Unicorn Signal</div>
+        <img src="{card_thumbnail(meta)}" class="archive-thumb"
+             onerror="this.style.opacity='0';"
+             onload="this.style.opacity='1';">
+    </div>
+    <div>
+        <div class="archive-title">{card_title(meta)}</div>
+        <div style="color: #6b7280; font-size: 0.8rem; margin-bottom: 8px;">{meta.get('date', '')}</div>
+        <div class="archive-summ">
+            {card_summary(meta)}
+        </div>
+    </div>
+</div>
+"""
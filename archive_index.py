@@ -0,0 +1,255 @@
+import os
+import re
+import html
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from storage import CACHE_DIR
+from fragments import load_fragments, plain_text
+
+ARCHIVE_DIR = "archives"
+# archives/ 밖에 두어야 SQLite 저널 파일이 폴더 수정 시각(변경 감지용)을 건드리지 않음
+ARCHIVE_INDEX_FILE = os.path.join(CACHE_DIR, "archive_index.db")
+ARCHIVE_PAGE_SIZE = 12
+SEARCH_LIMIT = 20
+# 검색 가중치 (bm25): 제목 > 주제 키워드 > 본문
+SEARCH_WEIGHTS = (10.0, 5.0, 1.0)
+
+
+class ArchiveIndex:
+    """
+    발행된 뉴스레터 목록(메타데이터)을 SQLite 한 파일에 모아둔 인덱스입니다.
+    main.py가 발행할 때 upsert하고, app.py는 JSON 파일을 매번 읽지 않고 이 인덱스만 페이지 단위로 조회합니다.
+    archives/ 폴더가 바깥에서 바뀌면(git pull 등) 다음 조회 때 한 번 다시 스캔합니다.
+    제목/주제/본문 전문 검색용 FTS5 색인(issues_fts)도 같은 파일에 함께 유지합니다.
+    """
+    def __init__(self, path=ARCHIVE_INDEX_FILE, archive_dir=ARCHIVE_DIR):
+        self.path = path
+        self.archive_dir = archive_dir
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS issues (
+                filename TEXT PRIMARY KEY,      -- 2026-02-05_Generative_AI.html (이름순 = 날짜순)
+                date TEXT,
+                keyword TEXT,
+                title TEXT,
+                summary TEXT,
+                thumbnail TEXT,
+                has_meta INTEGER DEFAULT 0,     -- JSON 메타데이터가 있는 발행호만 아카이브 카드로 표시
+                updated_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS index_state (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+        if not self._conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'issues_fts'").fetchone():
+            # 공백/문장부호 기준 토큰 + 접두어 색인 ("로봇"* -> 로봇이/로봇의 ...)
+            self._conn.execute("""
+                CREATE VIRTUAL TABLE issues_fts USING fts5(
+                    filename UNINDEXED, title, keyword, body,
+                    tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+                )
+            """)
+            # 검색 색인이 없던 예전 인덱스 -> 다음 ensure_fresh()에서 재색인
+            self._conn.execute("DELETE FROM index_state WHERE key = 'archive_mtime'")
+        self._conn.commit()
+
+    # ---------------------------------------------------------------
+    # 쓰기
+    # ---------------------------------------------------------------
+    def upsert(self, metadata, has_meta=True, text=None):
+        """
+        발행호 1개의 메타데이터(main.py가 JSON으로 저장하는 것과 같은 dict)를 추가/갱신합니다.
+        text: 검색용 본문 텍스트 (없으면 저장된 본문 조각에서 추출)
+        """
+        if text is None:
+            text = self._body_text(metadata['filename'])
+        with self._lock:
+            self._upsert(metadata, has_meta, text)
+            self._bump_version()
+            self._conn.commit()
+
+    def _body_text(self, filename):
+        fragments = load_fragments(filename, self.archive_dir, os.path.join(self.archive_dir, "fragments"))
+        return plain_text(fragments.get('body')) if fragments else ""
+
+    def _upsert(self, metadata, has_meta, text=""):
+        self._conn.execute(
+            """
+            INSERT INTO issues (filename, date, keyword, title, summary, thumbnail, has_meta, updated_at)
+            VALUES (:filename, :date, :keyword, :title, :summary, :thumbnail, :has_meta, :updated_at)
+            ON CONFLICT(filename) DO UPDATE SET
+                date = excluded.date, keyword = excluded.keyword, title = excluded.title,
+                summary = excluded.summary, thumbnail = excluded.thumbnail,
+                has_meta = excluded.has_meta, updated_at = excluded.updated_at
+            """,
+            {
+                'filename': metadata['filename'],
+                'date': metadata.get('date', ''),
+                'keyword': metadata.get('keyword', ''),
+                'title': metadata.get('title', ''),
+                'summary': metadata.get('summary', ''),
+                'thumbnail': metadata.get('thumbnail'),
+                'has_meta': 1 if has_meta else 0,
+                'updated_at': datetime.now().isoformat(timespec='seconds'),
+            },
+        )
+        self._conn.execute("DELETE FROM issues_fts WHERE filename = ?", (metadata['filename'],))
+        self._conn.execute(
+            "INSERT INTO issues_fts (filename, title, keyword, body) VALUES (?, ?, ?, ?)",
+            (metadata['filename'], metadata.get('title', ''), metadata.get('keyword', ''), text or ""),
+        )
+
+    def rebuild(self):
+        """
+        archives/ 폴더를 스캔해 인덱스를 다시 만듭니다 (기존 발행호 백필 / 외부 변경 반영).
+        """
+        if not os.path.isdir(self.archive_dir):
+            return 0
+        names = set(os.listdir(self.archive_dir))
+        # 본문 텍스트는 잠금 밖에서 미리 추출 (조각 파일 읽기)
+        texts = {name: self._body_text(name) for name in names if name.endswith(".html")}
+        with self._lock:
+            self._conn.execute("DELETE FROM issues")
+            self._conn.execute("DELETE FROM issues_fts")
+            for name in sorted(texts):
+                json_name = name[:-len(".html")] + ".json"
+                metadata = None
+                if json_name in names:
+                    try:
+                        with open(os.path.join(self.archive_dir, json_name), 'r', encoding='utf-8') as f:
+                            metadata = json.load(f)
+                    except (json.JSONDecodeError, ValueError, OSError):
+                        metadata = None
+                if metadata:
+                    metadata['filename'] = name
+                    self._upsert(metadata, True, texts[name])
+                else:
+                    # JSON이 없는 예전 발행호: 파일명에서 날짜/주제만 추출
+                    date, _, topic = name[:-len(".html")].partition('_')
+                    self._upsert({'filename': name, 'date': date, 'keyword': topic.replace('_', ' ')}, False, texts[name])
+            self._set_state('archive_mtime', str(os.stat(self.archive_dir).st_mtime_ns))
+            self._bump_version()
+            self._conn.commit()
+            return self._conn.execute("SELECT COUNT(*) FROM issues").fetchone()[0]
+
+    def _set_state(self, key, value):
+        self._conn.execute("INSERT OR REPLACE INTO index_state (key, value) VALUES (?, ?)", (key, value))
+
+    def _bump_version(self):
+        self._conn.execute(
+            "INSERT INTO index_state (key, value) VALUES ('version', '1') "
+            "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+        )
+
+    def version(self):
+        """
+        인덱스 내용이 바뀔 때마다(upsert/rebuild) 증가하는 값. 다른 프로세스(main.py)의 변경도 반영됩니다.
+        app.py는 이 값을 조회 결과 캐시의 키로 씁니다.
+        """
+        with self._lock:
+            return self._get_state('version') or '0'
+
+    def _get_state(self, key):
+        row = self._conn.execute("SELECT value FROM index_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def ensure_fresh(self):
+        """
+        archives/ 폴더의 수정 시각만 확인하고(상수 시간), 바뀌었을 때만 다시 스캔합니다.
+        """
+        if not os.path.isdir(self.archive_dir):
+            return
+        current = str(os.stat(self.archive_dir).st_mtime_ns)
+        with self._lock:
+            stored = self._get_state('archive_mtime')
+        if stored != current:
+            self.rebuild()
+
+    def mark_fresh(self):
+        """
+        main.py가 직접 파일을 쓰고 upsert한 뒤 호출 -> 불필요한 재스캔 방지.
+        (그 전에 ensure_fresh()로 바깥 변경을 먼저 반영해야 함)
+        """
+        if not os.path.isdir(self.archive_dir):
+            return
+        with self._lock:
+            self._set_state('archive_mtime', str(os.stat(self.archive_dir).st_mtime_ns))
+            self._conn.commit()
+
+    # ---------------------------------------------------------------
+    # 읽기
+    # ---------------------------------------------------------------
+    def count(self, with_meta_only=False):
+        query = "SELECT COUNT(*) FROM issues" + (" WHERE has_meta = 1" if with_meta_only else "")
+        with self._lock:
+            return self._conn.execute(query).fetchone()[0]
+
+    def latest(self):
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM issues ORDER BY filename DESC LIMIT 1").fetchone()
+        return dict(row) if row else None
+
+    def page(self, page=0, per_page=ARCHIVE_PAGE_SIZE):
+        """
+        최신순 page번째 페이지 (메타데이터가 있는 발행호만).
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM issues WHERE has_meta = 1 ORDER BY filename DESC LIMIT ? OFFSET ?",
+                (per_page, page * per_page),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def search(self, query, limit=SEARCH_LIMIT):
+        """
+        전문 검색. 입력한 단어가 모두 들어간 발행호를 bm25 점수순으로 반환합니다.
+        각 단어는 접두어로 검색하고 (예: "로봇" -> 로봇이, 로봇의), 결과에는 <mark>로 강조한 snippet이 붙습니다.
+        """
+        match = _match_expression(query)
+        if not match:
+            return []
+        with self._lock:
+            # FTS5 내장 rank 정렬 + LIMIT: 상위 limit개에만 snippet을 계산 (일치 문서가 많아도 빠름)
+            rows = self._conn.execute(
+                """
+                SELECT i.*, f.snippet FROM (
+                    SELECT filename, rank, snippet(issues_fts, -1, char(2), char(3), '…', 16) AS snippet
+                    FROM issues_fts
+                    WHERE issues_fts MATCH ? AND rank MATCH ?
+                    ORDER BY rank
+                    LIMIT ?
+                ) f JOIN issues i ON i.filename = f.filename
+                ORDER BY f.rank
+                """,
+                (match, f"bm25(0, {', '.join(map(str, SEARCH_WEIGHTS))})", limit),
+            ).fetchall()
+        results = []
+        for row in rows:
+            result = dict(row)
+            # 본문 텍스트는 HTML로 그대로 넣지 않고 이스케이프한 뒤 강조 표시만 태그로 변환
+            result['snippet'] = html.escape(result['snippet'] or "").replace("\x02", "<mark>").replace("\x03", "</mark>")
+            results.append(result)
+        return results
+
+    def close(self):
+        self._conn.close()
+
+
+def _match_expression(query):
+    """
+    사용자 입력 -> FTS5 MATCH 식. 단어마다 따옴표로 감싸 연산자/특수문자를 무력화하고 접두어(*) 검색.
+    """
+    terms = re.findall(r"\w+", query or "")
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+if __name__ == "__main__":
+    # 수동 재색인: python archive_index.py
+    count = ArchiveIndex().rebuild()
+    print(f"[ARCHIVE] Indexed {count} issues into {ARCHIVE_INDEX_FILE}")
@@ -0,0 +1,172 @@
+"""
+배치 모드: 여러 주제의 뉴스레터를 한 프로세스에서 한꺼번에 만듭니다.
+
+    python batch.py                      # config.KEYWORD_POOL 전체
+    python batch.py "SaaS Pricing Trends" "Cybersecurity AI"
+
+1) 모든 주제가 쓰는 피드의 합집합을 한 번만 내려받아 파싱 (EntryStore)
+2) 주제별 키워드 매처로 엔트리를 골라 랭킹 -> 요약 -> 아카이브 저장
+3) LLM 단계(키워드 확장/요약)는 주제끼리 동시에, 최대 BATCH_LLM_CONCURRENCY개까지
+
+이메일은 보내지 않습니다 (구독자 발송은 scheduler.py의 하루 1회 발행호만).
+"""
+import sys
+import asyncio
+from datetime import datetime, timedelta
+from config import KEYWORD_POOL, BATCH_LLM_CONCURRENCY
+from scrapers.news import fetch_feeds, filter_entries, FETCH_WORKERS, PER_HOST_LIMIT, FEED_TIMEOUT
+from scrapers.feed_cache import FeedCache
+from scrapers.seen_store import SeenEntries
+from scrapers.keyword_matcher import KeywordMatcher
+from scrapers.youtube import fetch_youtube_videos
+from scrapers.transcript_cache import TranscriptCache
+from ai_agent import expand_keywords, summarize_content
+from ranking import select_top_items
+from dedup import dedup_items, StoryHistory
+from archive_index import ArchiveIndex
+from main import select_feeds, publish_issue
+from timing import StageTimer
+
+
+class EntryStore:
+    """
+    배치 1회분의 파싱된 피드 엔트리 (피드 URL -> fetch_feeds 결과).
+    주제마다 route()로 자기 피드 목록과 키워드 매처에 맞는 뉴스만 골라 갑니다 (다시 내려받지 않음).
+    """
+    def __init__(self, feed_results):
+        self._feeds = {feed['url']: feed for feed in feed_results}
+
+    @classmethod
+    def collect(cls, feeds, max_workers=FETCH_WORKERS, per_host=PER_HOST_LIMIT, timeout=FEED_TIMEOUT, cache=None,
+                days_limit=7):
+        unique_feeds = list(dict.fromkeys(feeds))
+        print(f"[BATCH] Scraping {len(unique_feeds)} feeds once for all topics")
+        date_cutoff = datetime.now() - timedelta(days=days_limit)
+        results = fetch_feeds(unique_feeds, max_workers=max_workers, per_host=per_host, timeout=timeout, cache=cache,
+                              date_cutoff=date_cutoff)
+        for feed in results:
+            if feed['error'] is not None:
+                print(f"[ERROR] Error parsing {feed['url']}: {feed['error']}")
+        return cls(results)
+
+    def __len__(self):
+        return sum(len(feed['entries']) for feed in self._feeds.values())
+
+    def route(self, feeds, keywords, days_limit=7, seen=None, scope=""):
+        """
+        feeds 중 수집된 피드에서 키워드에 맞는 최신 뉴스 (fetch_rss_news와 같은 형식/순서).
+        seen(SeenEntries)을 넘기면 같은 주제(scope)의 이전 실행에서 처리한 엔트리는 제외합니다.
+        """
+        matcher = keywords if isinstance(keywords, KeywordMatcher) else KeywordMatcher(keywords)
+        date_cutoff = datetime.now() - timedelta(days=days_limit)
+        results = [self._feeds[url] for url in feeds if url in self._feeds]
+        if seen is not None:
+            results = seen.exclude_seen(results, scope)
+        return filter_entries(results, matcher, date_cutoff)
+
+
+async def generate_topic(topic, store, llm_slots, archive_index, llm=None, transcript_cache=None, seen=None,
+                         story_history=None, with_videos=True):
+    """
+    주제 1개: 키워드 확장 -> 엔트리 라우팅(+유튜브) -> 랭킹 -> 요약 -> 아카이브 저장.
+    llm_slots(asyncio.Semaphore)를 잡은 동안에만 LLM을 호출합니다.
+    반환값: 메타데이터 dict / 수집된 콘텐츠가 없으면 None
+    """
+    timer = StageTimer()
+
+    async with llm_slots:
+        with timer.stage("expand_keywords"):
+            expanded_keywords = await asyncio.to_thread(expand_keywords, topic, llm)
+    # 확장 실패 시 원본 문자열이 돌아옴
+    if isinstance(expanded_keywords, str):
+        expanded_keywords = [expanded_keywords]
+    print(f"[EXPAND] {topic}: {expanded_keywords}")
+
+    with timer.stage("collect:news"):
+        news_items = await asyncio.to_thread(store.route, select_feeds(topic), expanded_keywords, seen=seen, scope=topic)
+    video_items = []
+    if with_videos:
+        with timer.stage("collect:youtube"):
+            video_items = await asyncio.to_thread(fetch_youtube_videos, expanded_keywords, cache=transcript_cache)
+
+    print(f"[BATCH] {topic}: {len(news_items)} news + {len(video_items)} videos")
+    with timer.stage("dedup"):
+        all_content = await asyncio.to_thread(dedup_items, news_items + video_items, story_history, topic)
+    if not all_content:
+        print(f"[FAIL] {topic}: No content found.")
+        return None
+
+    with timer.stage("rank"):
+        ranked_content = select_top_items(all_content, expanded_keywords)
+
+    async with llm_slots:
+        with timer.stage("summarize"):
+            ai_title, newsletter_body = await asyncio.to_thread(summarize_content, ranked_content, llm)
+
+    metadata = await publish_issue(topic, expanded_keywords, ai_title, newsletter_body, news_items, video_items,
+                                   timer, archive_index=archive_index, archive_dir=archive_index.archive_dir)
+    if story_history is not None:
+        # 발행된 주제의 실린 항목만 기록 (실패한 주제/랭킹에서 빠진 기사는 기록하지 않음)
+        story_history.stage_items(ranked_content, topic)
+    print(f"[BATCH] {topic}: done in {timer.total():.2f}s -> {metadata['filename']}")
+    return metadata
+
+
+async def run_batch(topics=None, concurrency=BATCH_LLM_CONCURRENCY, llm=None, archive_index=None,
+                    feed_cache=None, transcript_cache=None, seen=None, story_history=None, with_videos=True,
+                    **fetch_kwargs):
+    """
+    topics 전체를 생성합니다. 한 주제가 실패해도 나머지는 계속 진행합니다.
+    seen(SeenEntries)을 넘기면 주제별로 새 엔트리만 다루고, 끝나면 발행된 주제의 엔트리만 처리 완료로 기록합니다.
+    story_history(StoryHistory)도 같은 방식 (주제별로 이전 발행호에서 다룬 이야기 제외, 끝나면 발행된 주제에 실린 기사 기록).
+    반환값: {topic: 메타데이터 dict / None(콘텐츠 없음) / Exception(실패)}
+    """
+    topics = list(dict.fromkeys(topics or KEYWORD_POOL))
+    timer = StageTimer()
+    print(f"[BATCH] Generating {len(topics)} newsletters (LLM concurrency {concurrency})")
+
+    feeds = [feed for topic in topics for feed in select_feeds(topic)]
+    with timer.stage("collect:feeds"):
+        store = await asyncio.to_thread(EntryStore.collect, feeds, cache=feed_cache, **fetch_kwargs)
+    print(f"[BATCH] {len(store)} entries in shared store")
+
+    own_index = archive_index is None
+    if own_index:
+        archive_index = ArchiveIndex()
+    # 인덱스 최신화는 배치 시작 시 한 번만 (주제별 파일 쓰기로 재구축이 반복되지 않게)
+    archive_index.ensure_fresh()
+
+    llm_slots = asyncio.Semaphore(concurrency)
+    with timer.stage("generate"):
+        results = await asyncio.gather(
+            *(generate_topic(topic, store, llm_slots, archive_index, llm=llm,
+                             transcript_cache=transcript_cache, seen=seen, story_history=story_history,
+                             with_videos=with_videos) for topic in topics),
+            return_exceptions=True,
+        )
+
+    archive_index.mark_fresh()
+    if own_index:
+        archive_index.close()
+
+    outcome = dict(zip(topics, results))
+    for topic, result in outcome.items():
+        if isinstance(result, Exception):
+            print(f"[ERROR] {topic}: {result}")
+        if not isinstance(result, dict) and seen is not None:
+            # 발행하지 못한 주제는 다음 실행에서 같은 엔트리를 다시 처리
+            seen.discard(topic)
+    published = sum(1 for result in outcome.values() if isinstance(result, dict))
+    if published:
+        if seen is not None:
+            seen.commit()
+        if story_history is not None:
+            story_history.commit()
+    print(f"[BATCH] Published {published}/{len(topics)} newsletters")
+    timer.report("[BATCH]")
+    return outcome
+
+
+if __name__ == "__main__":
+    asyncio.run(run_batch(sys.argv[1:] or None, feed_cache=FeedCache(), transcript_cache=TranscriptCache(),
+                          seen=SeenEntries(), story_history=StoryHistory()))
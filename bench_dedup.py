@@ -0,0 +1,130 @@
+"""
+유사 기사 묶기 벤치마크: 합성 기사(같은 이야기를 여러 매체가 조금씩 바꿔 쓴 묶음 + 단독 기사)에 대해
+모든 쌍을 비교하는 방식과 MinHash + LSH(dedup_items)를 비교하고, 정답 묶음 대비 정확도를 확인합니다.
+
+    python bench_dedup.py [기사 수]
+"""
+import sys
+import time
+import random
+
+from dedup import dedup_items, shingles, signature, cluster_signatures
+
+WORDS = (
+    "startup funding round market growth platform launch users revenue cloud data "
+    "model chip robot policy enterprise developer tool security app device battery "
+    "network privacy investor valuation acquisition partnership pricing subscription "
+    "agent open source benchmark regulation europe china chips training inference gpu "
+    "payments bank crypto token wallet exchange health hospital drug climate carbon solar"
+).split()
+# 실제 기사처럼 자주 쓰는 단어(불용어 등)와 드문 단어가 섞이도록 Zipf 분포 어휘
+VOCAB = ["the", "a", "of", "to", "and", "in", "for", "on", "with", "is"] + WORDS + [f"term{i}" for i in range(20_000)]
+WEIGHTS = [1 / (rank + 1) for rank in range(len(VOCAB))]
+
+
+def sample_words(rng, count):
+    return rng.choices(VOCAB, WEIGHTS, k=count)
+
+
+def rewrite(words, rng, edits=3):
+    # 다른 매체의 같은 기사 흉내: 단어 몇 개를 바꾸거나 빼거나 더함
+    words = list(words)
+    for _ in range(edits):
+        op = rng.random()
+        pos = rng.randrange(len(words))
+        if op < 0.4:
+            words[pos] = sample_words(rng, 1)[0]
+        elif op < 0.7 and len(words) > 5:
+            del words[pos]
+        else:
+            words.insert(pos, sample_words(rng, 1)[0])
+    return words
+
+
+def make_corpus(size, dup_ratio=0.4, max_copies=4, seed=42):
+    """
+    반환값: (items, 정답 이야기 번호 리스트)
+    """
+    rng = random.Random(seed)
+    items, labels = [], []
+    story = 0
+    while len(items) < size:
+        title = sample_words(rng, 10)
+        summary = sample_words(rng, 30)
+        copies = rng.randint(2, max_copies) if rng.random() < dup_ratio else 1
+        for c in range(copies):
+            if len(items) >= size:
+                break
+            t = title if c == 0 else rewrite(title, rng, 1)
+            s = summary if c == 0 else rewrite(summary, rng, 3)
+            items.append({'title': " ".join(t), 'summary': " ".join(s), 'link': f"https://example.com/{story}/{c}",
+                          'source': f"Feed {c}"})
+            labels.append(story)
+        story += 1
+    rng.shuffle(order := list(range(len(items))))
+    return [items[i] for i in order], [labels[i] for i in order]
+
+
+def pairwise_clusters(items, threshold=0.5):
+    # 기존 방식의 확장판: 모든 쌍의 정확한 자카드 유사도 (O(n^2))
+    sets = [shingles(item) for item in items]
+    parent = list(range(len(items)))
+
+    def find(i):
+        while parent[i] != i:
+            i = parent[i]
+        return i
+
+    for i in range(len(sets)):
+        for j in range(i):
+            if len(sets[i] & sets[j]) / len(sets[i] | sets[j]) >= threshold:
+                parent[find(i)] = find(j)
+    return len({find(i) for i in range(len(items))})
+
+
+def pair_scores(clusters, labels):
+    # 같은 묶음으로 판정한 쌍 기준 정밀도/재현율
+    predicted = {i: c for c, members in enumerate(clusters) for i in members}
+    tp = fp = fn = 0
+    n = len(labels)
+    by_label = {}
+    for i, label in enumerate(labels):
+        by_label.setdefault(label, []).append(i)
+    for members in by_label.values():
+        for a in range(len(members)):
+            for b in range(a):
+                if predicted[members[a]] == predicted[members[b]]:
+                    tp += 1
+                else:
+                    fn += 1
+    for members in clusters:
+        for a in range(len(members)):
+            for b in range(a):
+                if labels[members[a]] != labels[members[b]]:
+                    fp += 1
+    return tp / max(tp + fp, 1), tp / max(tp + fn, 1), n
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    sizes = [int(sys.argv[1])] if len(sys.argv) > 1 else [1_000, 10_000, 50_000]
+    for size in sizes:
+        items, labels = make_corpus(size)
+        stories = len(set(labels))
+
+        dedup_time, selected = timed(dedup_items, items)
+        signatures = [signature(shingles(item)) for item in items]
+        clusters = cluster_signatures(signatures)
+        precision, recall, _ = pair_scores(clusters, labels)
+
+        line = (f"[BENCH] {size:>6,} items ({stories:,} stories) | minhash+lsh {dedup_time:.2f}s -> {len(selected):,} "
+                f"| pair precision {precision:.3f} recall {recall:.3f}")
+        if size <= 2_000:
+            pairwise_time, pairwise_count = timed(pairwise_clusters, items)
+            line += f" | pairwise {pairwise_time:.2f}s -> {pairwise_count:,} ({pairwise_time / dedup_time:.0f}x)"
+        print(line)
@@ -0,0 +1,76 @@
+"""
+키워드 필터 마이크로벤치마크: 합성 엔트리 10만 건에 대해
+기존 방식(any(k.lower() in text.lower()))과 KeywordMatcher를 비교합니다.
+
+    python bench_keyword_matcher.py [엔트리 수] [키워드 수]
+"""
+import sys
+import time
+import random
+
+from scrapers.keyword_matcher import KeywordMatcher
+
+BASE_KEYWORDS = [
+    "Generative AI", "LLM Applications", "NVIDIA H100", "AI Regulation", "OpenAI",
+    "AI Agents", "Foundation Models", "Vector Database", "RAG Pipelines", "AI Chips",
+]
+WORDS = (
+    "startup funding round market growth platform launch users revenue cloud data "
+    "model chip robot policy enterprise developer tool security app device battery "
+    "network privacy investor valuation acquisition partnership pricing subscription"
+).split()
+
+
+def make_keywords(count):
+    keywords = list(BASE_KEYWORDS[:count])
+    i = 0
+    while len(keywords) < count:
+        keywords.append(f"{random.choice(WORDS)} {random.choice(WORDS)} {i}")
+        i += 1
+    return keywords
+
+
+def make_corpus(size, keywords, hit_ratio=0.05, seed=42):
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        words = [rng.choice(WORDS) for _ in range(40)]
+        if rng.random() < hit_ratio:
+            words.insert(rng.randrange(len(words)), rng.choice(keywords))
+        text = " ".join(words)
+        corpus.append(text[:80].title() + " " + text)
+    return corpus
+
+
+def naive_filter(corpus, keywords):
+    # 기존 fetch_rss_news 방식
+    return [t for t in corpus if any(k.lower() in t.lower() for k in keywords)]
+
+
+def matcher_filter(corpus, matcher):
+    return [t for t in corpus if matcher.search(t)]
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    random.seed(7)
+
+    print(f"[BENCH] {size:,} synthetic entries")
+    for keyword_count in (6, 25, 100) if len(sys.argv) <= 2 else (int(sys.argv[2]),):
+        keywords = make_keywords(keyword_count)
+        corpus = make_corpus(size, keywords)
+
+        naive_time, naive_hits = timed(naive_filter, corpus, keywords)
+        compile_time, matcher = timed(KeywordMatcher, keywords)
+        matcher_time, matcher_hits = timed(matcher_filter, corpus, matcher)
+        assert naive_hits == matcher_hits
+
+        print(f"[BENCH] keywords={keyword_count:>3} | naive {naive_time:.3f}s | "
+              f"matcher {matcher_time:.3f}s (compile {compile_time * 1000:.2f}ms) | "
+              f"speedup {naive_time / matcher_time:.1f}x | hits {len(matcher_hits):,}")
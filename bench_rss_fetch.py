@@ -0,0 +1,119 @@
+"""
+RSS 수집 벤치마크: 로컬 HTTP 서버가 인위적인 지연을 두고 피드를 내려주고,
+기존 방식(feedparser.parse(url) 순차 호출)과 동시 수집(fetch_rss_news)을 비교합니다.
+
+    python bench_rss_fetch.py [피드 수] [지연(초)]
+"""
+import sys
+import time
+import threading
+import contextlib
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import feedparser
+from scrapers.news import fetch_rss_news
+
+
+def make_rss(feed_id, items=30, shared_links=5):
+    """
+    테스트용 RSS 문서를 만듭니다. 앞쪽 shared_links개의 링크는 모든 피드가 공유합니다(중복 제거 확인용).
+    """
+    now = datetime.now(timezone.utc)
+    entries = []
+    for i in range(items):
+        link = f"https://example.com/shared/{i}" if i < shared_links else f"https://example.com/{feed_id}/{i}"
+        pub = format_datetime(now - timedelta(hours=i))
+        entries.append(
+            f"<item><title>Feed {feed_id} story {i} about Generative AI</title>"
+            f"<link>{link}</link><pubDate>{pub}</pubDate>"
+            f"<description>Startup news number {i} from feed {feed_id}.</description></item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f"<title>Stub Feed {feed_id}</title><link>https://example.com/{feed_id}</link>"
+        + "".join(entries) + "</channel></rss>"
+    ).encode("utf-8")
+
+
+@contextlib.contextmanager
+def serve_feeds(feed_count, latency=0.3, hosts=4, slow_paths=(), slow_latency=5.0, stats=None):
+    """
+    여러 포트(=서로 다른 호스트)로 피드를 서빙하는 로컬 서버를 띄우고 피드 URL 리스트를 돌려줍니다.
+    slow_paths에 포함된 피드 번호는 slow_latency만큼 지연됩니다.
+    ETag를 내려주며, If-None-Match가 일치하면 304로 응답합니다. stats(dict)에 응답 코드별 횟수를 기록합니다.
+    """
+    documents = {f"/feed/{i}": make_rss(i) for i in range(feed_count)}
+    slow = {f"/feed/{i}" for i in slow_paths}
+    stats = stats if stats is not None else {}
+    stats_lock = threading.Lock()
+
+    def count(code):
+        with stats_lock:
+            stats[code] = stats.get(code, 0) + 1
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = documents.get(self.path)
+            if body is None:
+                self.send_error(404)
+                return
+            time.sleep(slow_latency if self.path in slow else latency)
+            etag = f'"{hash(body) & 0xffffffff:x}"'
+            if self.headers.get("If-None-Match") == etag:
+                count(304)
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            count(200)
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Type", "application/rss+xml; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    servers = [ThreadingHTTPServer(("127.0.0.1", 0), Handler) for _ in range(hosts)]
+    for server in servers:
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield [
+            f"http://127.0.0.1:{servers[i % hosts].server_address[1]}/feed/{i}"
+            for i in range(feed_count)
+        ]
+    finally:
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+
+
+def sequential_fetch(feeds):
+    # 기존 방식: 피드를 하나씩 feedparser.parse(url)
+    return [feedparser.parse(url) for url in feeds]
+
+
+if __name__ == "__main__":
+    feed_count = int(sys.argv[1]) if len(sys.argv) > 1 else 13
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+    keywords = ["Generative AI"]
+
+    with serve_feeds(feed_count, latency=latency) as feeds:
+        start = time.perf_counter()
+        sequential_fetch(feeds)
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        items = fetch_rss_news(feeds, keywords)
+        concurrent = time.perf_counter() - start
+
+    print("-" * 50)
+    print(f"[BENCH] {feed_count} feeds, {latency}s latency each")
+    print(f"[BENCH] sequential feedparser.parse : {sequential:.2f}s")
+    print(f"[BENCH] concurrent fetch_rss_news  : {concurrent:.2f}s ({len(items)} items)")
+    print(f"[BENCH] speedup                    : {sequential / concurrent:.1f}x")
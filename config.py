@@ -33,5 +33,57 @@ RSS_FEEDS = {
     ]
 }
 
+# 수십 MB짜리 대형 피드: 전체를 메모리에 올리지 않고 받으면서 파싱 (scrapers/stream_parser.py)
+# 목록에 없어도 응답 크기(Content-Length)가 STREAM_MIN_BYTES 이상이면 스트리밍
+STREAMING_FEEDS = set(RSS_FEEDS["general"])
+
 # YouTube Configuration
 YOUTUBE_SEARCH_LIMIT = 3
+
+# 랭킹 설정 (수집 -> 요약 사이에서 프롬프트에 넣을 항목 선별)
+RANK_TOP_K = 60                 # 요약 단계로 넘길 최대 항목 수
+RANK_CHAR_BUDGET = 60000        # 요약 단계로 넘길 수집 데이터 최대 글자 수 (map-reduce 사용 시)
+PROMPT_CHAR_BUDGET = 15000      # 요약 프롬프트 1회에 넣을 수집 데이터 최대 글자 수
+RECENCY_HALF_LIFE_DAYS = 2      # 이 기간마다 최신성 점수가 절반으로
+# 출처별 가중치 (피드 제목 기준, 없으면 1.0)
+SOURCE_WEIGHTS = {
+    "TechCrunch": 1.2,
+    "The Verge": 1.1,
+    "VentureBeat": 1.1,
+    "NVIDIA Blog": 1.0,
+    "YouTube": 0.9,
+}
+
+# 유사 기사 묶기 (랭킹 전에 같은 이야기는 대표 1개만 남김)
+DEDUP_THRESHOLD = 0.5           # 추정 자카드 유사도(제목+요약 단어/두 단어)가 이 이상이면 같은 이야기
+DEDUP_BANDS = 16                # LSH 구간 수 (서명 길이 = DEDUP_BANDS * DEDUP_ROWS)
+DEDUP_ROWS = 4                  # 구간당 칸 수
+DEDUP_HISTORY_DAYS = 7          # 이전 발행호에서 다룬 이야기를 기억하는 기간
+
+# 요약 설정
+# "auto": 프롬프트 예산을 넘으면 map-reduce, "single": 한 번에 (예산 초과분은 잘림), "map_reduce": 항상 분할
+SUMMARY_MODE = "auto"
+MAP_CHUNK_CHARS = 12000         # map 단계 배치 1개의 최대 글자 수
+MAP_WORKERS = 4                 # map 단계 동시 호출 수
+MAP_MAX_LEVELS = 3              # 요약 노트가 여전히 예산을 넘을 때 다시 묶어 요약하는 최대 단계
+
+# 배치 모드 (batch.py: 피드는 한 번만 수집하고 주제별 뉴스레터를 한꺼번에 생성)
+# 주제 풀 (scheduler.py도 같은 목록 사용)
+KEYWORD_POOL = [
+    "Generative AI Business Models",
+    "SaaS Pricing Trends",
+    "B2B AI Startups",
+    "Low Code No Code Tools",
+    "AI Marketing Automation",
+    "Web3 Gaming Trends",
+    "Climate Tech Startups",
+    "Digital Health AI",
+    "E-commerce AI personalization",
+    "Fintech AI agents",
+    "AI in Education",
+    "Robotics Trends 2026",
+    "Sustainable Tech",
+    "Cybersecurity AI"
+]
+# 동시에 LLM 단계(키워드 확장/요약)를 진행하는 주제 수 (map 단계는 주제마다 MAP_WORKERS개까지 추가로 병렬)
+BATCH_LLM_CONCURRENCY = int(os.getenv("BATCH_LLM_CONCURRENCY", 3))
@@ -0,0 +1,261 @@
+import os
+import re
+import zlib
+import operator
+import sqlite3
+import threading
+from array import array
+from datetime import datetime, timedelta
+from config import DEDUP_THRESHOLD, DEDUP_BANDS, DEDUP_ROWS, DEDUP_HISTORY_DAYS
+from storage import CACHE_DIR
+
+STORY_HISTORY_FILE = os.path.join(CACHE_DIR, "story_history.db")
+SHINGLE_TEXT_CHARS = 300   # 요약/자막은 앞부분만 비교 (유튜브 자막이 길어도 비용 일정)
+# LSH 버킷 1개에 넣는 최대 항목 수. 흔한 단어(the, of 등)가 최솟값을 차지한 구간은 무관한 기사끼리도 겹치므로
+# 가득 찬 버킷에는 더 넣지 않음 -> 항목당 후보 비교 수가 bands * 이 값 이하로 고정 (전체 비용이 거의 선형)
+LSH_BUCKET_LIMIT = 32
+
+_TOKEN_RE = re.compile(r"\w+")
+# 단어 단위 shingle에서 빼는 흔한 단어 (무관한 기사끼리 서명 칸을 공유해 LSH 후보가 폭증하는 것 방지, 두 단어 shingle에는 포함)
+STOPWORDS = frozenset(
+    "a an the of to and or in on at by for from with as is are was were be been it its this that these "
+    "will has have had not but new says said".split()
+)
+_MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+_EMPTY = 1 << 64           # 빈 칸 표시 (실제 값은 32비트)
+_ROTATION = 1 << 32        # 빈 칸을 오른쪽 칸 값으로 채울 때 거리마다 더하는 오프셋
+
+
+def shingles(item):
+    """
+    제목 + 요약 앞부분의 단어(unigram)와 연속 두 단어(bigram) 해시 집합.
+    """
+    summary = (item.get('summary') or "").replace("[YouTube Video]", "")[:SHINGLE_TEXT_CHARS]
+    words = _TOKEN_RE.findall(f"{item.get('title') or ''} {summary}".lower())
+    tokens = [zlib.crc32(w.encode()) for w in words]
+    hashes = {h for w, h in zip(words, tokens) if w not in STOPWORDS}
+    hashes.update(((a * 0x01000193) ^ b) & 0xFFFFFFFFFFFF for a, b in zip(tokens, tokens[1:]))
+    return hashes
+
+
+def signature(hashes, num_bins=DEDUP_BANDS * DEDUP_ROWS):
+    """
+    One Permutation MinHash: 해시 한 번으로 num_bins칸 각각의 최솟값을 구합니다 (순열 num_bins개 대신).
+    빈 칸은 오른쪽(순환)의 가장 가까운 값으로 채웁니다 (rotation densification).
+    두 서명에서 같은 칸의 비율이 자카드 유사도의 추정치입니다. 단어가 없으면 None.
+    """
+    if not hashes:
+        return None
+    sig = [_EMPTY] * num_bins
+    for v in [(h * _GOLDEN) & _MASK64 for h in hashes]:
+        b = (v >> 32) % num_bins
+        low = v & 0xFFFFFFFF
+        if low < sig[b]:
+            sig[b] = low
+    if _EMPTY in sig:
+        # 오른쪽에서 왼쪽으로 한 바퀴: 빈 칸 = 가장 가까운 오른쪽 값 + 거리 * _ROTATION (끝은 처음으로 순환)
+        first = next(i for i, value in enumerate(sig) if value < _EMPTY)
+        nearest, position = sig[first], first + num_bins
+        for i in range(num_bins - 1, -1, -1):
+            if sig[i] < _EMPTY:
+                nearest, position = sig[i], i
+            else:
+                sig[i] = nearest + (position - i) * _ROTATION
+    return tuple(sig)
+
+
+def similarity(sig_a, sig_b):
+    return sum(map(operator.eq, sig_a, sig_b)) / len(sig_a)
+
+
+class LSHIndex:
+    """
+    서명을 bands개 구간으로 나눠, 한 구간이라도 완전히 같은 서명끼리만 후보로 돌려줍니다.
+    유사도 s인 쌍이 후보가 될 확률 1-(1-s^rows)^bands (기본 16x4: s=0.5 -> 0.64, s=0.8 -> 1.0).
+    """
+    def __init__(self, bands=DEDUP_BANDS, rows=DEDUP_ROWS, bucket_limit=LSH_BUCKET_LIMIT):
+        self.bands = bands
+        self.rows = rows
+        self.bucket_limit = bucket_limit
+        self._buckets = [{} for _ in range(bands)]
+
+    def _band_keys(self, sig):
+        rows = self.rows
+        return [(band, sig[band * rows:(band + 1) * rows]) for band in range(self.bands)]
+
+    def add(self, key, sig):
+        for band, band_key in self._band_keys(sig):
+            bucket = self._buckets[band].setdefault(band_key, [])
+            if len(bucket) < self.bucket_limit:
+                bucket.append(key)
+
+    def candidates(self, sig):
+        found = set()
+        for band, band_key in self._band_keys(sig):
+            found.update(self._buckets[band].get(band_key, ()))
+        return found
+
+
+def cluster_signatures(signatures, threshold=DEDUP_THRESHOLD, bands=DEDUP_BANDS, rows=DEDUP_ROWS):
+    """
+    서명 리스트를 유사 문서 클러스터로 묶습니다 (LSH 후보 -> 서명 유사도 확인 -> union-find).
+    반환값: 인덱스 리스트의 리스트 (클러스터는 첫 항목 순서, 클러스터 안도 입력 순서)
+    """
+    parent = list(range(len(signatures)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    index = LSHIndex(bands, rows)
+    for i, sig in enumerate(signatures):
+        if sig is None:
+            continue
+        for j in index.candidates(sig):
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j and similarity(sig, signatures[j]) >= threshold:
+                # 먼저 들어온 항목이 루트 -> 클러스터 순서 = 첫 항목 순서
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+        index.add(i, sig)
+
+    clusters = {}
+    for i in range(len(signatures)):
+        clusters.setdefault(find(i), []).append(i)
+    return list(clusters.values())
+
+
+def _representative(cluster, items):
+    # 내용이 가장 많은 항목 (동점이면 먼저 수집된 항목)
+    return max(cluster, key=lambda i: (len(items[i].get('summary') or ""), -i))
+
+
+def _scope_key(scope):
+    # 주제(키워드)별 기록: 대소문자/앞뒤 공백 무시
+    return (scope or "").strip().lower()
+
+
+class StoryHistory:
+    """
+    이전 발행호에 실린 기사의 서명 (로컬 SQLite, DEDUP_HISTORY_DAYS일 보관).
+    주제(scope, 보통 기본 키워드)별로 따로 기억하므로, 한 주제에서 다룬 이야기가 다른 주제 뉴스레터를 막지 않습니다.
+    링크가 달라도(다른 매체, 유튜브) 같은 이야기면 같은 주제의 다음 실행에서 제외합니다.
+    발행호에 실제로 들어간 항목만 stage_items()로 올리고, 발행이 끝난 뒤 commit()해야 저장됩니다.
+    """
+    def __init__(self, path=STORY_HISTORY_FILE, days=DEDUP_HISTORY_DAYS, threshold=DEDUP_THRESHOLD,
+                 bands=DEDUP_BANDS, rows=DEDUP_ROWS, clock=datetime.now):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.days = days
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(stories)")]
+        if columns and "scope" not in columns:
+            # 주제 구분이 없던 이전 형식 -> 보관 기간이 짧은 기록이므로 버리고 새로 시작
+            self._conn.execute("DROP TABLE stories")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS stories (
+                scope TEXT NOT NULL,            -- 주제(키워드, 소문자)
+                link TEXT NOT NULL,
+                signature BLOB NOT NULL,        -- array('Q') 바이트
+                seen_at TEXT NOT NULL,
+                PRIMARY KEY (scope, link)
+            )
+        """)
+        self._conn.commit()
+        self._indexes = {}
+        self._signatures = {}
+        self._pending = {}
+        cutoff = (clock() - timedelta(days=days)).isoformat(timespec='seconds')
+        for scope, link, blob in self._conn.execute(
+                "SELECT scope, link, signature FROM stories WHERE seen_at >= ?", (cutoff,)):
+            self._remember(scope, link, tuple(array('Q', blob)))
+
+    def _remember(self, scope, link, sig):
+        if scope not in self._indexes:
+            self._indexes[scope] = LSHIndex(self.bands, self.rows)
+            self._signatures[scope] = {}
+        self._signatures[scope][link] = sig
+        self._indexes[scope].add(link, sig)
+
+    def __len__(self):
+        return sum(len(signatures) for signatures in self._signatures.values())
+
+    def covered(self, sig, scope=""):
+        """
+        같은 주제의 이전 발행호에서 다룬 이야기와 비슷하면 True.
+        """
+        scope = _scope_key(scope)
+        with self._lock:
+            if scope not in self._indexes:
+                return False
+            signatures = self._signatures[scope]
+            return any(similarity(sig, signatures[link]) >= self.threshold
+                       for link in self._indexes[scope].candidates(sig))
+
+    def stage(self, link, sig, scope=""):
+        if link and sig is not None:
+            with self._lock:
+                self._pending[(_scope_key(scope), link)] = sig
+
+    def stage_items(self, items, scope=""):
+        """
+        발행호에 실린 항목(랭킹 후 요약에 들어간 목록)을 기록 대기열에 올립니다.
+        """
+        for item in items:
+            self.stage(item.get('link'), signature(shingles(item), self.bands * self.rows), scope)
+
+    def commit(self):
+        """
+        대기 중인 서명을 저장하고 보관 기간이 지난 기록을 지웁니다.
+        """
+        now = self.clock()
+        stamp = now.isoformat(timespec='seconds')
+        cutoff = (now - timedelta(days=self.days)).isoformat(timespec='seconds')
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO stories (scope, link, signature, seen_at) VALUES (?, ?, ?, ?)",
+                [(scope, link, array('Q', sig).tobytes(), stamp) for (scope, link), sig in self._pending.items()])
+            self._conn.execute("DELETE FROM stories WHERE seen_at < ?", (cutoff,))
+            for (scope, link), sig in self._pending.items():
+                self._remember(scope, link, sig)
+            self._pending = {}
+
+    def discard(self):
+        with self._lock:
+            self._pending = {}
+
+    def close(self):
+        self._conn.close()
+
+
+def dedup_items(items, history=None, scope="", threshold=DEDUP_THRESHOLD, bands=DEDUP_BANDS, rows=DEDUP_ROWS):
+    """
+    뉴스/유튜브 항목에서 거의 같은 이야기(다른 매체의 같은 발표 등)를 묶어 클러스터마다 대표 1개만 남깁니다.
+    history(StoryHistory)를 넘기면 같은 주제(scope)의 이전 발행호에서 다룬 이야기도 뺍니다.
+    (이번 발행호에 실린 항목은 발행 후 history.stage_items()로 따로 기록)
+    결과는 대표 항목의 입력 순서 그대로입니다.
+    """
+    if not items:
+        return []
+    signatures = [signature(shingles(item), bands * rows) for item in items]
+    clusters = cluster_signatures(signatures, threshold, bands, rows)
+
+    representatives = sorted(_representative(cluster, items) for cluster in clusters)
+    selected = []
+    covered = 0
+    for i in representatives:
+        sig = signatures[i]
+        if history is not None and sig is not None and history.covered(sig, scope):
+            covered += 1
+            continue
+        selected.append(items[i])
+
+    print(f"[DEDUP] {len(items)} items -> {len(clusters)} stories"
+          + (f", {covered} already covered in earlier issues" if history is not None else ""))
+    return selected
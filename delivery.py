@@ -0,0 +1,182 @@
+import os
+import time
+import asyncio
+import threading
+import contextlib
+from datetime import datetime
+from storage import file_lock
+from email_sender import send_bulk, SENDER_PASSWORD, SMTP_POOL_SIZE, BACKOFF_BASE
+
+# 발행호별 발송 저널 저장 위치
+DELIVERY_DIR = "deliveries"
+# 메일 서비스 제한 (Gmail 기준 보수적으로)
+SEND_RATE_PER_SEC = float(os.getenv("SMTP_RATE_PER_SEC", 5))
+SEND_DAILY_LIMIT = int(os.getenv("SMTP_DAILY_LIMIT", 2000))
+# 일시적 오류 재시도 횟수 (간격은 email_sender.BACKOFF_BASE부터 2배씩)
+MAX_RETRIES = 3
+
+
+class TokenBucket:
+    """
+    초당 rate개까지 통과시키는 토큰 버킷 (capacity만큼 순간 버스트 허용).
+    send_bulk의 발송 스레드들이 함께 쓰므로 acquire()는 스레드 안전하게 토큰이 생길 때까지 기다립니다.
+    """
+    def __init__(self, rate, capacity=1, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.tokens = capacity
+        self.updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            while True:
+                now = self.clock()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                time.sleep((1 - self.tokens) / self.rate)
+
+
+class DeliveryJournal:
+    """
+    발행호(issue)별 append-only 발송 기록. 한 줄에 "시각\\t상태\\t이메일".
+    - sent: 발송 완료 / bounced: 수신자 주소 영구 거부(5xx) -> 재실행 시 둘 다 건너뜀
+    - failed: 재시도 소진 -> 재실행 시 다시 시도
+    매 줄마다 fsync하므로 중간에 죽어도 이미 보낸 주소는 다시 보내지 않습니다.
+    """
+    def __init__(self, issue_id, directory=DELIVERY_DIR):
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, f"{issue_id}.log")
+
+    def entries(self):
+        if not os.path.exists(self.path):
+            return []
+        entries = []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                parts = line.rstrip("\n").split("\t")
+                if len(parts) == 3:  # 쓰다 만 마지막 줄은 무시
+                    entries.append(parts)
+        return entries
+
+    def completed(self):
+        return {email for _, status, email in self.entries() if status in ("sent", "bounced")}
+
+    def record(self, email, status="sent"):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(f"{datetime.now().isoformat(timespec='seconds')}\t{status}\t{email}\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def sent_today(directory=DELIVERY_DIR):
+    """
+    오늘 보낸 메일 수 (모든 발행호 저널 합계, 일일 한도 계산용).
+    """
+    if not os.path.isdir(directory):
+        return 0
+    today = datetime.now().strftime('%Y-%m-%d')
+    count = 0
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        if not name.endswith(".log") or datetime.fromtimestamp(os.path.getmtime(path)).strftime('%Y-%m-%d') != today:
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            count += sum(1 for line in f if line.startswith(today) and "\tsent\t" in line)
+    return count
+
+
+@contextlib.asynccontextmanager
+async def _delivery_lock(directory):
+    """
+    저널 디렉터리 단위로 발송을 직렬화합니다 (스케줄러 작업 프로세스 여러 개가 동시에 보내도
+    sent_today()가 정확해야 일일 한도를 넘지 않음). 잠금을 기다리는 동안 이벤트 루프는 막지 않습니다.
+    """
+    lock = file_lock(os.path.join(directory, "delivery"))
+    # 기다리는 중에 취소되면 잠금 파일 핸들이 GC될 때 닫히면서 잠금도 풀림
+    await asyncio.to_thread(lock.__enter__)
+    try:
+        yield
+    finally:
+        lock.__exit__(None, None, None)
+
+
+async def deliver_issue(issue_id, subject, html_content, recipients, concurrency=SMTP_POOL_SIZE,
+                        rate_per_sec=SEND_RATE_PER_SEC, daily_limit=SEND_DAILY_LIMIT,
+                        max_retries=MAX_RETRIES, backoff_base=BACKOFF_BASE,
+                        connection_factory=None, journal_dir=DELIVERY_DIR):
+    """
+    발행호 1개를 구독자들에게 비동기로 발송합니다.
+    - concurrency개의 SMTP 연결을 동시에 사용하고, 전체 속도는 토큰 버킷으로 rate_per_sec 이하로 제한
+    - 일시적 오류는 지수 백오프로 max_retries번까지 재시도
+    - 저널에 기록된 주소는 건너뛰므로, 같은 발행호를 다시 실행하면 멈춘 곳부터 이어서 보냄
+    - 일일 한도에 도달하면 나머지는 남겨두고 종료 (다음 실행에서 이어서 발송)
+    - 같은 journal_dir의 발송은 프로세스가 달라도 한 번에 하나씩 진행 (일일 한도 공유)
+
+    - 로그인 실패처럼 수신자와 무관한 오류면 중단하고 'aborted'에 남김 (못 보낸 주소는 기록하지 않으므로 재실행 시 다시 보냄)
+
+    반환값: {'sent', 'skipped', 'failed', 'deferred', 'aborted', 'connections', 'elapsed', 'rate'(건/초)}
+    """
+    stats = {'sent': 0, 'skipped': 0, 'failed': [], 'deferred': 0, 'aborted': None, 'connections': 0, 'elapsed': 0.0, 'rate': 0.0}
+
+    if connection_factory is None and not SENDER_PASSWORD:
+        print("[EMAIL] SMTP_PASSWORD not set. Skipping email send.")
+        print(f"[EMAIL] Would have sent {issue_id} to {sum(1 for _ in recipients)} recipients with subject: {subject}")
+        return stats
+
+    journal = DeliveryJournal(issue_id, journal_dir)
+    # 한도 계산부터 발송 끝까지 잠금 유지 -> 다른 프로세스의 발송분까지 센 뒤에 보냄
+    async with _delivery_lock(journal_dir):
+        done = journal.completed()
+        quota = max(daily_limit - sent_today(journal_dir), 0)
+
+        # recipients는 리스트나 스트리밍 이터레이터(SubscriberRepository.iter_active) 모두 가능
+        # -> 오늘 보낼 수 있는 만큼만 메모리에 올림
+        pending = []
+        seen = set()
+        for email in recipients:
+            if email in seen:  # 중복 주소 제거 (순서 유지)
+                continue
+            seen.add(email)
+            if email in done:
+                stats['skipped'] += 1
+            elif len(pending) < quota:
+                pending.append(email)
+            else:
+                stats['deferred'] += 1
+
+        if stats['deferred']:
+            print(f"[EMAIL] Daily limit reached soon: sending {quota}, deferring {stats['deferred']} to the next run")
+
+        if stats['skipped']:
+            print(f"[EMAIL] Resuming {issue_id}: {stats['skipped']} already delivered")
+        if not pending:
+            return stats
+
+        # 발송은 email_sender.send_bulk(연결 풀)에 맡기고, 속도 제한/재시도/저널 기록만 얹음
+        bucket = TokenBucket(rate_per_sec)
+        stop = threading.Event()
+        print(f"[EMAIL] Delivering {issue_id} ({concurrency} connections, {rate_per_sec}/s)...")
+        sending = asyncio.ensure_future(asyncio.to_thread(
+            send_bulk, subject, html_content, pending, pool_size=concurrency, connection_factory=connection_factory,
+            throttle=bucket.acquire, max_retries=max_retries, backoff_base=backoff_base,
+            on_result=journal.record, stop=stop))
+        try:
+            result = await asyncio.shield(sending)
+        except asyncio.CancelledError:
+            # 중단(Ctrl+C 등): 진행 중인 전송만 마치고 멈춤 -> 끝난 전송은 저널에 남아 다음 실행에서 건너뜀
+            # 그 기록이 끝날 때까지 잠금을 쥐고 있어야 다른 프로세스의 sent_today()가 정확함
+            stop.set()
+            await asyncio.wait([sending])
+            raise
+        for key in ('sent', 'failed', 'aborted', 'connections', 'elapsed', 'rate'):
+            stats[key] = result[key]
+        print(f"[EMAIL] Delivered {stats['sent']} of {issue_id} at {stats['rate']:.1f} msg/s "
+              f"(failed {len(stats['failed'])}, skipped {stats['skipped']}, deferred {stats['deferred']})")
+        if stats['aborted']:
+            print(f"[ERROR] Delivery of {issue_id} aborted ({stats['aborted']}). Fix the SMTP settings and rerun to resume.")
+    return stats
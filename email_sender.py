@@ -1,4 +1,9 @@
 import smtplib
+import re
+import time
+import random
+import queue
+import threading
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 import os
@@ -8,9 +13,143 @@ load_dotenv()
 
 SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
 SMTP_PORT = int(os.getenv("SMTP_PORT", 587))
-SENDER_EMAIL = os.getenv("SENDER_EMAIL", "your_email@example.com") 
+SENDER_EMAIL = os.getenv("SENDER_EMAIL", "your_email@example.com")
 SENDER_PASSWORD = os.getenv("SMTP_PASSWORD")
 SENDER_NAME = os.getenv("SENDER_NAME", "Unicorn Signal")
+# 대량 발송 시 동시에 유지할 SMTP 연결 수
+SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", 3))
+# 일시적 오류 재시도 간격 (초, 재시도마다 2배)
+BACKOFF_BASE = 2.0
+
+
+def _is_dropped_session(error):
+    """
+    서버가 세션을 끊은 경우(재접속하면 다시 보낼 수 있는 오류)인지 판단합니다.
+    smtplib은 421 응답을 받으면 스스로 연결을 닫습니다.
+    """
+    if isinstance(error, (smtplib.SMTPServerDisconnected, ConnectionError)):
+        return True
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return any(code == 421 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code == 421
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+
+class SmtpConnectError(smtplib.SMTPException):
+    """
+    접속/STARTTLS/로그인 단계의 오류 (원래 오류는 __cause__). 수신자와 무관하므로 발송 전체를 멈춥니다.
+    """
+
+
+def is_transient(error):
+    """
+    다시 시도하면 성공할 수 있는 오류인지 (4xx 응답, 연결 끊김/타임아웃).
+    """
+    if isinstance(error, SmtpConnectError):
+        return error.__cause__ is not None and is_transient(error.__cause__)
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(400 <= code < 500 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    # SMTPException도 OSError의 하위 클래스이므로 구분
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+
+def is_bounce(error):
+    """
+    수신자 주소가 영구 거부(5xx)된 경우인지. 이런 주소만 다시 보내지 않고, 그 밖의 영구 오류
+    (로그인 실패, 발신자 거부 등)는 다른 수신자에게도 똑같이 나므로 발송 전체를 멈춥니다.
+    """
+    return (isinstance(error, smtplib.SMTPRecipientsRefused) and bool(error.recipients)
+            and all(500 <= code < 600 for code, _ in error.recipients.values()))
+
+
+class SmtpConnection:
+    """
+    인증까지 마친 SMTP 연결 1개. 서버가 세션을 끊으면 자동으로 재접속합니다.
+    security: 'ssl'(465), 'starttls'(587), 'none'(로컬 테스트 서버)
+    """
+    def __init__(self, host=SMTP_SERVER, port=SMTP_PORT, user=SENDER_EMAIL, password=SENDER_PASSWORD, security=None, timeout=30):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        # [Fix] Port 465(SSL)와 587(TLS) 분기 처리
+        self.security = security or ('ssl' if port == 465 else 'starttls')
+        self.timeout = timeout
+        self.server = None
+        self.connects = 0
+
+    def connect(self):
+        self.close()
+        try:
+            self.server = self._open()
+        except Exception as e:
+            raise SmtpConnectError(f"Could not connect to {self.host}:{self.port}: {e}") from e
+        self.connects += 1
+
+    def _open(self):
+        if self.security == 'ssl':
+            # SSL 연결 (포트 465)
+            server = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout)
+            server.ehlo()
+        else:
+            server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            if self.security == 'starttls':
+                # TLS 연결 (포트 587)
+                server.starttls()
+        if self.password:
+            try:
+                server.login(self.user, self.password)
+            except Exception:
+                server.close()
+                raise
+        return server
+
+    def send(self, from_addr, to_addr, raw_message):
+        """
+        메시지를 보냅니다. 세션이 끊겨 있으면 한 번 재접속 후 다시 시도합니다.
+        """
+        if self.server is None:
+            self.connect()
+        try:
+            self.server.sendmail(from_addr, to_addr, raw_message)
+        except Exception as e:
+            if not _is_dropped_session(e):
+                raise
+            self.connect()
+            self.server.sendmail(from_addr, to_addr, raw_message)
+
+    def close(self):
+        if self.server is None:
+            return
+        try:
+            self.server.quit()
+        except Exception:
+            pass
+        self.server = None
+
+
+class PreparedMessage:
+    """
+    본문(MIME)은 한 번만 직렬화해두고, 수신자마다 To 헤더만 앞에 붙여 보냅니다.
+    """
+    def __init__(self, subject, html_content, sender_name=SENDER_NAME, sender_email=SENDER_EMAIL):
+        msg = MIMEMultipart()
+        msg['From'] = f"{sender_name} <{sender_email}>"
+        msg['Subject'] = subject
+        # 본문 추가 (HTML)
+        msg.attach(MIMEText(html_content, 'html'))
+        self.sender_email = sender_email
+        # SMTP는 CRLF 줄바꿈을 요구함
+        self._body = re.sub(r'(?:\r\n|\n|\r(?!\n))', '\r\n', msg.as_string()).encode('ascii')
+
+    def for_recipient(self, to_email):
+        return f"To: {to_email}\r\n".encode('utf-8') + self._body
+
 
 def send_email(subject, html_content, to_email=None):
     """
@@ -18,51 +157,145 @@ def send_email(subject, html_content, to_email=None):
     """
     if to_email is None:
         to_email = os.getenv("TO_EMAIL")
-        
+
     if not SENDER_PASSWORD:
         print("[EMAIL] SMTP_PASSWORD not set. Skipping email send.")
         print(f"[EMAIL] Would have sent to {to_email} with subject: {subject}")
         return False
-        
+
     if not to_email:
         print("[ERROR] No recipient email (TO_EMAIL) provided.")
         return False
 
     try:
         # 이메일 메시지 구성
-        msg = MIMEMultipart()
-        msg['From'] = f"{SENDER_NAME} <{SENDER_EMAIL}>"
-        msg['To'] = to_email
-        msg['Subject'] = subject
-
-        # 본문 추가 (HTML)
-        msg.attach(MIMEText(html_content, 'html'))
+        message = PreparedMessage(subject, html_content)
 
         # SMTP 연결 및 전송
         print(f"[EMAIL] Connecting to {SMTP_SERVER} on port {SMTP_PORT}...")
-        
-        # [Fix] Port 465(SSL)와 587(TLS) 분기 처리
-        if SMTP_PORT == 465:
-            # SSL 연결 (포트 465)
-            server = smtplib.SMTP_SSL(SMTP_SERVER, SMTP_PORT)
-            server.ehlo()
-        else:
-            # TLS 연결 (포트 587)
-            server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
-            server.starttls()
-
-        server.login(SENDER_EMAIL, SENDER_PASSWORD)
-        text = msg.as_string()
-        server.sendmail(SENDER_EMAIL, to_email, text)
-        server.quit()
-        
+        connection = SmtpConnection()
+        connection.send(SENDER_EMAIL, to_email, message.for_recipient(to_email))
+        connection.close()
+
         print(f"[EMAIL] Sent successfully to {to_email}")
         return True
-        
+
     except Exception as e:
         print(f"[ERROR] Failed to send email: {e}")
         return False
 
+
+def _send_with_retry(connection, message, recipient, throttle, max_retries, backoff_base):
+    """
+    수신자 1명에게 보냅니다. 반환값: 'sent' / 'bounced'(주소 영구 거부) / 'failed'(재시도 소진)
+    수신자와 무관한 오류(로그인 실패, 발신자 거부, 접속 불가)는 그대로 올려 보냅니다.
+    """
+    for attempt in range(max_retries + 1):
+        if throttle is not None:
+            throttle()
+        try:
+            connection.send(message.sender_email, recipient, message.for_recipient(recipient))
+            return 'sent'
+        except Exception as e:
+            if is_bounce(e):
+                print(f"[ERROR] Permanent failure for {recipient}: {e}")
+                return 'bounced'
+            if not is_transient(e) or (attempt == max_retries and isinstance(e, SmtpConnectError)):
+                raise
+            if attempt == max_retries:
+                print(f"[ERROR] Failed to send email to {recipient}"
+                      + (f" after {max_retries} retries" if max_retries else "") + f": {e}")
+                return 'failed'
+            delay = backoff_base * (2 ** attempt) + random.uniform(0, backoff_base)
+            print(f"[EMAIL] Transient error for {recipient} ({e}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+            # 연결 상태가 불확실하므로 새로 연결
+            connection.close()
+
+
+def send_bulk(subject, html_content, recipients, pool_size=SMTP_POOL_SIZE, connection_factory=None,
+              throttle=None, max_retries=0, backoff_base=BACKOFF_BASE, on_result=None, stop=None):
+    """
+    여러 수신자에게 같은 뉴스레터를 보냅니다.
+    pool_size개의 인증된 SMTP 연결을 재사용하므로 수신자마다 접속/STARTTLS/로그인을 반복하지 않습니다.
+    connection_factory: SmtpConnection을 만드는 함수 (테스트 서버 연결용, 기본값은 .env 설정)
+    throttle: 전송 시도 직전마다 호출하는 함수 (속도 제한, 예: delivery.TokenBucket.acquire)
+    max_retries: 일시적 오류(is_transient)를 지수 백오프로 다시 시도하는 횟수
+    on_result(recipient, status): 수신자마다 결과('sent' / 'bounced' / 'failed') 통지, 한 번에 한 스레드만 호출
+    stop(threading.Event): 설정되면 진행 중인 전송만 마치고 남은 수신자는 보내지 않음
+    로그인 실패/발신자 거부/접속 불가처럼 모든 수신자에게 같은 오류가 나면 발송 전체를 멈추고
+    'aborted'에 오류를 남김 (그때 시도하던 주소와 남은 주소는 on_result로 통지하지 않고 'failed'에 포함)
+
+    반환값: {'sent', 'failed'(주소 리스트), 'aborted'(오류 메시지 또는 None), 'connections', 'elapsed', 'rate'(건/초)}
+    """
+    recipients = list(recipients)
+    stats = {'sent': 0, 'failed': [], 'aborted': None, 'connections': 0, 'elapsed': 0.0, 'rate': 0.0}
+    if not recipients:
+        return stats
+
+    if connection_factory is None:
+        if not SENDER_PASSWORD:
+            print("[EMAIL] SMTP_PASSWORD not set. Skipping email send.")
+            print(f"[EMAIL] Would have sent to {len(recipients)} recipients with subject: {subject}")
+            stats['failed'] = recipients
+            return stats
+        connection_factory = SmtpConnection
+
+    message = PreparedMessage(subject, html_content)
+    pending = queue.Queue()
+    for recipient in recipients:
+        pending.put(recipient)
+    lock = threading.Lock()
+    aborted = threading.Event()
+
+    def worker():
+        connection = connection_factory()
+        try:
+            while not aborted.is_set() and (stop is None or not stop.is_set()):
+                try:
+                    recipient = pending.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    status = _send_with_retry(connection, message, recipient, throttle, max_retries, backoff_base)
+                except Exception as e:
+                    with lock:
+                        stats['failed'].append(recipient)
+                        if stats['aborted'] is None:
+                            stats['aborted'] = str(e)
+                            print(f"[ERROR] Aborting bulk send: {e}")
+                    aborted.set()
+                    return
+                with lock:
+                    if status == 'sent':
+                        stats['sent'] += 1
+                    else:
+                        stats['failed'].append(recipient)
+                    if on_result is not None:
+                        on_result(recipient, status)
+        finally:
+            connection.close()
+            with lock:
+                stats['connections'] += getattr(connection, 'connects', 0)
+
+    print(f"[EMAIL] Sending to {len(recipients)} recipients over {min(pool_size, len(recipients))} connections...")
+    start = time.perf_counter()
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(min(pool_size, len(recipients)))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    if aborted.is_set():
+        while not pending.empty():
+            stats['failed'].append(pending.get_nowait())
+
+    stats['elapsed'] = time.perf_counter() - start
+    stats['rate'] = stats['sent'] / stats['elapsed'] if stats['elapsed'] else 0.0
+    print(f"[EMAIL] Sent {stats['sent']}/{len(recipients)} in {stats['elapsed']:.2f}s "
+          f"({stats['rate']:.1f} msg/s, {stats['connections']} connections)")
+    return stats
+
 if __name__ == "__main__":
     # Test
     send_email("Test Newsletter", "<h1>Hello</h1><p>This is a test.</p>")
@@ -0,0 +1,149 @@
+import os
+import sys
+import glob
+from html.parser import HTMLParser
+from storage import load_json, save_json
+
+ARCHIVE_DIR = "archives"
+FRAGMENT_DIR = os.path.join(ARCHIVE_DIR, "fragments")
+SUMMARY_CHARS = 100
+
+
+def extract_fragments(output_html, base_keywords=""):
+    """
+    발행 시점에 뉴스레터 HTML을 한 번만 파싱해 화면 표시용 조각을 만듭니다.
+    - style: <style> 내용
+    - body: div.container 안쪽 HTML (없으면 <body>)
+    - summary: summary-box 텍스트 (아카이브 카드용, SUMMARY_CHARS자 이내)
+    """
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(output_html, 'html.parser')
+
+    style_content = soup.style.string if soup.style and soup.style.string else ""
+    body_content = soup.find('div', class_='container')
+    if not body_content:
+        body_content = soup.body
+
+    # 요약문 추출 (HTML의 summary-box에서 텍스트만 발췌)
+    try:
+        summary_div = soup.find("div", class_="summary-box")
+        if summary_div:
+            # "3줄 요약" 제목 제외하고 내용만 가져오기
+            summary_text = summary_div.get_text(separator=" ", strip=True)
+            # 너무 길면 자르기
+            if len(summary_text) > SUMMARY_CHARS:
+                summary_text = summary_text[:SUMMARY_CHARS] + "..."
+        else:
+            summary_text = f"{base_keywords} 트렌드 분석 및 주요 뉴스 요약"
+    except Exception as e:
+        print(f"[WARN] Summary extraction failed: {e}")
+        summary_text = f"{base_keywords} 트렌드 분석 Report"
+
+    return {
+        'style': style_content,
+        'body': body_content.decode_contents() if body_content else None,
+        'summary': summary_text,
+    }
+
+
+class _TextExtractor(HTMLParser):
+    SKIP = {'style', 'script'}
+
+    def __init__(self):
+        super().__init__()
+        self.parts = []
+        self._skipping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP:
+            self._skipping += 1
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP and self._skipping:
+            self._skipping -= 1
+
+    def handle_data(self, data):
+        if not self._skipping and data.strip():
+            self.parts.append(data.strip())
+
+
+def plain_text(body_html):
+    """
+    본문 조각(HTML)에서 검색 색인용 텍스트만 추출합니다 (표준 라이브러리 파서, 빠름).
+    """
+    if not body_html:
+        return ""
+    extractor = _TextExtractor()
+    extractor.feed(body_html)
+    extractor.close()
+    return " ".join(extractor.parts)
+
+
+def fragment_path(html_filename, fragment_dir=FRAGMENT_DIR):
+    base = os.path.splitext(os.path.basename(html_filename))[0]
+    return os.path.join(fragment_dir, f"{base}.json")
+
+
+def save_fragments(html_filename, fragments, fragment_dir=FRAGMENT_DIR):
+    os.makedirs(fragment_dir, exist_ok=True)
+    path = fragment_path(html_filename, fragment_dir)
+    save_json(path, fragments)
+    return path
+
+
+def load_fragments(html_filename, archive_dir=ARCHIVE_DIR, fragment_dir=FRAGMENT_DIR):
+    """
+    저장된 조각을 읽습니다. 조각이 없는 발행호는 HTML을 파싱해 만들고 저장해 둡니다 (다음부터는 파싱 없음).
+    """
+    fragments = load_json(fragment_path(html_filename, fragment_dir), None)
+    if fragments is not None:
+        return fragments
+
+    html_path = os.path.join(archive_dir, os.path.basename(html_filename))
+    if not os.path.exists(html_path):
+        return None
+    with open(html_path, 'r', encoding='utf-8') as f:
+        fragments = extract_fragments(f.read())
+    try:
+        save_fragments(html_filename, fragments, fragment_dir)
+    except OSError as e:
+        print(f"[WARN] Could not save fragments for {html_filename}: {e}")
+    return fragments
+
+
+def newsletter_markup(fragments):
+    """
+    대시보드에 그대로 넣는 HTML (newsletter-paper 클래스로 스타일 통일).
+    """
+    if not fragments or fragments.get('body') is None:
+        return None
+    # [Fix] f-string 들여쓰기 제거 (Markdown Code Block 인식 방지)
+    return f"""<style>{fragments.get('style') or ''}</style>
+<div class="newsletter-paper">
+{fragments['body']}
+</div>"""
+
+
+def migrate(archive_dir=ARCHIVE_DIR, fragment_dir=FRAGMENT_DIR, force=False):
+    """
+    기존 발행호 백필: 조각이 없는(force면 전부) HTML마다 조각 파일을 만듭니다.
+    """
+    created = 0
+    for html_path in sorted(glob.glob(os.path.join(archive_dir, "*.html"))):
+        if not force and os.path.exists(fragment_path(html_path, fragment_dir)):
+            continue
+        with open(html_path, 'r', encoding='utf-8') as f:
+            fragments = extract_fragments(f.read())
+        # 요약은 기존 메타데이터(JSON)의 값을 유지
+        meta = load_json(html_path[:-len(".html")] + ".json", None)
+        if meta and meta.get('summary'):
+            fragments['summary'] = meta['summary']
+        save_fragments(html_path, fragments, fragment_dir)
+        created += 1
+    return created
+
+
+if __name__ == "__main__":
+    # 일회성 마이그레이션: python fragments.py [--force]
+    count = migrate(force="--force" in sys.argv)
+    print(f"[FRAGMENTS] Wrote {count} fragment files to {FRAGMENT_DIR}")
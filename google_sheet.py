@@ -1,8 +1,7 @@
 import gspread
 import os
 import json
-import pandas as pd
-from datetime import datetime
+import threading
 from google.oauth2.service_account import Credentials
 import streamlit as st
 
@@ -14,6 +13,17 @@ SCOPES = [
 
 # 접속할 구글 시트 이름 (미리 생성해두거나, 코드로 생성 가능)
 SHEET_NAME = "Unicorn_Signal_Subscribers"
+HEADER = ["email", "nickname", "date"]
+
+# 프로세스 전체에서 공유하는 클라이언트/워크시트 핸들 (인증, 시트 검색, 헤더 확인은 처음 한 번만)
+_lock = threading.Lock()
+_worksheet = None
+
+def _has_secret(key):
+    try:
+        return key in st.secrets
+    except Exception:
+        return False
 
 def get_gspread_client():
     """
@@ -27,8 +37,8 @@ def get_gspread_client():
     if os.path.exists("service_account.json"):
         creds = Credentials.from_service_account_file("service_account.json", scopes=SCOPES)
     
-    # 2. Streamlit Cloud Secrets 확인
-    elif "gcp_service_account" in st.secrets:
+    # 2. Streamlit Cloud Secrets 확인 (secrets.toml이 없는 로컬/스케줄러에서는 건너뜀)
+    elif _has_secret("gcp_service_account"):
         creds = Credentials.from_service_account_info(st.secrets["gcp_service_account"], scopes=SCOPES)
         
     if not creds:
@@ -36,7 +46,29 @@ def get_gspread_client():
         
     return gspread.authorize(creds)
 
+def reset_google_sheet():
+    """
+    캐시된 핸들을 버립니다. 다음 호출에서 다시 인증하고 시트를 엽니다.
+    """
+    global _worksheet
+    with _lock:
+        _worksheet = None
+
 def init_google_sheet():
+    """
+    캐시된 워크시트를 반환하고, 없으면 연결합니다.
+    (액세스 토큰 만료는 gspread 세션이 자동 갱신, 인증 자체가 거부되면 _with_sheet가 다시 연결)
+    """
+    global _worksheet
+    with _lock:
+        if _worksheet is not None:
+            return _worksheet, "Success"
+        sheet, msg = _open_google_sheet()
+        if sheet is not None:
+            _worksheet = sheet
+        return sheet, msg
+
+def _open_google_sheet():
     """
     시트에 연결하고, 없으면 생성(권한 필요)하거나 찾습니다.
     헤더가 없으면 작성합니다.
@@ -58,54 +90,58 @@ def init_google_sheet():
         except Exception as e:
              return None, f"시트를 찾을 수 없고 생성도 실패했습니다: {e}"
 
-    # 헤더 확인
+    # 헤더 확인 (연결할 때 한 번만)
     try:
         header = sheet.row_values(1)
         if not header:
-            sheet.append_row(["email", "nickname", "date"])
+            sheet.append_row(HEADER)
     except:
-         sheet.append_row(["email", "nickname", "date"])
+         sheet.append_row(HEADER)
          
     return sheet, "Success"
 
-def save_subscriber_gsheet(email, nickname):
+def _is_auth_error(e):
+    from google.auth.exceptions import RefreshError
+    return isinstance(e, RefreshError) or (isinstance(e, gspread.exceptions.APIError) and e.code == 401)
+
+def _with_sheet(operation):
     """
-    구글 시트에 구독자 저장
+    캐시된 워크시트로 operation(sheet)을 실행합니다.
+    인증 오류(키 교체, 토큰 갱신 실패 등)면 핸들을 버리고 한 번 다시 연결해 재시도합니다.
+    반환값: (결과, 메시지) / 시트를 열 수 없으면 (None, 오류 메시지)
     """
-    sheet, msg = init_google_sheet()
-    if not sheet:
-        return False, msg # 인증 실패 혹은 시트 오류
-        
-    try:
-        # 중복 확인
-        # 모든 레코드 가져오기 (데이터가 적을 때 유효)
-        records = sheet.get_all_records()
-        df = pd.DataFrame(records)
-        
-        if not df.empty and 'email' in df.columns and email in df['email'].values:
-             return False, "이미 구독 중인 이메일입니다! (Google Sheet)"
-             
-        # 추가
-        current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        sheet.append_row([email, nickname, current_time])
-        return True, "구독 완료! (Google Sheet 저장됨)"
-        
-    except Exception as e:
-        return False, f"저장 중 오류 발생: {e}"
+    for attempt in range(2):
+        sheet, msg = init_google_sheet()
+        if not sheet:
+            return None, msg
+        try:
+            return operation(sheet), "Success"
+        except Exception as e:
+            if attempt == 0 and _is_auth_error(e):
+                print(f"[GSHEET] Auth error, reconnecting: {e}")
+                reset_google_sheet()
+                continue
+            raise
 
-def load_subscribers_gsheet():
+class SheetSubscriberSource:
     """
-    구글 시트에서 구독자 목록 로드 (DataFrame 반환)
+    subscriber_repo.SubscriberRepository.sync()에 넘기는 시트 어댑터.
     """
-    sheet, msg = init_google_sheet()
-    if not sheet:
-        return pd.DataFrame(columns=['email', 'nickname', 'date']) # 실패 시 빈 DF
-        
-    try:
-         records = sheet.get_all_records()
-         # gspread는 빈 시트일 때 빈 리스트 반환
-         if not records:
-             return pd.DataFrame(columns=['email', 'nickname', 'date'])
-         return pd.DataFrame(records)
-    except Exception:
-        return pd.DataFrame(columns=['email', 'nickname', 'date'])
+    def fetch_rows(self, start=0):
+        """
+        start번째(0부터) 데이터 행부터 끝까지를 범위 조회 1회로 읽습니다 (헤더 제외).
+        반환값: [{email, nickname, date}] / 연결할 수 없으면 None
+        """
+        values, _ = _with_sheet(lambda sheet: sheet.get(f"A{start + 2}:C"))
+        if values is None:
+            return None
+        # 빈 칸이 뒤에 있는 행은 짧게 오므로 열 수를 맞춤
+        return [dict(zip(HEADER, list(row) + [""] * (len(HEADER) - len(row)))) for row in values]
+
+    def append_rows(self, rows):
+        # 여러 구독자를 API 1회로 추가. 시트를 열 수 없으면 False (호출자가 다음에 다시 시도)
+        result, msg = _with_sheet(lambda sheet: sheet.append_rows(rows))
+        if result is None:
+            print(f"[GSHEET] Append skipped: {msg}")
+            return False
+        return True
@@ -0,0 +1,259 @@
+import os
+import time
+import sqlite3
+import asyncio
+import threading
+import traceback
+import multiprocessing
+from collections import deque
+from datetime import datetime
+from multiprocessing.connection import wait
+from storage import CACHE_DIR
+
+RUN_LEDGER_FILE = os.path.join(CACHE_DIR, "run_ledger.db")
+JOB_TIMEOUT = int(os.getenv("JOB_TIMEOUT", 1800))  # 초, 작업 1개(주제 1개)의 최대 실행 시간
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", 2))     # 동시에 실행하는 작업 프로세스 수
+POLL_INTERVAL = 0.5
+
+
+def run_newsletter(topic, slot=None):
+    """
+    기본 작업: 주제 1개의 뉴스레터 생성 (main.main). 작업 프로세스 안에서 실행됩니다.
+    slot: 스케줄 회차 이름 -> 같은 회차의 작업 중 먼저 발행한 1개만 구독자에게 이메일 발송 (나머지는 아카이브만)
+    """
+    from main import main as run_newsletter_generation
+    asyncio.run(run_newsletter_generation(keyword=topic, delivery_slot=slot))
+
+
+def _worker(target, topic, slot, conn):
+    # 작업 프로세스 진입점: 결과(또는 예외 요약)를 부모에게 보내고 종료
+    try:
+        target(topic, slot)
+        conn.send(("ok", None))
+    except BaseException as e:
+        traceback.print_exc()
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+class RunLedger:
+    """
+    작업 실행 기록 (로컬 SQLite). 작업마다 상태(running/ok/error/timeout/skipped/abandoned)와 소요 시간을 남기고,
+    같은 이름의 실행이 겹치지 않도록 잠금(locks)을 관리합니다. 여러 스케줄러 프로세스가 함께 써도 안전합니다.
+    """
+    def __init__(self, path=RUN_LEDGER_FILE, clock=time.time):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_name TEXT NOT NULL,         -- 실행 이름 (잠금 단위, 예: scheduled)
+                topic TEXT,
+                status TEXT NOT NULL,
+                started_at TEXT NOT NULL,
+                duration REAL,                  -- 초
+                error TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_runs_name ON runs(run_name, id);
+            CREATE TABLE IF NOT EXISTS locks (
+                name TEXT PRIMARY KEY,
+                pid INTEGER NOT NULL,
+                acquired_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS claims (
+                name TEXT PRIMARY KEY,          -- 한 번만 할 일 (예: delivery:<회차>)
+                owner TEXT,
+                claimed_at TEXT NOT NULL
+            );
+        """)
+
+    def _now_text(self):
+        return datetime.fromtimestamp(self.clock()).strftime('%Y-%m-%d %H:%M:%S')
+
+    # ---------------------------------------------------------------
+    # 겹침 방지 잠금
+    # ---------------------------------------------------------------
+    def try_lock(self, name, ttl):
+        """
+        name 잠금을 잡습니다. 다른 실행이 잡고 있으면 False.
+        잡은 프로세스가 죽었거나 ttl이 지난 잠금은 버려진 것으로 보고 넘겨받습니다 (남은 running 기록은 abandoned로).
+        """
+        now = self.clock()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("SELECT pid, expires_at FROM locks WHERE name = ?", (name,)).fetchone()
+                if row and row[1] > now and _pid_alive(row[0]):
+                    self._conn.execute("COMMIT")
+                    return False
+                if row:
+                    self._conn.execute("UPDATE runs SET status = 'abandoned' WHERE run_name = ? AND status = 'running'",
+                                       (name,))
+                self._conn.execute("INSERT OR REPLACE INTO locks (name, pid, acquired_at, expires_at) VALUES (?, ?, ?, ?)",
+                                   (name, os.getpid(), now, now + ttl))
+                self._conn.execute("COMMIT")
+                return True
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def release(self, name):
+        with self._lock:
+            self._conn.execute("DELETE FROM locks WHERE name = ? AND pid = ?", (name, os.getpid()))
+
+    def claim(self, name, owner=None):
+        """
+        name을 처음 요청한 쪽만 True (여러 작업 프로세스 중 하나만 하게 할 일, 예: 회차당 이메일 발송 1회).
+        """
+        with self._lock:
+            cursor = self._conn.execute("INSERT OR IGNORE INTO claims (name, owner, claimed_at) VALUES (?, ?, ?)",
+                                        (name, owner, self._now_text()))
+            return cursor.rowcount == 1
+
+    def claim_owner(self, name):
+        with self._lock:
+            row = self._conn.execute("SELECT owner FROM claims WHERE name = ?", (name,)).fetchone()
+            return row[0] if row else None
+
+    # ---------------------------------------------------------------
+    # 실행 기록
+    # ---------------------------------------------------------------
+    def start(self, run_name, topic):
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO runs (run_name, topic, status, started_at) VALUES (?, ?, 'running', ?)",
+                (run_name, topic, self._now_text()))
+            return cursor.lastrowid
+
+    def finish(self, run_id, status, duration, error=None):
+        with self._lock:
+            self._conn.execute("UPDATE runs SET status = ?, duration = ?, error = ? WHERE id = ?",
+                               (status, duration, error, run_id))
+
+    def skipped(self, run_name, reason):
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO runs (run_name, topic, status, started_at, duration, error) VALUES (?, NULL, 'skipped', ?, 0, ?)",
+                (run_name, self._now_text(), reason))
+
+    def recent(self, limit=20):
+        """
+        최근 실행 기록 [{id, run_name, topic, status, started_at, duration, error}] (최신순).
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT id, run_name, topic, status, started_at, duration, error FROM runs ORDER BY id DESC LIMIT ?",
+                (limit,))
+            columns = [c[0] for c in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor]
+
+    def close(self):
+        self._conn.close()
+
+
+class JobRunner:
+    """
+    주제별 생성 작업을 별도 프로세스에서 실행합니다.
+    - 프로세스 격리: 작업이 멈추거나 죽어도 스케줄러는 영향 없음
+    - 작업마다 timeout초가 지나면 강제 종료 (멈춘 피드/Gemini 호출 대비)
+    - 서로 다른 주제는 최대 workers개까지 동시에
+    - 같은 run_name의 실행이 아직 진행 중이면 새 실행은 건너뜀 (장부에 skipped 기록)
+    target(topic, slot)은 모듈 최상위 함수여야 합니다 (spawn 방식으로 새 프로세스에서 import).
+    slot은 이번 실행(회차)의 이름으로, 같은 회차 작업끼리 한 번만 할 일을 나눌 때 씁니다 (RunLedger.claim).
+    """
+    def __init__(self, target=run_newsletter, ledger=None, timeout=JOB_TIMEOUT, workers=JOB_WORKERS,
+                 start_method="spawn"):
+        self.target = target
+        self.ledger = ledger or RunLedger()
+        self.timeout = timeout
+        self.workers = max(1, workers)
+        self._context = multiprocessing.get_context(start_method)
+
+    def run(self, topics, run_name="scheduled"):
+        """
+        topics를 모두 실행하고 작업별 결과 [{topic, status, duration, error}]를 돌려줍니다.
+        이전 실행과 겹치면 아무것도 하지 않고 None.
+        """
+        topics = list(topics)
+        rounds = -(-len(topics) // self.workers)
+        # 잠금 만료: 모든 작업이 타임아웃까지 가도 끝나는 시점 + 여유
+        if not self.ledger.try_lock(run_name, ttl=self.timeout * max(rounds, 1) + 60):
+            print(f"[JOB] Previous '{run_name}' run is still in progress. Skipping.")
+            self.ledger.skipped(run_name, "previous run still in progress")
+            return None
+        slot = f"{run_name}@{datetime.fromtimestamp(self.ledger.clock()).strftime('%Y-%m-%d %H:%M:%S')}"
+        try:
+            return self._dispatch(topics, run_name, slot)
+        finally:
+            self.ledger.release(run_name)
+
+    def run_in_background(self, topics, run_name="scheduled"):
+        """
+        스케줄러 루프를 막지 않도록 별도 스레드에서 run()을 실행합니다.
+        """
+        thread = threading.Thread(target=self.run, args=(topics, run_name), name=f"job-{run_name}", daemon=True)
+        thread.start()
+        return thread
+
+    def _dispatch(self, topics, run_name, slot):
+        pending = deque(topics)
+        active = {}   # 부모 쪽 파이프 -> (프로세스, 주제, 장부 id, 시작 시각)
+        results = []
+
+        def finish(conn, status, error=None):
+            process, topic, run_id, started = active.pop(conn)
+            duration = time.monotonic() - started
+            conn.close()
+            self.ledger.finish(run_id, status, duration, error)
+            print(f"[JOB] {topic}: {status} in {duration:.1f}s" + (f" ({error})" if error else ""))
+            results.append({'topic': topic, 'status': status, 'duration': duration, 'error': error})
+
+        while pending or active:
+            while pending and len(active) < self.workers:
+                topic = pending.popleft()
+                parent_conn, child_conn = self._context.Pipe(duplex=False)
+                process = self._context.Process(target=_worker, args=(self.target, topic, slot, child_conn),
+                                                name=f"job-{topic}", daemon=True)
+                run_id = self.ledger.start(run_name, topic)
+                process.start()
+                child_conn.close()
+                active[parent_conn] = (process, topic, run_id, time.monotonic())
+                print(f"[JOB] Started '{topic}' (pid {process.pid})")
+
+            for conn in wait(list(active), timeout=POLL_INTERVAL):
+                process = active[conn][0]
+                try:
+                    status, error = conn.recv()
+                except EOFError:
+                    # 결과를 보내지 못하고 죽음 (세그폴트, os._exit 등)
+                    process.join()
+                    status, error = "error", f"worker exited with code {process.exitcode}"
+                process.join()
+                finish(conn, status, error)
+
+            now = time.monotonic()
+            for conn, (process, topic, _, started) in list(active.items()):
+                if now - started > self.timeout:
+                    process.terminate()
+                    process.join(5)
+                    if process.is_alive():
+                        process.kill()
+                        process.join()
+                    finish(conn, "timeout", f"killed after {self.timeout}s")
+        return results
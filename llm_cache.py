@@ -0,0 +1,157 @@
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+from storage import CACHE_DIR
+
+LLM_CACHE_FILE = os.path.join(CACHE_DIR, "llm_cache.db")
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", 7 * 24 * 3600))      # 초 (기본 7일)
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", 1000))
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", 50 * 1024 * 1024))
+
+
+def make_cache_key(model_name, prompt, params=None):
+    """
+    모델 이름 + 프롬프트 해시 + 호출 파라미터로 캐시 키(sha256)를 만듭니다.
+    """
+    prompt_text = prompt if isinstance(prompt, str) else json.dumps(prompt, sort_keys=True, default=str)
+    payload = {
+        'model': model_name,
+        'prompt': hashlib.sha256(prompt_text.encode('utf-8')).hexdigest(),
+        'params': params or {},
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class LLMCache:
+    """
+    모델 응답 텍스트를 SQLite에 저장하는 캐시입니다.
+    - TTL이 지난 항목은 무시/삭제
+    - 항목 수(max_entries) 또는 총 크기(max_bytes)를 넘으면 가장 오래 안 쓴 항목부터 삭제 (LRU)
+    path=":memory:"이면 디스크에 쓰지 않습니다.
+    """
+    def __init__(self, path=LLM_CACHE_FILE, ttl=LLM_CACHE_TTL, max_entries=LLM_CACHE_MAX_ENTRIES,
+                 max_bytes=LLM_CACHE_MAX_BYTES, clock=time.time):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                model TEXT,
+                created_at REAL,
+                accessed_at REAL,
+                size INTEGER,
+                value TEXT
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache(accessed_at)")
+        self._conn.commit()
+
+    def get(self, key):
+        now = self.clock()
+        with self._lock:
+            row = self._conn.execute("SELECT created_at, value FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is None or now - row[0] > self.ttl:
+                if row is not None:
+                    self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return row[1]
+
+    def put(self, key, model_name, value):
+        now = self.clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, model, created_at, accessed_at, size, value) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model_name, now, now, len(value.encode('utf-8')), value),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now):
+        self._conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl,))
+        count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        # 오래 안 쓴 순서로 한도 안에 들어올 때까지 삭제
+        doomed = []
+        for key, size in self._conn.execute("SELECT key, size FROM llm_cache ORDER BY accessed_at"):
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            count -= 1
+            total -= size
+        self._conn.executemany("DELETE FROM llm_cache WHERE key = ?", doomed)
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+    def close(self):
+        self._conn.close()
+
+
+class CachedResponse:
+    """
+    캐시에서 꺼낸 응답 (generate_content 응답처럼 .text로 접근).
+    """
+    def __init__(self, text):
+        self.text = text
+
+
+class CachedModel:
+    """
+    model.generate_content 앞에 LLMCache를 두는 래퍼입니다.
+    같은 모델/프롬프트/파라미터로 다시 호출하면 API를 부르지 않고 저장된 응답을 돌려줍니다.
+    그 외 속성은 원래 모델로 전달됩니다.
+    cache를 넘기지 않으면 첫 generate_content 호출 때 cache_factory()로 만듭니다
+    (모듈 import만으로 캐시 DB 파일이 생기지 않도록).
+    """
+    def __init__(self, model, cache=None, cache_factory=LLMCache):
+        self.model = model
+        self.model_name = getattr(model, 'model_name', type(model).__name__)
+        self._cache = cache
+        self._cache_factory = cache_factory
+        self._cache_lock = threading.Lock()
+
+    @property
+    def cache(self):
+        if self._cache is None:
+            with self._cache_lock:
+                if self._cache is None:
+                    self._cache = self._cache_factory()
+        return self._cache
+
+    def generate_content(self, prompt, **kwargs):
+        key = make_cache_key(self.model_name, prompt, kwargs)
+        cached = self.cache.get(key)
+        if cached is not None:
+            print(f"[CACHE] LLM cache hit ({self.model_name}, {key[:8]})")
+            return CachedResponse(cached)
+
+        response = self.model.generate_content(prompt, **kwargs)
+        try:
+            text = response.text
+        except Exception:
+            # 안전 필터 등으로 텍스트가 없는 응답은 저장하지 않음
+            return response
+        if text:
+            self.cache.put(key, self.model_name, text)
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self.model, name)
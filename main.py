@@ -1,21 +1,32 @@
 import os
 import asyncio
 import sys
+import json
 from config import RSS_FEEDS
 from scrapers.news import fetch_rss_news
+from scrapers.feed_cache import FeedCache
+from scrapers.seen_store import SeenEntries
 from scrapers.youtube import fetch_youtube_videos
+from scrapers.transcript_cache import TranscriptCache
 from ai_agent import expand_keywords, summarize_content
-from email_sender import send_email
+from ranking import select_top_items
+from dedup import dedup_items, StoryHistory
+from delivery import deliver_issue
+from archive_index import ArchiveIndex
+from job_runner import RunLedger
+from fragments import extract_fragments, save_fragments, plain_text
+from subscriber_repo import SubscriberRepository
+import google_sheet
+from timing import StageTimer
 from jinja2 import Environment, FileSystemLoader
 from datetime import datetime
 
-# 인자(Argument)로 키워드를 받을 수 있도록 수정
-async def main(keyword=None):
-    print("[START] TrendHunter AI Starting...")
-    
+
+def resolve_keyword(keyword=None):
+    """
+    키워드 결정 (자동화 시 인자로 받음, 없으면 명령행 인자/입력/기본값 순)
+    """
     base_keywords = keyword
-    
-    # 1. 사용자 입력 (자동화 시 인자로 받음)
     if not base_keywords:
         print("Enter keywords (e.g., Generative AI, Crypto)")
         # 타임아웃 없는 input은 스케줄러에서 멈출 수 있음.
@@ -27,47 +38,62 @@ async def main(keyword=None):
                 base_keywords = input("Input keywords: ")
              except EOFError:
                 base_keywords = "Generative AI" # Default functionality for non-interactive
-                
+
     if not base_keywords:
         base_keywords = "Generative AI"
-        
-    print(f"\n[ANALYSIS] Analyzing keywords: {base_keywords}...")
-    
-    # 2. AI 키워드 확장
-    expanded_keywords = expand_keywords(base_keywords)
-    print(f"[EXPAND] Expanded Keywords: {expanded_keywords}")
-    
-    # 3. 데이터 수집
-    # 3-1. 뉴스 수집
+    return base_keywords
+
+
+def select_feeds(base_keywords):
     target_feeds = RSS_FEEDS['tech'] + RSS_FEEDS['ai']
     # 간단한 키워드 매칭으로 피드 추가
     if 'crypto' in base_keywords.lower() or 'coin' in base_keywords.lower():
         target_feeds += RSS_FEEDS['crypto']
-        
-    news_items = fetch_rss_news(target_feeds, expanded_keywords)
-    
-    # 3-2. 유튜브 수집
-    video_items = fetch_youtube_videos(expanded_keywords)
-    
-    # 4. 콘텐츠 통합
-    all_content = news_items + video_items
-    print(f"\n[INFO] Collected {len(all_content)} items total.")
-    
-    if not all_content:
-        print("[FAIL] No content found. Try broader keywords.")
-        # 컨텐츠가 없어도 이메일은 보내지 않음
-        return
-
-    # 5. AI 요약 및 인사이트 (Unicorn Signal) 생성
-    print("[AI] Generating Unicorn Signal Insight...")
-    ai_title, newsletter_body = summarize_content(all_content)
-    
+    return target_feeds
+
+
+def load_recipients():
+    """
+    발송 대상: 구독자 저장소의 활성 구독자 (없으면 테스트 이메일(Admin) 사용)
+    """
+    repo = SubscriberRepository()
+    try:
+        repo.import_csv()
+        # 대시보드 밖(구글 시트)에서 추가된 구독자도 반영
+        if repo.sync(google_sheet.SheetSubscriberSource()) is None:
+            print("[EMAIL] Google Sheet not configured. Using local subscribers only.")
+    except Exception as e:
+        print(f"[EMAIL] Subscriber sync failed, using local subscribers: {e}")
+
+    if repo.count():
+        # 발송 중에 배치 단위로 읽어옴 (전체 목록을 메모리에 올리지 않음)
+        return repo.iter_active()
+
+    # 구독자가 없으면 테스트 이메일(Admin) 사용
+    print("[EMAIL] No subscribers found. Sending to Admin only.")
+    default_email = os.getenv("TO_EMAIL")
+    return [default_email] if default_email else []
+
+
+def claim_delivery(slot, topic):
+    """
+    스케줄 회차(slot)의 이메일 발송권을 요청합니다. 같은 회차에서 먼저 발행한 작업 1개만 True
+    (SCHEDULER_TOPICS > 1이어도 구독자는 회차마다 메일 1통).
+    """
+    ledger = RunLedger()
+    try:
+        return ledger.claim(f"delivery:{slot}", topic)
+    finally:
+        ledger.close()
+
+
+def clean_title(ai_title):
     # 인코딩 에러 방지 처리
     try:
         safe_title = ai_title.encode('cp949', errors='ignore').decode('cp949')
     except:
         safe_title = ai_title
-    
+
     # [UI Fix] 제목에서 '유니콘 시그널:' 브랜드명 중복 제거 (강력 모드)
     # ai_agent.py에서 1차로 제거하지만, 혹시 몰라 2차 필터링
     replacements = ["유니콘 시그널:", "유니콘 시그널", "Unicorn Signal:", "Unicorn Signal", "🦄"]
@@ -76,131 +102,227 @@ async def main(keyword=None):
     safe_title = safe_title.strip()
     if safe_title.startswith("-") or safe_title.startswith(":"):
         safe_title = safe_title[1:].strip()
-    
-    print(f"[AI] Generated Title: {safe_title}")
-    
-    # 6. HTML 생성 (Jinja2)
+    return safe_title
+
+
+def render_newsletter(ai_title, today_str, newsletter_body, expanded_keywords):
     env = Environment(loader=FileSystemLoader('templates'))
     template = env.get_template('newsletter_theme.html')
-    
+
     # [Monetization] 키워드 기반 추천 상품 선정 (잠시 비활성화)
     # from products import get_recommended_product
     # recommended_product = get_recommended_product(expanded_keywords)
     # print(f"[ADS] Selected Product: {recommended_product['title']}")
-    
-    today_str = datetime.now().strftime('%Y-%m-%d')
-    output_html = template.render(
+
+    return template.render(
         title=ai_title,
         date=today_str,
         body_content=newsletter_body,
         keywords=", ".join(expanded_keywords),
         # product=recommended_product # 광고 비활성화 요청
     )
-    
-    # 7. 파일 저장 (Archiving)
-    archive_dir = "archives"
-    os.makedirs(archive_dir, exist_ok=True)
-    
-    safe_keyword = base_keywords.replace(' ', '_')
-    filename_base = f"{archive_dir}/{today_str}_{safe_keyword}"
-    
-    html_filename = f"{filename_base}.html"
-    with open(html_filename, "w", encoding="utf-8") as f:
-        f.write(output_html)
-        
-    print(f"\n[DONE] Trend Report Saved: {html_filename}")
 
-    # 7-1. 메타데이터 저장 (For Archive UI)
+
+def resolve_thumbnail(news_items, video_items, base_keywords):
     thumbnail_url = None
-    
+
     # 1. 뉴스 이미지 확인
-    if 'news_items' in locals() and news_items:
-        for item in news_items:
-            if item.get('image'):
-                thumbnail_url = item['image']
-                break
-    
+    for item in news_items:
+        if item.get('image'):
+            thumbnail_url = item['image']
+            break
+
     # 2. 유튜브 썸네일 확인 (뉴스 이미지가 없으면)
-    if not thumbnail_url and 'video_items' in locals() and video_items:
+    if not thumbnail_url:
         for item in video_items:
             if item.get('thumbnail'):
                 thumbnail_url = item['thumbnail']
                 break
-    
+
     # 3. 그래도 없으면 깔끔한 텍스트 썸네일 (placeholder) -> [Update] AI 썸네일 생성
     if not thumbnail_url:
         print("[AI] Generating Thumbnail Image...")
         from ai_agent import generate_thumbnail
         thumbnail_url = generate_thumbnail(base_keywords)
         print(f"[AI] Thumbnail Generated: {thumbnail_url}")
+    return thumbnail_url
 
-    # 요약문 추출 (HTML의 summary-box에서 텍스트만 발췌)
-    try:
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(output_html, 'html.parser')
-        summary_div = soup.find("div", class_="summary-box")
-        if summary_div:
-            # "3줄 요약" 제목 제외하고 내용만 가져오기
-            summary_text = summary_div.get_text(separator=" ", strip=True)
-            # 너무 길면 자르기
-            if len(summary_text) > 100:
-                summary_text = summary_text[:100] + "..."
-        else:
-            summary_text = f"{base_keywords} 트렌드 분석 및 주요 뉴스 요약"
-    except Exception as e:
-        print(f"[WARN] Summary extraction failed: {e}")
-        summary_text = f"{base_keywords} 트렌드 분석 Report"
-
-    # [Fix] 메타데이터: 제목 중복 제거된 safe_title 사용, 썸네일 확실히 지정
-    metadata = {
-        "title": safe_title, # 이미 정제된 제목 사용 (유니콘 시그널 제거됨)
-        "date": today_str,
-        "keyword": base_keywords,
-        "summary": summary_text,
-        "thumbnail": thumbnail_url,
-        "filename": os.path.basename(html_filename)
-    }
-    
-    import json
-    json_filename = html_filename.replace(".html", ".json")
-    with open(json_filename, "w", encoding="utf-8") as f:
-        json.dump(metadata, f, ensure_ascii=False, indent=4)
-    print(f"[MAIN] Metadata saved to {json_filename}")
-    
-    # 8. 이메일 전송 (NEW)
-    print("[EMAIL] Sending Newsletter...")
-    email_subject = f"🦄 {ai_title} ({today_str})"
-    # 8. 이메일 전송 (NEW)
-    print("[EMAIL] Sending Newsletter...")
-    email_subject = f"🦄 {ai_title} ({today_str})"
-    
-    # [Update] 구독자 리스트 확인 및 전송
-    recipients = []
+
+async def collect(base_keywords, expanded_keywords, timer, seen=None):
+    """
+    뉴스와 유튜브를 동시에 수집합니다.
+    seen(SeenEntries)을 넘기면 같은 주제의 이전 실행에서 처리한 뉴스 엔트리는 제외합니다.
+    """
+    async def news():
+        with timer.stage("collect:news"):
+            # 피드 캐시: 변경 없는 피드는 304로 건너뜀 (ETag/Last-Modified)
+            return await asyncio.to_thread(fetch_rss_news, select_feeds(base_keywords), expanded_keywords,
+                                           cache=FeedCache(), seen=seen, scope=base_keywords)
+
+    async def videos():
+        with timer.stage("collect:youtube"):
+            return await asyncio.to_thread(fetch_youtube_videos, expanded_keywords, cache=TranscriptCache())
+
+    return await asyncio.gather(news(), videos())
+
+
+async def publish_issue(base_keywords, expanded_keywords, ai_title, newsletter_body, news_items, video_items,
+                        timer, recipients_task=None, archive_index=None, archive_dir="archives"):
+    """
+    요약 결과로 HTML과 썸네일을 만들고 아카이브(HTML, 조각, 메타데이터, 인덱스)에 저장합니다.
+    recipients_task가 있으면 HTML이 준비되는 즉시 이메일 발송을 함께 진행합니다.
+    archive_index를 넘기면 기록만 하고(배치 모드: 최신화/닫기는 호출한 쪽에서), 없으면 직접 열고 닫습니다.
+    반환값: 메타데이터 dict
+    """
+    safe_title = clean_title(ai_title)
+    print(f"[AI] Generated Title: {safe_title}")
+
+    # 6. HTML 생성 (Jinja2) + 썸네일 결정 (동시 실행)
+    today_str = datetime.now().strftime('%Y-%m-%d')
+
+    async def thumbnail():
+        with timer.stage("thumbnail"):
+            return await asyncio.to_thread(resolve_thumbnail, news_items, video_items, base_keywords)
+
+    async def render():
+        with timer.stage("render"):
+            return await asyncio.to_thread(render_newsletter, ai_title, today_str, newsletter_body, expanded_keywords)
+
+    thumbnail_task = asyncio.create_task(thumbnail())
+    output_html = await render()
+
+    # 7. 파일 저장 (Archiving)
+    os.makedirs(archive_dir, exist_ok=True)
+    own_index = archive_index is None
+    if own_index:
+        # 아카이브 인덱스: 파일을 쓰기 전에 바깥 변경(git pull 등)부터 반영
+        archive_index = ArchiveIndex(archive_dir=archive_dir)
+        archive_index.ensure_fresh()
+
+    safe_keyword = base_keywords.replace(' ', '_')
+    filename_base = f"{archive_dir}/{today_str}_{safe_keyword}"
+
+    html_filename = f"{filename_base}.html"
+    with open(html_filename, "w", encoding="utf-8") as f:
+        f.write(output_html)
+
+    print(f"\n[DONE] Trend Report Saved: {html_filename}")
+
+    # 8. 이메일 전송: HTML이 준비되는 즉시 시작 (메타데이터 저장과 동시 진행)
+    email_task = None
+    if recipients_task is not None:
+        print("[EMAIL] Sending Newsletter...")
+        email_subject = f"🦄 {ai_title} ({today_str})"
+
+        async def deliver():
+            recipients = await recipients_task
+            if not recipients:
+                print("[EMAIL] No recipients defined. Check subscribers or TO_EMAIL.")
+                return
+            with timer.stage("email"):
+                # 발송 저널은 발행호(파일명) 단위 -> 같은 발행호를 다시 실행하면 이어서 발송
+                await deliver_issue(os.path.basename(filename_base), email_subject, output_html, recipients)
+
+        email_task = asyncio.create_task(deliver())
+
+    # 7-1. 메타데이터 저장 (For Archive UI)
+    with timer.stage("metadata"):
+        # 발행 시 한 번만 파싱: 대시보드용 style/body 조각 + 카드용 요약을 따로 저장
+        fragments = await asyncio.to_thread(extract_fragments, output_html, base_keywords)
+        save_fragments(html_filename, fragments, os.path.join(archive_dir, "fragments"))
+        summary_text = fragments['summary']
+        thumbnail_url = await thumbnail_task
+
+        # [Fix] 메타데이터: 제목 중복 제거된 safe_title 사용, 썸네일 확실히 지정
+        metadata = {
+            "title": safe_title, # 이미 정제된 제목 사용 (유니콘 시그널 제거됨)
+            "date": today_str,
+            "keyword": base_keywords,
+            "summary": summary_text,
+            "thumbnail": thumbnail_url,
+            "filename": os.path.basename(html_filename)
+        }
+
+        json_filename = html_filename.replace(".html", ".json")
+        with open(json_filename, "w", encoding="utf-8") as f:
+            json.dump(metadata, f, ensure_ascii=False, indent=4)
+        print(f"[MAIN] Metadata saved to {json_filename}")
+
+        # app.py는 JSON을 다시 읽지 않고 이 인덱스만 조회 (검색 색인도 함께 갱신)
+        archive_index.upsert(metadata, text=plain_text(fragments['body']))
+        if own_index:
+            archive_index.mark_fresh()
+            archive_index.close()
+
+    if email_task is not None:
+        await email_task
+    return metadata
+
+
+# 인자(Argument)로 키워드를 받을 수 있도록 수정
+# delivery_slot: 스케줄러 회차 이름 (job_runner) -> 같은 회차에서 이메일은 한 작업만 발송
+async def main(keyword=None, delivery_slot=None):
+    print("[START] TrendHunter AI Starting...")
+    timer = StageTimer()
+
+    # 1. 사용자 입력 (자동화 시 인자로 받음)
+    base_keywords = resolve_keyword(keyword)
+    print(f"\n[ANALYSIS] Analyzing keywords: {base_keywords}...")
+
+    # 구독자 목록은 다른 단계와 무관하므로 처음부터 백그라운드로 읽어둠
+    recipients_task = asyncio.create_task(asyncio.to_thread(load_recipients))
+
+    # 2. AI 키워드 확장
+    with timer.stage("expand_keywords"):
+        expanded_keywords = await asyncio.to_thread(expand_keywords, base_keywords)
+    print(f"[EXPAND] Expanded Keywords: {expanded_keywords}")
+
+    # 3. 데이터 수집 (뉴스 + 유튜브 동시 실행)
+    # 증분 수집: 같은 주제의 이전 실행(예: 오전 발행호)에서 이미 처리한 엔트리는 다시 요약하지 않음
+    seen = SeenEntries()
+    news_items, video_items = await collect(base_keywords, expanded_keywords, timer, seen=seen)
+
+    # 4. 콘텐츠 통합
+    all_content = news_items + video_items
+    print(f"\n[INFO] Collected {len(all_content)} items total.")
+
+    # 4-0. 유사 기사 묶기: 여러 매체/유튜브의 같은 이야기는 대표 1개만, 같은 주제의 이전 발행호에서 다룬 이야기는 제외
+    story_history = StoryHistory()
     try:
-        if os.path.exists("subscribers.csv"):
-            import csv
-            with open("subscribers.csv", "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row.get("email") and "@" in row['email']:
-                        recipients.append(row["email"].strip())
-    except Exception as e:
-        print(f"[EMAIL] Error reading subscribers: {e}")
+        with timer.stage("dedup"):
+            all_content = await asyncio.to_thread(dedup_items, all_content, story_history, base_keywords)
 
-    # 구독자가 없으면 테스트 이메일(Admin) 사용
-    if not recipients:
-        print("[EMAIL] No subscribers found in CSV. Sending to Admin only.")
-        default_email = os.getenv("TO_EMAIL")
-        if default_email:
-            recipients.append(default_email)
-    
-    # 전송 루프
-    if recipients:
-        print(f"[EMAIL] Sending to {len(recipients)} recipients...")
-        for recipient in recipients:
-             send_email(email_subject, output_html, to_email=recipient)
-    else:
-        print("[EMAIL] No recipients defined. Check subscribers.csv or TO_EMAIL.")
+        if not all_content:
+            print("[FAIL] No content found. Try broader keywords.")
+            # 컨텐츠가 없어도 이메일은 보내지 않음
+            recipients_task.cancel()
+            timer.report()
+            return
+
+        # 4-1. 관련도 랭킹: 키워드/최신성/출처 점수 상위 항목만 요약 예산(RANK_CHAR_BUDGET) 안에서 선별
+        with timer.stage("rank"):
+            ranked_content = select_top_items(all_content, expanded_keywords)
+
+        # 5. AI 요약 및 인사이트 (Unicorn Signal) 생성
+        print("[AI] Generating Unicorn Signal Insight...")
+        with timer.stage("summarize"):
+            ai_title, newsletter_body = await asyncio.to_thread(summarize_content, ranked_content)
+
+        # 6~8. HTML/썸네일 -> 아카이브 저장 + 이메일 발송
+        if delivery_slot is not None and not await asyncio.to_thread(claim_delivery, delivery_slot, base_keywords):
+            print(f"[EMAIL] Another issue of {delivery_slot} is being delivered. Archiving only.")
+            recipients_task.cancel()
+            recipients_task = None
+        await publish_issue(base_keywords, expanded_keywords, ai_title, newsletter_body, news_items, video_items,
+                            timer, recipients_task=recipients_task)
+        # 발행까지 끝난 뒤에만 처리 완료로 기록 (중간에 실패하면 다음 실행에서 다시 처리)
+        # 이야기 기록은 발행호에 실제로 실린 항목만 (랭킹에서 빠진 기사는 다음 실행에서 다시 후보)
+        seen.commit()
+        story_history.stage_items(ranked_content, base_keywords)
+        story_history.commit()
+    finally:
+        story_history.close()
+    timer.report()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,73 @@
+import heapq
+from datetime import datetime
+from config import RANK_TOP_K, RANK_CHAR_BUDGET, RECENCY_HALF_LIFE_DAYS, SOURCE_WEIGHTS
+from scrapers.keyword_matcher import KeywordMatcher
+
+
+def prompt_block(item):
+    """
+    요약 프롬프트에 들어가는 항목 1개의 텍스트 (summarize_content와 같은 형식).
+    """
+    img_info = f"Image: {item.get('image', 'No Image')}"
+    return f"\nTitle: {item['title']}\nLink: {item['link']}\n{img_info}\nSummary: {item['summary']}\n---"
+
+
+def _age_days(item, now):
+    published = item.get('published')
+    if not published or published == 'Recent':
+        return None
+    try:
+        return max((now - datetime.strptime(published, '%Y-%m-%d')).total_seconds() / 86400, 0)
+    except ValueError:
+        return None
+
+
+def score_item(item, matcher, now=None, source_weights=None, half_life_days=RECENCY_HALF_LIFE_DAYS):
+    """
+    항목 1개의 관련도 점수를 계산합니다.
+    - 키워드: 서로 다른 키워드 수 + 등장 횟수 (제목 등장은 가중)
+    - 최신성: half_life_days마다 절반 (날짜 없는 항목은 중간값)
+    - 출처 가중치: source_weights[source] (기본 1.0)
+    """
+    now = now or datetime.now()
+    source_weights = SOURCE_WEIGHTS if source_weights is None else source_weights
+
+    title_hits = matcher.counts(item.get('title', ''))
+    summary_hits = matcher.counts(item.get('summary', ''))
+    distinct = len(set(title_hits) | set(summary_hits))
+    occurrences = 2 * sum(title_hits.values()) + sum(summary_hits.values())
+    keyword_score = 2 * distinct + min(occurrences, 10) * 0.5
+
+    age = _age_days(item, now)
+    recency = 0.5 if age is None else 0.5 ** (age / half_life_days)
+
+    weight = source_weights.get(item.get('source'), 1.0)
+    return (1 + keyword_score) * (0.5 + recency) * weight
+
+
+def select_top_items(items, keywords, k=RANK_TOP_K, char_budget=RANK_CHAR_BUDGET, source_weights=None, now=None):
+    """
+    점수가 높은 순서로 최대 k개를, 프롬프트 글자 수 예산(char_budget) 안에서 고릅니다.
+    예산을 넘는 항목은 건너뛰고 다음 항목으로 자리를 채웁니다. 결과는 점수 내림차순입니다.
+    """
+    if not items:
+        return []
+    matcher = keywords if isinstance(keywords, KeywordMatcher) else KeywordMatcher(keywords)
+    now = now or datetime.now()
+
+    # (음수 점수, 원래 순서) -> 동점이면 먼저 수집된 항목 우선
+    heap = [(-score_item(item, matcher, now, source_weights), idx) for idx, item in enumerate(items)]
+    heapq.heapify(heap)
+
+    selected = []
+    remaining = char_budget
+    while heap and len(selected) < k:
+        _, idx = heapq.heappop(heap)
+        cost = len(prompt_block(items[idx]))
+        if cost > remaining:
+            continue
+        selected.append(items[idx])
+        remaining -= cost
+
+    print(f"[RANK] Selected {len(selected)}/{len(items)} items ({char_budget - remaining:,}/{char_budget:,} chars)")
+    return selected
@@ -1,46 +1,27 @@
+import os
 import schedule
 import time
-import subprocess
 import random
 from datetime import datetime
-import asyncio
-from main import main as run_newsletter_generation
+from config import KEYWORD_POOL
+from job_runner import JobRunner
 
-# 키워드 풀 (다양한 주제)
-KEYWORD_POOL = [
-    "Generative AI Business Models",
-    "SaaS Pricing Trends",
-    "B2B AI Startups",
-    "Low Code No Code Tools",
-    "AI Marketing Automation",
-    "Web3 Gaming Trends",
-    "Climate Tech Startups",
-    "Digital Health AI",
-    "E-commerce AI personalization",
-    "Fintech AI agents",
-    "AI in Education",
-    "Robotics Trends 2026",
-    "Sustainable Tech",
-    "Cybersecurity AI"
-]
+# 한 번에 생성할 주제 수 (여러 개면 JOB_WORKERS개까지 동시에 생성, 이메일은 회차마다 먼저 발행된 1개만 발송)
+SCHEDULER_TOPICS = int(os.getenv("SCHEDULER_TOPICS", 1))
+
+# 생성 작업은 별도 프로세스에서 실행 (작업별 타임아웃, 실행 기록: cache/run_ledger.db)
+runner = JobRunner()
 
 def job():
     print(f"\n[JOB] Starting scheduled job at {datetime.now()}")
     
     # 랜덤 키워드 선택
-    selected_keyword = random.choice(KEYWORD_POOL)
-    print(f"[JOB] Today's Keyword: {selected_keyword}")
-    
-    # main.py의 로직을 실행
-    from main import main as run_newsletter_generation
+    selected_keywords = random.sample(KEYWORD_POOL, min(SCHEDULER_TOPICS, len(KEYWORD_POOL)))
+    print(f"[JOB] Today's Keyword: {', '.join(selected_keywords)}")
     
-    try:
-        # 비동기 실행을 위해 asyncio.run 사용
-        # main함수 내에서 loop를 새로 생성하는 방식이므로, 
-        # 이미 loop가 돌고 있다면 주의해야 하지만 simple script라 괜찮음
-        asyncio.run(run_newsletter_generation(keyword=selected_keyword))
-    except Exception as e:
-        print(f"[ERROR] Job failed: {e}")
+    # 스케줄러 루프(1초 주기)를 막지 않도록 백그라운드에서 실행
+    # 이전 실행이 아직 끝나지 않았으면 이번 실행은 건너뜀 (장부에 skipped 기록)
+    runner.run_in_background(selected_keywords)
 
 if __name__ == "__main__":
     # 매일 스케줄러 실행 안내 메시지
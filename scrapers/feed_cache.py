@@ -0,0 +1,93 @@
+import os
+import threading
+from datetime import datetime
+from storage import CACHE_DIR, load_json, update_json
+
+FEED_CACHE_FILE = os.path.join(CACHE_DIR, "feed_cache.json")
+
+
+def _dump_entry(entry):
+    data = dict(entry)
+    if data.get('published'):
+        data['published'] = data['published'].isoformat()
+    return data
+
+
+def _load_entry(data):
+    entry = dict(data)
+    if entry.get('published'):
+        entry['published'] = datetime.fromisoformat(entry['published'])
+    return entry
+
+
+class FeedCache:
+    """
+    피드 URL별 ETag/Last-Modified 헤더와 파싱된 엔트리를 디스크에 보관합니다.
+    다음 실행에서 조건부 요청(If-None-Match / If-Modified-Since)을 보내고,
+    서버가 304를 주면 다운로드/파싱 없이 저장된 엔트리를 그대로 사용합니다.
+    """
+    def __init__(self, path=FEED_CACHE_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._feeds = load_json(path, default={}) or {}
+        self._dirty = set()  # 이번 실행에서 새로 저장한 피드 URL
+
+    def conditional_headers(self, url):
+        cached = self._feeds.get(url)
+        if not cached:
+            return {}
+        headers = {}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        return headers
+
+    def get(self, url):
+        """
+        저장된 파싱 결과 {'source', 'entries'}를 반환합니다. 없으면 None.
+        """
+        cached = self._feeds.get(url)
+        if not cached:
+            return None
+        return {
+            'source': cached.get('source', 'Unknown Source'),
+            'entries': [_load_entry(e) for e in cached.get('entries', [])],
+        }
+
+    def store(self, url, headers, source, entries):
+        # 검증용 헤더가 없는 피드는 조건부 요청이 불가능하므로 저장하지 않음
+        lowered = {k.lower(): v for k, v in headers.items()}
+        etag = lowered.get('etag')
+        last_modified = lowered.get('last-modified')
+        if not etag and not last_modified:
+            return
+        with self._lock:
+            self._feeds[url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'source': source,
+                'entries': [_dump_entry(e) for e in entries],
+                'fetched_at': datetime.now().isoformat(timespec='seconds'),
+            }
+            self._dirty.add(url)
+
+    def save(self):
+        """
+        이번 실행에서 바뀐 피드만 디스크의 최신 내용에 합쳐 저장합니다 (다른 작업 프로세스가 저장한 피드는 유지,
+        같은 피드는 더 최근에 받은 쪽).
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            updates = {url: self._feeds[url] for url in self._dirty}
+
+            def merge(feeds):
+                feeds = feeds or {}
+                for url, cached in updates.items():
+                    if cached['fetched_at'] >= feeds.get(url, {}).get('fetched_at', ""):
+                        feeds[url] = cached
+                return feeds
+
+            self._feeds = update_json(self.path, merge, default={})
+            self._dirty = set()
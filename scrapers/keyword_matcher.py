@@ -0,0 +1,130 @@
+import re
+
+# 키워드가 이 개수 이하이면 search()는 정규식 대신 단순 부분문자열 검사를 사용
+# (키워드가 적을 때는 C로 구현된 str.__contains__가 정규식 스캔보다 빠름)
+SUBSTRING_SCAN_LIMIT = 48
+
+
+def normalize_keywords(keywords):
+    """
+    AI가 돌려준 키워드를 평탄화된 문자열 리스트로 정리합니다.
+    (문자열 하나, 중첩 리스트 등이 섞여 올 수 있음)
+    """
+    if isinstance(keywords, str):
+        keywords = [keywords]
+    flat = []
+    for keyword in keywords or []:
+        if isinstance(keyword, (list, tuple)):
+            flat.extend(str(k) for k in keyword)
+        elif keyword is not None:
+            flat.append(str(keyword))
+    return [k.strip() for k in flat if k and k.strip()]
+
+
+def _trie_regex(terms):
+    """
+    키워드들을 접두사 트리로 묶은 정규식을 만듭니다.
+    예: ["ai", "ai agents", "apple"] -> a(?:i(?: agents)?|pple)
+    각 분기는 서로 다른 글자로 시작하므로 역추적이 폭증하지 않고, 긴 키워드가 먼저 매칭됩니다.
+    """
+    trie = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def build(node):
+        is_end = '' in node
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch != '']
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if is_end:
+            return '(?:' + body + ')?'
+        return body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """
+    확장 키워드를 한 번만 컴파일해두고 여러 텍스트에 재사용하는 매처입니다.
+
+    - case_sensitive=False: 대소문자 무시 (casefold)
+    - word_boundary=True: 단어 경계에서만 매칭 ("AI"가 "said"에 걸리지 않음)
+    """
+    def __init__(self, keywords, case_sensitive=False, word_boundary=False):
+        self.keywords = normalize_keywords(keywords)
+        self.case_sensitive = case_sensitive
+        self.word_boundary = word_boundary
+
+        # 정규화된 키워드 -> 원래 키워드들 (대소문자만 다른 중복 키워드 처리)
+        self._originals = {}
+        for keyword in self.keywords:
+            self._originals.setdefault(self._fold(keyword), []).append(keyword)
+        terms = sorted(self._originals)
+        self._terms = terms
+        self._use_substring = not word_boundary and len(terms) <= SUBSTRING_SCAN_LIMIT
+
+        # 같은 위치에서 시작하는 짧은 키워드 (예: "ai agents" 매칭 시 "ai"도 보고)
+        self._prefixes = {t: [p for p in terms if p != t and t.startswith(p)] for t in terms}
+
+        self._search_re = None
+        self._scan_re = None
+        if terms:
+            pattern = _trie_regex(terms)
+            if word_boundary:
+                pattern = rf"(?<!\w){pattern}(?!\w)"
+            self._search_re = re.compile(pattern)
+            # 전방탐색으로 감싸면 겹치는 매칭도 모든 위치에서 찾을 수 있음
+            self._scan_re = re.compile(f"(?=({pattern}))")
+
+    def _fold(self, text):
+        return text if self.case_sensitive else text.casefold()
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def __repr__(self):
+        return f"KeywordMatcher({self.keywords!r}, case_sensitive={self.case_sensitive}, word_boundary={self.word_boundary})"
+
+    def search(self, text):
+        """
+        키워드가 하나라도 포함되어 있으면 True.
+        """
+        if self._search_re is None or not text:
+            return False
+        text = self._fold(text)
+        if self._use_substring:
+            return any(term in text for term in self._terms)
+        return self._search_re.search(text) is not None
+
+    def counts(self, text):
+        """
+        키워드별 등장 횟수 {원래 키워드: 횟수}를 반환합니다 (등장한 키워드만).
+        """
+        if self._scan_re is None or not text:
+            return {}
+        hits = {}
+        for m in self._scan_re.finditer(self._fold(text)):
+            term = m.group(1)
+            hits[term] = hits.get(term, 0) + 1
+            for prefix in self._prefixes[term]:
+                # 단어 경계 모드에서는 짧은 키워드 뒤도 경계여야 함
+                if self.word_boundary and re.match(r'\w', term[len(prefix)]):
+                    continue
+                hits[prefix] = hits.get(prefix, 0) + 1
+
+        result = {}
+        for keyword in self.keywords:
+            count = hits.get(self._fold(keyword))
+            if count:
+                result[keyword] = count
+        return result
+
+    def matches(self, text):
+        """
+        텍스트에 등장한 키워드 리스트를 (입력 순서대로) 반환합니다.
+        """
+        return list(self.counts(text))
@@ -1,81 +1,301 @@
 import feedparser
+import requests
+import threading
+import time
+import urllib3
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 from datetime import datetime, timedelta
 import ssl
+import xml.etree.ElementTree as ET
+from config import STREAMING_FEEDS
+from scrapers.keyword_matcher import KeywordMatcher
+from scrapers.stream_parser import FeedStream
 
 # SSL 인증 우회 (로컬 개발용)
 if hasattr(ssl, '_create_unverified_context'):
     ssl._create_default_https_context = ssl._create_unverified_context
+# requests도 동일하게 검증을 끄므로 경고 메시지 숨김
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-def fetch_rss_news(feeds, keywords, days_limit=7):
+# 동시 수집 설정
+FETCH_WORKERS = 8       # 전체 동시 작업 수
+PER_HOST_LIMIT = 2      # 같은 호스트에 동시에 여는 연결 수
+FEED_TIMEOUT = 15       # 피드 1개당 최대 대기 시간 (초)
+STREAM_MIN_BYTES = 2 * 1024 * 1024  # 이 크기 이상인 응답은 스트리밍 파싱
+
+DEFAULT_IMAGE = "https://images.unsplash.com/photo-1518770660439-4636190af475?ixlib=rb-4.0.3&auto=format&fit=crop&w=800&q=80" # Tech/Chip default image
+
+
+class HostLimiter:
     """
-    RSS 피드에서 키워드와 연관된 최신 뉴스를 가져옵니다.
+    호스트별 동시 연결 수를 제한하는 세마포어 모음입니다.
+    """
+    def __init__(self, per_host=PER_HOST_LIMIT):
+        self.per_host = per_host
+        self._lock = threading.Lock()
+        self._semaphores = {}
+
+    def get(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.per_host)
+            return self._semaphores[host]
+
+
+def _iter_body(resp, deadline, timeout, chunk_size=64 * 1024):
+    """
+    본문을 조각 단위로 읽습니다. 읽기마다 소켓 타임아웃을 남은 시간으로 줄이므로,
+    바이트를 조금씩 흘려보내는 서버도 deadline을 넘겨 붙잡아 두지 못합니다.
+    """
+    raw = resp.raw
+    sock = getattr(raw.connection, 'sock', None)
+    # read1: 받은 만큼 바로 반환 (read는 chunk_size가 찰 때까지 여러 번 기다림)
+    # urllib3 1.26에는 read1이 없음 -> read로 대신 (조각 하나를 기다리는 동안은 deadline이 늦게 적용될 수 있음)
+    read = getattr(raw, 'read1', None) or raw.read
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"feed download exceeded {timeout}s")
+        if sock is not None:
+            sock.settimeout(remaining)
+        chunk = read(chunk_size, decode_content=True)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _stream_entries(feed_url, resp, deadline, timeout, date_cutoff):
+    """
+    본문을 모으지 않고 받는 즉시 파싱합니다. date_cutoff보다 오래된 엔트리가 이어지면 나머지는 받지 않습니다.
+    """
+    stream = FeedStream(date_cutoff)
+    entries = list(stream.iter_entries(_iter_body(resp, deadline, timeout)))
+    for entry in entries:
+        entry['image'] = entry['image'] or DEFAULT_IMAGE
+    print(f"[STREAM] {feed_url}: {len(entries)}/{stream.entries_parsed} entries"
+          + (" (stopped at date cutoff)" if stream.stopped_early else ""))
+    return {'source': stream.source, 'entries': entries}
+
+
+def download_feed(session, feed_url, limiter, timeout=FEED_TIMEOUT, cache=None, date_cutoff=None, stream=False):
+    """
+    피드 1개를 내려받습니다. timeout은 연결~본문 수신까지 전체에 적용됩니다.
+    cache가 있으면 조건부 요청을 보내고, 304 응답이면 not_modified=True로 표시합니다.
+    stream이 True이거나 응답이 STREAM_MIN_BYTES 이상이면 본문 대신 파싱된 엔트리를 stream 필드에 담습니다
+    (XML 문법 오류가 있는 피드는 다시 내려받아 feedparser로 처리).
+    실패해도 예외를 던지지 않고 error 필드에 담아 반환합니다.
+    """
+    result = {'url': feed_url, 'content': None, 'headers': {}, 'not_modified': False, 'error': None, 'stream': None}
+    request_headers = cache.conditional_headers(feed_url) if cache else {}
+    with limiter.get(feed_url):
+        deadline = time.monotonic() + timeout
+        try:
+            with session.get(feed_url, headers=request_headers, timeout=timeout, stream=True, verify=False) as resp:
+                if resp.status_code == 304 and request_headers:
+                    result['not_modified'] = True
+                    return result
+                resp.raise_for_status()
+                if stream or int(resp.headers.get('Content-Length') or 0) >= STREAM_MIN_BYTES:
+                    try:
+                        result['stream'] = _stream_entries(feed_url, resp, deadline, timeout, date_cutoff)
+                        result['headers'] = dict(resp.headers)
+                        return result
+                    except ET.ParseError as e:
+                        print(f"[STREAM] {feed_url}: not well-formed XML ({e}), falling back to feedparser")
+                else:
+                    result['content'] = b"".join(_iter_body(resp, deadline, timeout))
+                    result['headers'] = dict(resp.headers)
+                    return result
+            # 스트리밍 파싱 실패 -> 전체를 다시 받아 관대한 파서(feedparser)로
+            with session.get(feed_url, timeout=timeout, stream=True, verify=False) as resp:
+                resp.raise_for_status()
+                result['content'] = b"".join(_iter_body(resp, deadline, timeout))
+                result['headers'] = dict(resp.headers)
+        except Exception as e:
+            result['error'] = e
+    return result
+
+
+def _entry_image(entry):
+    # 이미지 추출 (media_content > enclosures > summary img)
+    if entry.get('media_content'):
+        if 'url' in entry.media_content[0]:
+            return entry.media_content[0]['url']
+    elif entry.get('media_thumbnail'):
+        if 'url' in entry.media_thumbnail[0]:
+            return entry.media_thumbnail[0]['url']
+    elif 'links' in entry:
+        for link in entry.links:
+            if link.get('type', '').startswith('image/'):
+                return link.get('href', DEFAULT_IMAGE)
+    return DEFAULT_IMAGE
+
+
+def _entry_record(entry):
+    """
+    feedparser 엔트리를 필터링에 필요한 값만 담은 가벼운 dict로 변환합니다.
+    """
+    # 날짜 (published_parsed 우선, 없으면 updated_parsed)
+    published_date = None
+    if entry.get('published_parsed'):
+        published_date = datetime(*entry.published_parsed[:6])
+    elif entry.get('updated_parsed'):
+        published_date = datetime(*entry.updated_parsed[:6])
+
+    return {
+        'title': entry.get('title', ''),
+        'link': entry.get('link'),
+        'summary': entry.get('summary', ''),
+        'published': published_date,
+        'image': _entry_image(entry),
+    }
+
+
+def parse_feed(download, cache=None):
+    """
+    내려받은 피드 본문을 파싱하여 {'url', 'source', 'entries', 'error'} 형태로 반환합니다.
+    304(변경 없음) 응답이면 캐시에 저장된 엔트리를 그대로 돌려줍니다.
+    """
+    parsed = {'url': download['url'], 'source': 'Unknown Source', 'entries': [],
+              'not_modified': download['not_modified'], 'error': download['error']}
+    if download['error'] is not None:
+        return parsed
+
+    if download.get('stream') is not None:
+        parsed.update(download['stream'])
+        if cache is not None:
+            cache.store(download['url'], download['headers'], parsed['source'], parsed['entries'])
+        return parsed
+
+    if download['not_modified']:
+        cached = cache.get(download['url']) if cache else None
+        if cached is not None:
+            parsed.update(cached)
+            return parsed
+        parsed['error'] = RuntimeError("304 Not Modified but no cached copy")
+        return parsed
+
+    try:
+        feed = feedparser.parse(download['content'], response_headers=download['headers'])
+        parsed['source'] = feed.feed.get('title', 'Unknown Source')
+        parsed['entries'] = [_entry_record(entry) for entry in feed.entries]
+        if cache is not None:
+            cache.store(download['url'], download['headers'], parsed['source'], parsed['entries'])
+    except Exception as e:
+        parsed['error'] = e
+    return parsed
+
+
+def fetch_feeds(feeds, max_workers=FETCH_WORKERS, per_host=PER_HOST_LIMIT, timeout=FEED_TIMEOUT, cache=None,
+                date_cutoff=None, streaming_feeds=STREAMING_FEEDS):
+    """
+    모든 피드를 동시에 내려받고 파싱합니다.
+    각 작업은 다운로드가 끝나는 즉시 파싱을 시작하므로, 느린 피드를 기다리는 동안 다른 피드 파싱이 진행됩니다.
+    결과는 입력한 feeds 순서 그대로 반환됩니다.
+    cache(FeedCache)를 넘기면 조건부 요청을 사용하고, 끝나면 캐시를 디스크에 저장합니다.
+    streaming_feeds(또는 큰 응답)는 받으면서 파싱하고, date_cutoff보다 오래된 엔트리가 이어지면 거기서 멈춥니다.
+    """
+    if not feeds:
+        return []
+    limiter = HostLimiter(per_host)
+    workers = min(max_workers, len(feeds))
+
+    with requests.Session() as session:
+        adapter = requests.adapters.HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers['User-Agent'] = feedparser.USER_AGENT
+
+        def work(feed_url):
+            download = download_feed(session, feed_url, limiter, timeout, cache, date_cutoff,
+                                     stream=feed_url in streaming_feeds)
+            return parse_feed(download, cache)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(work, feeds))
+
+    if cache is not None:
+        not_modified = sum(1 for r in results if r['error'] is None and r['not_modified'])
+        print(f"[CACHE] {not_modified}/{len(results)} feeds not modified (served from cache)")
+        cache.save()
+    return results
+
+
+def filter_entries(feed_results, matcher, date_cutoff, verbose=False):
+    """
+    파싱된 피드 결과(fetch_feeds)에서 기간 안에 있고 키워드에 맞는 엔트리만 뉴스 항목으로 만듭니다.
+    같은 피드 결과를 여러 키워드 매처로 반복 필터링할 수 있습니다 (배치 모드).
+    결과 순서는 피드 순서 그대로이고, 같은 링크는 한 번만 담습니다.
     """
     news_items = []
     seen_links = set()
-    
+
+    for feed in feed_results:
+        if feed['error'] is not None:
+            continue
+
+        for entry in feed['entries']:
+            link = entry['link']
+            # 링크가 없거나 이미 본 링크면 스킵
+            if not link or link in seen_links:
+                continue
+
+            published_date = entry['published']
+            # 날짜가 파싱되었고, 제한보다 오래된 경우에만 스킵 (날짜 파싱 실패하면 가져오도록 변경 - 최신순 정렬이라 가정)
+            if published_date and published_date < date_cutoff:
+                continue
+
+            # 키워드 필터링 (제목 또는 요약에 키워드가 포함되어 있는지)
+            title = entry['title']
+            summary = entry['summary']
+            content_text = title + " " + summary
+
+            if verbose:
+                # [DEBUG]
+                print(f"[DEBUG] Checking: {title} ({published_date})")
+
+            # 키워드 중 하나라도 포함되면 수집
+            if matcher.search(content_text):
+                news_items.append({
+                    'title': title,
+                    'link': link,
+                    'published': published_date.strftime('%Y-%m-%d') if published_date else 'Recent',
+                    'summary': summary[:200] + "..." if len(summary) > 200 else summary,
+                    'source': feed['source'],
+                    'image': entry['image']
+                })
+                seen_links.add(link)
+
+    return news_items
+
+
+def fetch_rss_news(feeds, keywords, days_limit=7, max_workers=FETCH_WORKERS, per_host=PER_HOST_LIMIT, timeout=FEED_TIMEOUT, cache=None, seen=None, scope=""):
+    """
+    RSS 피드에서 키워드와 연관된 최신 뉴스를 가져옵니다.
+    keywords에는 키워드 리스트 또는 미리 컴파일한 KeywordMatcher를 넘길 수 있습니다.
+    cache(FeedCache)를 넘기면 변경되지 않은 피드는 다시 내려받지 않습니다.
+    seen(SeenEntries)을 넘기면 같은 주제(scope)의 이전 실행에서 처리한 엔트리는 건너뜁니다 (발행 후 seen.commit() 필요).
+    """
+    # 키워드는 한 번만 컴파일 (엔트리마다 lower() 반복 X)
+    matcher = keywords if isinstance(keywords, KeywordMatcher) else KeywordMatcher(keywords)
+    keywords = matcher.keywords
+
     # 날짜 제한 계산
     date_cutoff = datetime.now() - timedelta(days=days_limit)
-    
+
     print(f"[SEARCH] Scraping {len(feeds)} feeds for keywords: {keywords}")
 
-    for feed_url in feeds:
-        try:
-            feed = feedparser.parse(feed_url)
-            
-            for entry in feed.entries:
-                # 이미 본 링크면 스킵
-                if entry.link in seen_links:
-                    continue
-                
-                # 날짜 필터링 (published_parsed 사용)
-                published_date = None
-                if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                    published_date = datetime(*entry.published_parsed[:6])
-                elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                    published_date = datetime(*entry.updated_parsed[:6])
-                
-                # 날짜가 파싱되었고, 제한보다 오래된 경우에만 스킵 (날짜 파싱 실패하면 가져오도록 변경 - 최신순 정렬이라 가정)
-                if published_date and published_date < date_cutoff:
-                    continue
-                
-                # 키워드 필터링 (제목 또는 요약에 키워드가 포함되어 있는지)
-                title = entry.get('title', '')
-                summary = entry.get('summary', '')
-                content_text = (title + " " + summary).lower()
-                
-                # [DEBUG]
-                print(f"[DEBUG] Checking: {title} ({published_date})")
-                
-                # 이미지 추출 (media_content > enclosures > summary img)
-                image_url = "https://images.unsplash.com/photo-1518770660439-4636190af475?ixlib=rb-4.0.3&auto=format&fit=crop&w=800&q=80" # Tech/Chip default image
-                
-                if hasattr(entry, 'media_content') and entry.media_content:
-                    if 'url' in entry.media_content[0]:
-                        image_url = entry.media_content[0]['url']
-                elif hasattr(entry, 'media_thumbnail') and entry.media_thumbnail:
-                    if 'url' in entry.media_thumbnail[0]:
-                        image_url = entry.media_thumbnail[0]['url']
-                elif 'links' in entry:
-                    for link in entry.links:
-                        if link.type.startswith('image/'):
-                            image_url = link.href
-                            break
-                            
-                # 키워드 중 하나라도 포함되면 수집
-                if any(k.lower() in content_text for k in keywords):
-                    news_items.append({
-                        'title': title,
-                        'link': entry.link,
-                        'published': published_date.strftime('%Y-%m-%d') if published_date else 'Recent',
-                        'summary': summary[:200] + "..." if len(summary) > 200 else summary,
-                        'source': feed.feed.get('title', 'Unknown Source'),
-                        'image': image_url
-                    })
-                    seen_links.add(entry.link)
-                    
-        except Exception as e:
-            print(f"[ERROR] Error parsing {feed_url}: {e}")
-            continue
+    # 다운로드/파싱은 병렬로, 필터링은 피드 순서대로 (결과 순서 고정)
+    results = fetch_feeds(feeds, max_workers=max_workers, per_host=per_host, timeout=timeout, cache=cache,
+                          date_cutoff=date_cutoff)
+    for feed in results:
+        if feed['error'] is not None:
+            print(f"[ERROR] Error parsing {feed['url']}: {feed['error']}")
+    if seen is not None:
+        results = seen.exclude_seen(results, scope)
 
+    news_items = filter_entries(results, matcher, date_cutoff, verbose=True)
     print(f"[OK] Found {len(news_items)} relevant news items.")
     return news_items
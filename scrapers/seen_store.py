@@ -0,0 +1,101 @@
+import os
+import threading
+from datetime import datetime, timedelta
+from storage import CACHE_DIR, load_json, update_json
+
+SEEN_ENTRIES_FILE = os.path.join(CACHE_DIR, "seen_entries.json")
+# 수집 기간(days_limit=7)보다 길게 보관 -> 만료된 링크는 이미 기간 밖이라 다시 들어오지 않음
+SEEN_ENTRY_DAYS = int(os.getenv("SEEN_ENTRY_DAYS", 14))
+
+
+def _feed_key(scope, feed_url):
+    # 주제(scope, 보통 기본 키워드)별 기록: 대소문자/앞뒤 공백 무시
+    return f"{(scope or '').strip().lower()}\t{feed_url}"
+
+
+class SeenEntries:
+    """
+    주제와 피드 URL별로 이미 처리한 엔트리 링크(처음 본 시각)를 디스크에 보관합니다.
+    같은 주제의 다음 실행에서는 새 엔트리만 키워드 매칭/요약으로 넘겨, 오전/오후 뉴스레터에 같은 기사가 반복되지 않게 합니다.
+    주제별로 따로 기억하므로, 한 주제 실행에서 훑은 엔트리가 다른 주제 실행에서 빠지지 않습니다.
+    exclude_seen()에서 걸러낸 새 엔트리는 바로 기록하지 않고, 발행이 끝난 뒤 commit()해야 저장됩니다
+    (실행이 중간에 실패하면 다음 실행에서 다시 처리).
+    """
+    def __init__(self, path=SEEN_ENTRIES_FILE, days=SEEN_ENTRY_DAYS, clock=datetime.now):
+        self.path = path
+        self.days = days
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._feeds = load_json(path, default={}) or {}
+        self._pending = {}
+
+    def __contains__(self, key):
+        scope, feed_url, link = key
+        return link in self._feeds.get(_feed_key(scope, feed_url), {})
+
+    def exclude_seen(self, feed_results, scope=""):
+        """
+        fetch_feeds 결과에서 같은 주제로 이미 처리한 엔트리를 뺀 결과를 돌려줍니다 (원본은 그대로).
+        남은 엔트리는 commit() 대기 목록에 올립니다.
+        """
+        filtered = []
+        skipped = 0
+        with self._lock:
+            for feed in feed_results:
+                if feed['error'] is not None:
+                    filtered.append(feed)
+                    continue
+                key = _feed_key(scope, feed['url'])
+                seen = self._feeds.get(key, {})
+                pending = self._pending.setdefault(key, set())
+                new_entries = []
+                for entry in feed['entries']:
+                    if entry['link'] in seen:
+                        skipped += 1
+                        continue
+                    new_entries.append(entry)
+                    if entry['link']:
+                        pending.add(entry['link'])
+                filtered.append(dict(feed, entries=new_entries))
+        print(f"[SEEN] Skipped {skipped} entries already processed in earlier runs")
+        return filtered
+
+    def commit(self):
+        """
+        대기 중인 엔트리를 처리 완료로 기록하고, 보관 기간이 지난 기록은 지운 뒤 저장합니다.
+        저장은 파일 잠금 안에서 디스크의 최신 내용에 합치므로, 동시에 실행된 다른 작업의 기록도 유지됩니다.
+        """
+        now = self.clock()
+        stamp = now.isoformat(timespec='seconds')
+        cutoff = (now - timedelta(days=self.days)).isoformat(timespec='seconds')
+
+        def merge(feeds):
+            # 주제 구분이 없던 이전 형식의 기록(키가 피드 URL뿐)은 버림
+            feeds = {key: links for key, links in (feeds or {}).items() if "\t" in key}
+            for key, links in pending.items():
+                seen = feeds.setdefault(key, {})
+                for link in links:
+                    seen.setdefault(link, stamp)
+            # ISO 문자열은 시간순 비교 가능
+            for key in list(feeds):
+                seen = {link: first_seen for link, first_seen in feeds[key].items() if first_seen >= cutoff}
+                if seen:
+                    feeds[key] = seen
+                else:
+                    del feeds[key]
+            return feeds
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._feeds = update_json(self.path, merge, default={})
+
+    def discard(self, scope=None):
+        """
+        대기 목록을 버립니다 (발행하지 못한 실행). scope를 주면 그 주제의 대기분만 버립니다.
+        """
+        with self._lock:
+            if scope is None:
+                self._pending = {}
+            else:
+                prefix = _feed_key(scope, "")
+                self._pending = {key: links for key, links in self._pending.items() if not key.startswith(prefix)}
@@ -0,0 +1,180 @@
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# 기간(date_cutoff)보다 오래된 엔트리가 이만큼 연속으로 나오면 나머지는 읽지 않음
+# (피드는 보통 최신순이지만, 순서가 약간 섞여 있어도 바로 멈추지 않도록 여유)
+OLD_ENTRY_LIMIT = 3
+
+ENTRY_TAGS = {'item', 'entry'}        # RSS 2.0 / RSS 1.0(RDF) / Atom
+FEED_TAGS = {'channel', 'feed'}
+
+
+def _local(tag):
+    # '{namespace}name' -> 'name'
+    return tag.rsplit('}', 1)[-1]
+
+
+def _text(element):
+    if element is None:
+        return ''
+    if len(element):
+        # Atom type="xhtml" 처럼 본문이 하위 요소인 경우
+        return ''.join(element.itertext()).strip()
+    return (element.text or '').strip()
+
+
+def parse_date(text):
+    """
+    RSS(RFC 822) / Atom(ISO 8601) 날짜를 UTC 기준 naive datetime으로 (feedparser의 *_parsed와 같은 기준).
+    """
+    if not text:
+        return None
+    text = text.strip()
+    try:
+        parsed = parsedate_to_datetime(text)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(text.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _entry_record(item):
+    """
+    <item>/<entry> 요소를 scrapers.news._entry_record와 같은 형태의 dict로 변환합니다 (이미지가 없으면 None).
+    """
+    children = {}
+    links = []
+    media = []
+    for child in item:
+        name = _local(child.tag)
+        if name == 'link':
+            links.append(child)
+        elif name in ('content', 'thumbnail') and child.get('url'):
+            # media:content / media:thumbnail (Atom content는 url 속성이 없음)
+            media.append((name, child.get('url')))
+        elif name == 'enclosure':
+            links.append(child)
+        children.setdefault(name, child)
+
+    # 링크: RSS는 <link> 텍스트, Atom은 rel="alternate"(또는 rel 없음)의 href
+    link = None
+    for element in links:
+        if _local(element.tag) != 'link':
+            continue
+        if element.get('href') is None:
+            link = _text(element) or None
+        elif element.get('rel') in (None, 'alternate'):
+            link = element.get('href')
+        if link:
+            break
+
+    published = None
+    for name in ('pubDate', 'published', 'date', 'updated'):
+        if name in children:
+            published = parse_date(_text(children[name]))
+            if published:
+                break
+
+    summary = ''
+    for name in ('description', 'summary', 'encoded', 'content'):
+        if name in children:
+            summary = _text(children[name])
+            if summary:
+                break
+
+    # 이미지 (media:content > media:thumbnail > 이미지 enclosure/link)
+    image = None
+    for kind in ('content', 'thumbnail'):
+        image = next((url for name, url in media if name == kind), None)
+        if image:
+            break
+    if not image:
+        for element in links:
+            if (element.get('type') or '').startswith('image/'):
+                image = element.get('href') or element.get('url')
+                if image:
+                    break
+
+    return {
+        'title': _text(children.get('title')),
+        'link': link,
+        'summary': summary,
+        'published': published,
+        'image': image,
+    }
+
+
+class FeedStream:
+    """
+    RSS/Atom 문서를 조각(bytes) 단위로 받아 엔트리를 하나씩 만들어 내는 증분 파서입니다.
+    처리한 엔트리 요소는 바로 버리므로 피드 크기와 상관없이 메모리 사용량이 일정하고,
+    date_cutoff보다 오래된 엔트리가 OLD_ENTRY_LIMIT개 연속으로 나오면 stopped_early=True로 멈춥니다.
+    """
+    def __init__(self, date_cutoff=None, old_entry_limit=OLD_ENTRY_LIMIT):
+        self.date_cutoff = date_cutoff
+        self.old_entry_limit = old_entry_limit
+        self.source = 'Unknown Source'
+        self.stopped_early = False
+        self.entries_parsed = 0
+        self._old_streak = 0
+        self._stack = []
+        self._parser = ET.XMLPullParser(events=('start', 'end'))
+
+    def feed(self, chunk):
+        """
+        조각을 넣고 이번에 완성된 엔트리 리스트를 돌려줍니다 (멈춘 뒤에는 빈 리스트).
+        """
+        if self.stopped_early:
+            return []
+        self._parser.feed(chunk)
+        return self._drain()
+
+    def close(self):
+        if self.stopped_early:
+            return []
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self):
+        records = []
+        for event, element in self._parser.read_events():
+            if event == 'start':
+                self._stack.append(element)
+                continue
+            self._stack.pop()
+            name = _local(element.tag)
+            parent = self._stack[-1] if self._stack else None
+
+            if name in ENTRY_TAGS:
+                record = _entry_record(element)
+                self.entries_parsed += 1
+                # 처리한 엔트리는 트리에서 떼어내 메모리 해제
+                element.clear()
+                if parent is not None:
+                    parent.remove(element)
+                if self.date_cutoff and record['published'] and record['published'] < self.date_cutoff:
+                    self._old_streak += 1
+                    if self._old_streak >= self.old_entry_limit:
+                        self.stopped_early = True
+                        break
+                    continue
+                self._old_streak = 0
+                records.append(record)
+            elif name == 'title' and parent is not None and _local(parent.tag) in FEED_TAGS:
+                self.source = _text(element) or self.source
+        return records
+
+    def iter_entries(self, chunks):
+        """
+        chunks(bytes 반복자)를 읽으면서 엔트리를 하나씩 돌려줍니다. 멈추면 나머지 조각은 읽지 않습니다.
+        """
+        for chunk in chunks:
+            yield from self.feed(chunk)
+            if self.stopped_early:
+                return
+        yield from self.close()
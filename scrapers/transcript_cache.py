@@ -0,0 +1,51 @@
+import os
+import threading
+from datetime import datetime
+from storage import CACHE_DIR, load_json, update_json
+
+TRANSCRIPT_CACHE_FILE = os.path.join(CACHE_DIR, "transcript_cache.json")
+
+
+class TranscriptCache:
+    """
+    video_id별 자막 텍스트를 디스크에 보관합니다.
+    같은 영상이 다른 키워드나 다른 날 다시 검색되어도 자막은 한 번만 내려받습니다.
+    (자막이 없던 영상은 나중에 생길 수 있으므로 저장하지 않음)
+    """
+    def __init__(self, path=TRANSCRIPT_CACHE_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._videos = load_json(path, default={}) or {}
+        self._dirty = set()  # 이번 실행에서 새로 받은 video_id
+
+    def __contains__(self, video_id):
+        return video_id in self._videos
+
+    def get(self, video_id):
+        cached = self._videos.get(video_id)
+        return cached['text'] if cached else None
+
+    def put(self, video_id, text):
+        with self._lock:
+            self._videos[video_id] = {
+                'text': text,
+                'fetched_at': datetime.now().isoformat(timespec='seconds'),
+            }
+            self._dirty.add(video_id)
+
+    def save(self):
+        """
+        새로 받은 자막만 디스크의 최신 내용에 합쳐 저장합니다 (다른 작업 프로세스가 저장한 자막은 유지).
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            updates = {video_id: self._videos[video_id] for video_id in self._dirty}
+
+            def merge(videos):
+                videos = videos or {}
+                videos.update(updates)
+                return videos
+
+            self._videos = update_json(self.path, merge, default={})
+            self._dirty = set()
@@ -1,78 +1,135 @@
+from concurrent.futures import ThreadPoolExecutor
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_search import YoutubeSearch
 
-def fetch_youtube_videos(keywords, limit=2):
+YOUTUBE_WORKERS = 4          # 검색/자막 동시 작업 수
+TRANSCRIPT_CHARS = 1000      # 요약용으로 사용할 자막 길이
+
+
+def search_videos(keyword, max_results):
+    """
+    기본 검색 클라이언트 (youtube-search).
+    """
+    return YoutubeSearch(str(keyword), max_results=max_results).to_dict()
+
+
+def fetch_transcript(video_id):
+    """
+    기본 자막 클라이언트 (youtube-transcript-api). 자막을 하나의 문자열로 합쳐 반환합니다.
+    """
+    if hasattr(YouTubeTranscriptApi, 'get_transcript'):
+        # 0.x 버전 API
+        transcript_list = YouTubeTranscriptApi.get_transcript(video_id, languages=['ko', 'en'])
+    else:
+        # 1.x 버전 API
+        transcript_list = YouTubeTranscriptApi().fetch(video_id, languages=['ko', 'en']).to_raw_data()
+    return " ".join([t['text'] for t in transcript_list])
+
+
+def _thumbnail(video, video_id):
+    # 썸네일 추출 (high resolution preferred)
+    image_url = f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
+    try:
+        if 'thumbnails' in video and video['thumbnails']:
+            thumbnails = video['thumbnails']
+            if isinstance(thumbnails, list):
+                image_url = thumbnails[-1]['url'] if thumbnails else image_url
+            elif isinstance(thumbnails, dict): # 가끔 dict로 올 수 있음
+                # dict인 경우 'high', 'maxres' 등의 키가 있는지 확인하거나 url 키 확인
+                if 'url' in thumbnails:
+                    image_url = thumbnails['url']
+                # 만약 thumbnails가 list가 아니라면 그냥 기본 이미지 사용
+    except Exception as e:
+        print(f"[DEBUG] Thumbnail extraction failed: {e}")
+    return image_url
+
+
+def fetch_youtube_videos(keywords, limit=2, search=search_videos, get_transcript=fetch_transcript,
+                         cache=None, max_workers=YOUTUBE_WORKERS):
     """
     유튜브에서 관련 영상을 검색하고 자막(Transcript)을 가져옵니다.
+    검색과 자막 다운로드는 max_workers개까지 동시에 실행되며,
+    cache(TranscriptCache)가 있으면 이미 받은 영상의 자막은 다시 내려받지 않습니다.
+    search / get_transcript는 테스트용 가짜 클라이언트로 교체할 수 있습니다.
     """
-    video_data = []
-    
     print(f"[SEARCH] Searching YouTube for: {keywords}")
-    
+
+    if isinstance(keywords, str):
+        keywords = [keywords]
+    search_keywords = []
     for keyword in keywords[:2]: # 너무 많이 검색하면 느리므로 상위 2개 키워드만
+        # 키워드가 문자열인지 확인 (리스트인 경우 첫 번째 요소 사용) -> AI가 리스트로 줄 수도 있음
+        if isinstance(keyword, list):
+            keyword = keyword[0]
+        search_keywords.append(keyword)
+
+    def run_search(keyword):
         try:
-            # 키워드가 문자열인지 확인 (리스트인 경우 첫 번째 요소 사용) -> AI가 리스트로 줄 수도 있음
-            if isinstance(keyword, list):
-               keyword = keyword[0]
-            
-            # YoutubeSearch 사용
-            results = YoutubeSearch(str(keyword), max_results=limit).to_dict()
-            print(f"[DEBUG] results type: {type(results)}")
-            if isinstance(results, list) and len(results) > 0:
-                 print(f"[DEBUG] first item type: {type(results[0])}")
-                 if isinstance(results[0], str): # 리스트의 요소가 문자열이면 (아마도 키값?)
-                     print(f"[DEBUG] contents: {results}")
+            results = search(keyword, limit)
             if isinstance(results, dict):
-                 print(f"[DEBUG] results is dict. keys: {results.keys()}")
-                 # 만약 딕셔너리라면 리스트가 아닐 수 있음. 보통은 리스트를 반환함.
-            
+                print(f"[DEBUG] results is dict. keys: {results.keys()}")
+            return results
+        except Exception as e:
+            print(f"[ERROR] Error searching for {keyword}: {e}")
+            return []
+
+    def run_transcript(video_id):
+        try:
+            return video_id, get_transcript(video_id)[:TRANSCRIPT_CHARS]
+        except Exception:
+            return video_id, None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # 1. 키워드 검색 (동시 실행, 결과 순서는 키워드 순서 유지)
+        videos = []
+        for results in executor.map(run_search, search_keywords):
             for video in results:
                 if not isinstance(video, dict):
                     print(f"[DEBUG] Skipping item of type {type(video)}: {video}")
                     continue
-                    
                 # youtube-search의 결과 딕셔너리 구조에 맞게 수정
-                video_id = video.get('id')
-                if not video_id: continue
-                
-                title = video.get('title', 'No Title')
-                # url_suffix는 '/watch?v=...' 형태임
-                link = f"https://www.youtube.com{video.get('url_suffix', '')}"
-                
-                # 자막 추출 시도
-                transcript_text = ""
-                try:
-                    transcript_list = YouTubeTranscriptApi.get_transcript(video_id, languages=['ko', 'en'])
-                    # 자막 텍스트 합치기 (최대 1000자만 - 요약용)
-                    transcript_text = " ".join([t['text'] for t in transcript_list])[:1000] + "..."
-                except:
-                    transcript_text = "(No Transcript Available)"
-                    
-                # 썸네일 추출 (high resolution preferred)
-                image_url = f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
-                try:
-                    if 'thumbnails' in video and video['thumbnails']:
-                        thumbnails = video['thumbnails']
-                        if isinstance(thumbnails, list):
-                            image_url = thumbnails[-1]['url'] if thumbnails else image_url
-                        elif isinstance(thumbnails, dict): # 가끔 dict로 올 수 있음
-                            # dict인 경우 'high', 'maxres' 등의 키가 있는지 확인하거나 url 키 확인
-                            if 'url' in thumbnails:
-                                image_url = thumbnails['url']
-                            # 만약 thumbnails가 list가 아니라면 그냥 기본 이미지 사용
-                except Exception as e:
-                    print(f"[DEBUG] Thumbnail extraction failed: {e}")
-
-                video_data.append({
-                    'title': title,
-                    'link': link,
-                    'summary': f"[YouTube Video] {transcript_text}",
-                    'source': 'YouTube',
-                    'image': image_url
-                })
-        except Exception as e:
-            print(f"[ERROR] Error searching for {keyword}: {e}")
-            continue
-            
+                if video.get('id'):
+                    videos.append(video)
+
+        # 2. 자막 다운로드 (캐시에 없는 영상만, 같은 영상은 한 번만)
+        transcripts = {}
+        pending = []
+        for video in videos:
+            video_id = video['id']
+            if video_id in transcripts or video_id in pending: # 여러 키워드에 같은 영상
+                continue
+            if cache is not None and video_id in cache:
+                transcripts[video_id] = cache.get(video_id)
+            else:
+                pending.append(video_id)
+
+        for video_id, text in executor.map(run_transcript, pending):
+            transcripts[video_id] = text
+            if text is not None and cache is not None:
+                cache.put(video_id, text)
+
+    if cache is not None:
+        print(f"[CACHE] Transcripts: {len(transcripts) - len(pending)} cached, {len(pending)} downloaded")
+        cache.save()
+
+    video_data = []
+    for video in videos:
+        video_id = video['id']
+        title = video.get('title', 'No Title')
+        # url_suffix는 '/watch?v=...' 형태임
+        link = f"https://www.youtube.com{video.get('url_suffix', '')}"
+
+        # 자막 텍스트 (최대 1000자만 - 요약용)
+        text = transcripts.get(video_id)
+        transcript_text = text + "..." if text is not None else "(No Transcript Available)"
+
+        video_data.append({
+            'title': title,
+            'link': link,
+            'summary': f"[YouTube Video] {transcript_text}",
+            'source': 'YouTube',
+            'image': _thumbnail(video, video_id)
+        })
+
     print(f"[OK] Found {len(video_data)} videos.")
     return video_data
@@ -0,0 +1,82 @@
+import os
+import json
+import tempfile
+import contextlib
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# 캐시/상태 파일 기본 저장 위치 (git 추적 제외)
+CACHE_DIR = "cache"
+
+
+def load_json(path, default=None):
+    """
+    JSON 파일을 읽습니다. 파일이 없거나 깨져 있으면 default를 반환합니다.
+    """
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (json.JSONDecodeError, ValueError, OSError):
+        return default
+
+
+def save_json(path, data):
+    """
+    임시 파일에 쓴 뒤 교체하는 방식으로 저장합니다 (쓰는 도중 죽어도 기존 파일이 깨지지 않음).
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=".json")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+@contextlib.contextmanager
+def file_lock(path):
+    """
+    path + ".lock" 파일로 프로세스 간 배타 잠금을 겁니다 (스케줄러 작업 프로세스 여러 개가 같은 파일을 고칠 때).
+    같은 프로세스의 다른 스레드끼리도 배타적입니다.
+    """
+    lock_path = path + ".lock"
+    os.makedirs(os.path.dirname(lock_path) or ".", exist_ok=True)
+    with open(lock_path, 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)  # 10초 재시도 후 OSError
+                    break
+                except OSError:
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def update_json(path, update, default=None):
+    """
+    잠금을 잡은 채로 파일을 다시 읽어 update(data)의 결과를 저장하고 반환합니다.
+    시작할 때 읽어둔 내용을 그대로 덮어쓰지 않으므로, 다른 프로세스가 그 사이 저장한 내용이 사라지지 않습니다.
+    """
+    with file_lock(path):
+        data = update(load_json(path, default))
+        save_json(path, data)
+        return data
@@ -0,0 +1,259 @@
+import os
+import csv
+import sqlite3
+import threading
+from datetime import datetime
+from storage import file_lock
+
+SUBSCRIBERS_DB = "subscribers.db"
+LEGACY_SUBSCRIBERS_FILE = "subscribers.csv"
+SHEET_SYNC_INTERVAL = int(os.getenv("SHEET_SYNC_INTERVAL", 300))  # 초
+RECIPIENT_BATCH = 500
+
+
+def normalize_email(email):
+    return str(email).strip().lower()
+
+
+class SubscriberRepository:
+    """
+    구독자 저장소. 로컬 SQLite가 원본이고, 구글 시트와는 sync()로 양방향 동기화합니다.
+    - add(): 이메일 PRIMARY KEY로 중복 확인 + 추가를 한 번에 (네트워크 없음)
+    - iter_active(): 발송용 활성 구독자 이메일을 배치 단위로 스트리밍
+    - sync(sheet): 시트에만 있는 구독자는 가져오고, 아직 시트에 없는 로컬 구독자는 올림
+    """
+    def __init__(self, path=SUBSCRIBERS_DB):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS subscribers (
+                email_key TEXT PRIMARY KEY,     -- 소문자/공백 제거 (중복 판별용)
+                email TEXT NOT NULL,
+                nickname TEXT,
+                date TEXT,
+                status TEXT NOT NULL DEFAULT 'active',  -- active / unsubscribed
+                source TEXT,                    -- web / sheet / csv
+                synced INTEGER NOT NULL DEFAULT 0       -- 1이면 시트에도 있음
+            );
+            CREATE INDEX IF NOT EXISTS idx_subscribers_status ON subscribers(status, email_key);
+            CREATE INDEX IF NOT EXISTS idx_subscribers_unsynced ON subscribers(synced) WHERE synced = 0;
+            CREATE TABLE IF NOT EXISTS repo_state (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+        self._conn.commit()
+
+    # ---------------------------------------------------------------
+    # 쓰기
+    # ---------------------------------------------------------------
+    def _insert(self, email, nickname, date, source, synced):
+        cursor = self._conn.execute(
+            "INSERT OR IGNORE INTO subscribers (email_key, email, nickname, date, source, synced) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (normalize_email(email), str(email).strip(), nickname or "", date, source, synced),
+        )
+        return cursor.rowcount == 1
+
+    def add(self, email, nickname, source="web"):
+        """
+        반환값: 새로 추가했으면 True, 이미 구독 중이면 False
+        """
+        if not email or "@" not in str(email):
+            return False
+        with self._lock, self._conn:
+            return self._insert(email, nickname, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), source, 0)
+
+    def unsubscribe(self, email):
+        with self._lock, self._conn:
+            cursor = self._conn.execute("UPDATE subscribers SET status = 'unsubscribed' WHERE email_key = ?",
+                                        (normalize_email(email),))
+            return cursor.rowcount == 1
+
+    def import_csv(self, path=LEGACY_SUBSCRIBERS_FILE):
+        """
+        예전 subscribers.csv를 가져옵니다. 파일이 바뀌었을 때만 읽습니다 (이미 있는 주소는 무시).
+        """
+        if not os.path.exists(path):
+            return 0
+        stamp = f"{os.path.getsize(path)}:{os.stat(path).st_mtime_ns}"
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM repo_state WHERE key = ?", (f"csv:{path}",)).fetchone()
+            if row and row[0] == stamp:
+                return 0
+            added = 0
+            with self._conn:
+                with open(path, 'r', encoding='utf-8', newline='') as f:
+                    for record in csv.DictReader(f):
+                        email = (record.get('email') or "").strip()
+                        if "@" in email:
+                            added += self._insert(email, record.get('nickname'), record.get('date'), "csv", 0)
+                self._conn.execute("INSERT OR REPLACE INTO repo_state (key, value) VALUES (?, ?)",
+                                   (f"csv:{path}", stamp))
+        if added:
+            print(f"[SUBSCRIBERS] Imported {added} subscribers from {path}")
+        return added
+
+    # ---------------------------------------------------------------
+    # 조회
+    # ---------------------------------------------------------------
+    def __contains__(self, email):
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM subscribers WHERE email_key = ?",
+                                      (normalize_email(email),)).fetchone() is not None
+
+    def count(self, status="active"):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM subscribers WHERE status = ?", (status,)).fetchone()[0]
+
+    def iter_active(self, batch_size=RECIPIENT_BATCH):
+        """
+        활성 구독자 이메일을 하나씩 돌려줍니다.
+        키 기준 페이지 조회라서 발송이 오래 걸려도 커서/잠금을 잡고 있지 않고, 메모리에는 한 배치만 올라갑니다.
+        """
+        last_key = ""
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT email_key, email FROM subscribers WHERE status = 'active' AND email_key > ? "
+                    "ORDER BY email_key LIMIT ?",
+                    (last_key, batch_size),
+                ).fetchall()
+            if not rows:
+                return
+            for _, email in rows:
+                yield email
+            last_key = rows[-1][0]
+
+    def rows(self, status="active"):
+        """
+        관리자 화면용 [{email, nickname, date}] (가입일 순).
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT email, nickname, date FROM subscribers WHERE status = ? ORDER BY date, email_key", (status,))
+            return [{'email': e, 'nickname': n, 'date': d} for e, n, d in cursor]
+
+    # ---------------------------------------------------------------
+    # 구글 시트 동기화
+    # ---------------------------------------------------------------
+    def _sheet_cursor(self):
+        # (이미 읽은 시트 데이터 행 수, 그 마지막 행의 이메일 키)
+        row = self._conn.execute("SELECT value FROM repo_state WHERE key = 'sheet_cursor'").fetchone()
+        if not row:
+            return 0, ""
+        offset, _, anchor = row[0].partition("\t")
+        return int(offset), anchor
+
+    def _fetch_sheet_rows(self, sheet):
+        """
+        지난 동기화 이후 시트에 추가된 행만 읽습니다 (마지막으로 읽은 행부터 범위 조회 1회).
+        그 행이 바뀌었으면(행 삭제/정렬 등 시트 편집) 처음부터 다시 읽습니다.
+        반환값: (records, 읽기 시작한 행 번호) / 시트에 연결할 수 없으면 (None, 0)
+        """
+        with self._lock:
+            offset, anchor = self._sheet_cursor()
+        if offset:
+            records = sheet.fetch_rows(offset - 1)
+            if records is None:
+                return None, 0
+            if records and normalize_email(records[0].get('email') or "") == anchor:
+                return records, offset - 1
+            print("[SUBSCRIBERS] Sheet was edited since the last sync, reading it again")
+        return sheet.fetch_rows(0), 0
+
+    def sync(self, sheet):
+        """
+        sheet: fetch_rows(start) -> start번째 데이터 행부터의 [{email, nickname, date}] 또는 None(연결 불가),
+               append_rows(rows) -> 시트에 추가했으면 True 를 가진 객체
+        1) 시트 -> 로컬: 새로 추가된 시트 행 중 로컬에 없는 구독자 추가 (synced=1)
+        2) 로컬 -> 시트: synced=0인 구독자 중 시트에 없는 것만 한 번에 append
+           (append가 실패하면 synced=0으로 남겨 다음 동기화에서 다시 올림)
+        시트는 지난번에 읽은 위치부터만 읽으므로, 주기적으로 실행해도 시트 전체를 내려받지 않습니다.
+        같은 DB 파일에 대한 sync는 프로세스가 달라도 한 번에 하나씩 실행됩니다.
+        반환값: {'pulled', 'pushed'} / 시트에 연결할 수 없으면 None
+        """
+        # 읽기부터 올리기까지 파일 잠금으로 직렬화: 같은 DB를 쓰는 다른 프로세스(앱/main.py)가
+        # 같은 미동기화 행을 동시에 올려 시트에 중복 구독자가 생기지 않게 함
+        with file_lock(self.path):
+            records, start = self._fetch_sheet_rows(sheet)
+            if records is None:
+                return None
+
+            sheet_keys = set()
+            pulled = 0
+            with self._lock, self._conn:
+                for record in records:
+                    email = str(record.get('email') or "").strip()
+                    if "@" not in email:
+                        continue
+                    sheet_keys.add(normalize_email(email))
+                    pulled += self._insert(email, record.get('nickname'), record.get('date'), "sheet", 1)
+                if records:
+                    # 직접 올린 행도 다음 읽기에 포함됨 (같은 주소는 INSERT OR IGNORE로 무시)
+                    cursor = f"{start + len(records)}\t{normalize_email(records[-1].get('email') or '')}"
+                    self._conn.execute("INSERT OR REPLACE INTO repo_state (key, value) VALUES ('sheet_cursor', ?)",
+                                       (cursor,))
+                unsynced = self._conn.execute(
+                    "SELECT email_key, email, nickname, date FROM subscribers WHERE synced = 0").fetchall()
+
+            # 시트에 이미 있는 주소는 올리지 않고 synced로만 표시
+            synced = [row[0] for row in unsynced if row[0] in sheet_keys]
+            to_push = [row for row in unsynced if row[0] not in sheet_keys]
+            if to_push:
+                if sheet.append_rows([[email, nickname or "", date or ""] for _, email, nickname, date in to_push]):
+                    synced += [row[0] for row in to_push]
+                else:
+                    print(f"[SUBSCRIBERS] Sheet append failed, {len(to_push)} subscribers will be retried")
+                    to_push = []
+            with self._lock, self._conn:
+                self._conn.executemany("UPDATE subscribers SET synced = 1 WHERE email_key = ?",
+                                       [(key,) for key in synced])
+            if pulled or to_push:
+                print(f"[SUBSCRIBERS] Sheet sync: pulled {pulled}, pushed {len(to_push)}")
+            return {'pulled': pulled, 'pushed': len(to_push)}
+
+    def close(self):
+        self._conn.close()
+
+
+class SheetSyncWorker:
+    """
+    백그라운드 스레드에서 interval초마다(또는 request() 호출 즉시) repo.sync(sheet)를 실행합니다.
+    시트 오류는 기록만 하고 다음 주기에 다시 시도합니다.
+    """
+    def __init__(self, repo, sheet, interval=SHEET_SYNC_INTERVAL):
+        self.repo = repo
+        self.sheet = sheet
+        self.interval = interval
+        self.last_result = None
+        self.last_error = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="sheet-sync", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def request(self):
+        self._wake.set()
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.last_result = self.repo.sync(self.sheet)
+                self.last_error = None
+            except Exception as e:
+                self.last_error = e
+                print(f"[SUBSCRIBERS] Sheet sync failed: {e}")
+            self._wake.wait(self.interval)
+            self._wake.clear()
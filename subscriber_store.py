@@ -0,0 +1,78 @@
+import os
+import time
+import threading
+
+SUBSCRIBER_CACHE_TTL = int(os.getenv("SUBSCRIBER_CACHE_TTL", 300))  # 초 (기본 5분)
+
+
+class SubscriberStore:
+    """
+    구독자 목록(DataFrame)을 세션 간에 공유하는 TTL 캐시입니다.
+    - 처음 한 번만 loader()를 기다리고, 이후에는 캐시된 목록을 바로 반환
+    - TTL이 지나면 이전 목록을 돌려주면서 백그라운드 스레드에서 새로 읽음 (동시에 1개만)
+    - loader가 실패하면 이전 목록을 유지
+    """
+    def __init__(self, loader, ttl=SUBSCRIBER_CACHE_TTL, clock=time.monotonic):
+        self.loader = loader
+        self.ttl = ttl
+        self.clock = clock
+        self.loads = 0
+        self._data = None
+        self._loaded_at = None
+        self._lock = threading.Lock()
+        self._refreshing = None  # 진행 중인 백그라운드 새로고침 스레드
+
+    def _load(self):
+        try:
+            data = self.loader()
+        except Exception as e:
+            print(f"[SUBSCRIBERS] Refresh failed, keeping previous list: {e}")
+            return
+        with self._lock:
+            self._data = data
+            self._loaded_at = self.clock()
+            self.loads += 1
+
+    def _is_stale(self):
+        return self._loaded_at is None or self.clock() - self._loaded_at > self.ttl
+
+    def refresh(self, wait=False):
+        """
+        백그라운드로 다시 읽습니다. 이미 진행 중이면 그 작업을 공유합니다.
+        """
+        with self._lock:
+            thread = self._refreshing
+            if thread is None or not thread.is_alive():
+                thread = threading.Thread(target=self._load, name="subscriber-refresh", daemon=True)
+                self._refreshing = thread
+                thread.start()
+        if wait:
+            thread.join()
+
+    def get(self):
+        """
+        구독자 목록을 반환합니다. 아직 한 번도 읽지 않았을 때만 로딩을 기다립니다.
+        """
+        with self._lock:
+            data, stale = self._data, self._is_stale()
+        if data is None:
+            self.refresh(wait=True)
+            with self._lock:
+                return self._data
+        if stale:
+            self.refresh()
+        return data
+
+    def invalidate(self):
+        """
+        구독자가 추가된 뒤 호출 -> 다음 get()에서 백그라운드로 새로 읽음.
+        """
+        with self._lock:
+            self._loaded_at = None
+
+    def age(self):
+        """
+        마지막으로 읽은 뒤 지난 시간(초). 읽은 적이 없으면 None.
+        """
+        with self._lock:
+            return None if self._loaded_at is None else self.clock() - self._loaded_at
@@ -0,0 +1,86 @@
+import threading
+import time
+from ai_agent import summarize_content, chunk_texts
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+class FakeModel:
+    """
+    Gemini 대역. 키워드 확장 프롬프트에는 리스트를, map 프롬프트에는 요약 노트를, 뉴스레터 프롬프트에는 HTML을 돌려줍니다.
+    동시 호출 수(max_active)를 셉니다 (test_batch.py에서도 사용).
+    """
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.prompts = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def generate_content(self, prompt):
+        with self._lock:
+            self.prompts.append(prompt)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        if "연관 키워드" in prompt:
+            return FakeResponse('["Generative AI", "Startup news"]')
+        if "요약 노트" in prompt:
+            titles = [line for line in prompt.splitlines() if line.strip().startswith("Title:")]
+            return FakeResponse("\n".join(f"{t.strip()}\nSummary: short" for t in titles))
+        return FakeResponse("<div class=\"summary-box\">- one</div><h1>🦄 Unicorn Signal: Big Week</h1><p>body</p>")
+
+def make_items(count, summary_chars):
+    return [{'title': f"Story {i}", 'link': f"https://example.com/{i}", 'image': 'img',
+             'summary': "x" * summary_chars, 'source': 'Test'} for i in range(count)]
+
+def test_chunk_texts_respects_limit():
+    blocks = ["a" * 40, "b" * 40, "c" * 40, "d" * 500]
+    chunks = chunk_texts(blocks, chunk_chars=100)
+    assert chunks == ["a" * 40 + "b" * 40, "c" * 40, "d" * 100]
+
+def test_summarize_content_single_call_when_small():
+    print("[TEST] Testing single-call summarization...")
+    fake = FakeModel()
+    title, body = summarize_content(make_items(3, 100), llm=fake)
+    assert len(fake.prompts) == 1
+    assert title == "Big Week"
+    assert "<h1>" not in body
+
+def test_summarize_content_forced_map_reduce_when_small():
+    print("[TEST] Testing SUMMARY_MODE=map_reduce on small input...")
+    fake = FakeModel()
+    title, body = summarize_content(make_items(3, 100), llm=fake, mode="map_reduce")
+    # 예산 안에 들어오는 입력도 map(요약 노트) -> reduce 순서로 호출
+    assert len(fake.prompts) > 1
+    assert "요약 노트" in fake.prompts[0] and "요약 노트" not in fake.prompts[-1]
+    assert all(f"Story {i}" in fake.prompts[-1] for i in range(3))
+    assert title == "Big Week"
+
+def test_summarize_content_map_reduce_covers_every_item():
+    print("[TEST] Testing map-reduce summarization...")
+    fake = FakeModel(delay=0.1)
+    items = make_items(60, 900)  # 약 6만 자 -> 단일 프롬프트(1.5만 자)로는 뒤쪽이 잘림
+
+    start = time.perf_counter()
+    title, body = summarize_content(items, llm=fake)
+    elapsed = time.perf_counter() - start
+
+    map_prompts = [p for p in fake.prompts if "요약 노트" in p]
+    reduce_prompt = fake.prompts[-1]
+    assert len(map_prompts) >= 5
+    assert fake.max_active > 1, "map batches were not run concurrently"
+    assert elapsed < 0.1 * len(fake.prompts)
+    # 마지막 항목까지 reduce 프롬프트에 반영됨
+    assert all(f"Story {i}" in reduce_prompt for i in range(60))
+    assert title == "Big Week"
+    print(f"[OK] {len(map_prompts)} map calls + 1 reduce in {elapsed:.2f}s")
+
+if __name__ == "__main__":
+    test_chunk_texts_respects_limit()
+    test_summarize_content_single_call_when_small()
+    test_summarize_content_forced_map_reduce_when_small()
+    test_summarize_content_map_reduce_covers_every_item()
@@ -0,0 +1,71 @@
+import os
+import json
+import random
+import tempfile
+import threading
+from analytics_store import AnalyticsStore
+
+def test_analytics_store_concurrent_sessions():
+    print("[TEST] Load testing analytics store with concurrent sessions...")
+    sessions = 300
+    files = [f"2026-02-0{i}_Topic.html" for i in range(1, 6)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "analytics.db")
+        # Streamlit 서버 2개(프로세스 2개)가 같은 DB를 쓰는 상황 -> 인스턴스 2개
+        stores = [AnalyticsStore(path, flush_every=20, legacy_path=None) for _ in range(2)]
+        expected_likes = {}
+        lock = threading.Lock()
+        start = threading.Barrier(sessions)
+
+        def session(n):
+            store = stores[n % 2]
+            rng = random.Random(n)
+            start.wait()
+            store.record_visit()
+            for _ in range(rng.randint(0, 3)):
+                name = rng.choice(files)
+                store.record_like(name)
+                with lock:
+                    expected_likes[name] = expected_likes.get(name, 0) + 1
+
+        threads = [threading.Thread(target=session, args=(n,)) for n in range(sessions)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for store in stores:
+            store.close()
+
+        reader = AnalyticsStore(path, legacy_path=None)
+        assert reader.visits() == sessions
+        assert reader.likes() == expected_likes
+        reader.close()
+    print(f"[OK] {sessions} sessions, {sum(expected_likes.values())} likes, no lost updates")
+
+def test_analytics_store_buffers_and_migrates_legacy_json():
+    print("[TEST] Testing buffered writes and analytics.json migration...")
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = os.path.join(tmp, "analytics.json")
+        with open(legacy, "w", encoding="utf-8") as f:
+            json.dump({"visits": 41, "likes": {"a.html": 2}}, f)
+        path = os.path.join(tmp, "analytics.db")
+
+        store = AnalyticsStore(path, flush_every=100, flush_interval=3600, legacy_path=legacy)
+        store.record_visit()
+        store.record_like("a.html")
+        store.record_like("b.html")
+        # 아직 버퍼에만 있어도 조회에는 반영
+        assert store.visits() == 42
+        assert store.likes() == {"a.html": 3, "b.html": 1}
+
+        other = AnalyticsStore(path, legacy_path=legacy)  # 다시 열어도 JSON을 두 번 가져오지 않음
+        assert other.visits() == 41
+        assert store.flush() == 3
+        assert other.visits() == 42 and other.like_count("a.html") == 3
+        store.close()
+        other.close()
+
+if __name__ == "__main__":
+    test_analytics_store_concurrent_sessions()
+    test_analytics_store_buffers_and_migrates_legacy_json()
@@ -0,0 +1,45 @@
+import os
+import tempfile
+from app_cache import CacheStats, STATS, tracked_cache_data, load_asset, file_mtime
+
+def test_tracked_cache_counts_hits_and_misses():
+    print("[TEST] Testing tracked cache hit rate...")
+    STATS.reset()
+    calls = []
+
+    @tracked_cache_data("square", show_spinner=False)
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    square.clear()
+    assert [square(3), square(3), square(4), square(3)] == [9, 9, 16, 9]
+    assert calls == [3, 4]
+    row = next(r for r in STATS.snapshot() if r['cache'] == "square")
+    assert (row['calls'], row['hits'], row['misses']) == (4, 2, 2)
+    assert row['hit_rate'] == 0.5
+
+def test_asset_cache_follows_file_mtime():
+    print("[TEST] Testing mtime-keyed asset cache...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "logo.png")
+        with open(path, "wb") as f:
+            f.write(b"v1")
+        assert load_asset(path, file_mtime(path)) == b"v1"
+
+        with open(path, "wb") as f:
+            f.write(b"v2")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert load_asset(path, file_mtime(path)) == b"v2"  # 파일이 바뀌면 다시 읽음
+        assert file_mtime(os.path.join(tmp, "missing.png")) == 0
+
+def test_cache_stats_snapshot():
+    stats = CacheStats()
+    stats.record_call("a")
+    assert stats.snapshot() == [{'cache': "a", 'calls': 1, 'hits': 1, 'misses': 0, 'hit_rate': 1.0}]
+
+if __name__ == "__main__":
+    test_tracked_cache_counts_hits_and_misses()
+    test_asset_cache_follows_file_mtime()
+    test_cache_stats_snapshot()
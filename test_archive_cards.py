@@ -0,0 +1,23 @@
+from archive_cards import render_card, card_title, card_summary, card_thumbnail
+
+def test_render_card():
+    print("[TEST] Testing archive card rendering...")
+    meta = {
+        "title": "🦄 유니콘 시그널: AI 에이전트의 시대",
+        "date": "2026-02-05",
+        "summary": "🚀 3줄 요약: 왜 이걸 봐야 할까요? 에이전트가 업무를 대신합니다. 비용은 계속 내려갑니다. 1인 기업의 기회입니다.",
+        "thumbnail": "https://example.com/a.png?w=1&h=2",
+        "filename": "2026-02-05_AI.html",
+    }
+    assert card_title(meta) == "AI 에이전트의 시대"
+    assert card_summary(meta).count("• ") == 3
+    assert card_thumbnail(meta) == "https://example.com/a.png?w=1&amp;h=2"
+    assert card_thumbnail({"thumbnail": "none"}) == ""
+
+    html = render_card(meta)
+    assert '<div class="archive-title">AI 에이전트의 시대</div>' in html
+    assert "2026-02-05" in html
+    assert "<style>" not in html  # CSS는 페이지 전체 CSS에 한 번만
+
+if __name__ == "__main__":
+    test_render_card()
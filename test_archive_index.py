@@ -0,0 +1,97 @@
+import os
+import json
+import tempfile
+from archive_index import ArchiveIndex
+
+def write_issue(directory, base, with_meta=True):
+    with open(os.path.join(directory, f"{base}.html"), "w", encoding="utf-8") as f:
+        f.write("<html><body><div class='container'>hi</div></body></html>")
+    if with_meta:
+        date, _, topic = base.partition('_')
+        meta = {"title": f"{topic} 리포트", "date": date, "keyword": topic, "summary": "요약",
+                "thumbnail": None, "filename": f"{base}.html"}
+        with open(os.path.join(directory, f"{base}.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+
+def test_archive_index_backfill_and_paging():
+    print("[TEST] Testing archive index backfill and paging...")
+    with tempfile.TemporaryDirectory() as tmp:
+        archive_dir = os.path.join(tmp, "archives")
+        os.makedirs(archive_dir)
+        write_issue(archive_dir, "2026-02-04_Old_Issue", with_meta=False)
+        for day in range(5, 30):
+            write_issue(archive_dir, f"2026-02-{day:02d}_Topic_{day}")
+
+        index = ArchiveIndex(os.path.join(tmp, "index.db"), archive_dir)
+        index.ensure_fresh()
+        assert index.count() == 26
+        assert index.count(with_meta_only=True) == 25
+        assert index.latest()['filename'] == "2026-02-29_Topic_29.html"
+
+        first = index.page(0, per_page=10)
+        last = index.page(2, per_page=10)
+        assert [m['filename'] for m in first][:2] == ["2026-02-29_Topic_29.html", "2026-02-28_Topic_28.html"]
+        assert len(last) == 5 and last[-1]['date'] == "2026-02-05"
+
+        # main.py 경로: 바깥 변경 반영 -> 파일 쓰기 -> upsert -> mark_fresh
+        write_issue(archive_dir, "2026-03-01_New_Issue")
+        index.upsert({"title": "New", "date": "2026-03-01", "keyword": "New Issue", "summary": "s",
+                      "thumbnail": None, "filename": "2026-03-01_New_Issue.html"})
+        index.mark_fresh()
+        assert index.latest()['title'] == "New"
+        assert index.count(with_meta_only=True) == 26
+        index.close()
+
+def test_archive_index_picks_up_external_changes():
+    print("[TEST] Testing archive index refresh on folder change...")
+    with tempfile.TemporaryDirectory() as tmp:
+        archive_dir = os.path.join(tmp, "archives")
+        os.makedirs(archive_dir)
+        write_issue(archive_dir, "2026-02-05_A")
+
+        index = ArchiveIndex(os.path.join(tmp, "index.db"), archive_dir)
+        index.ensure_fresh()
+        assert index.count() == 1
+
+        # 다른 프로세스(git pull 등)가 발행호를 추가 -> 폴더 수정 시각 변경으로 감지
+        write_issue(archive_dir, "2026-02-06_B")
+        os.utime(archive_dir, ns=(0, os.stat(archive_dir).st_mtime_ns + 1_000_000))
+        index.ensure_fresh()
+        assert index.count() == 2
+        assert index.latest()['filename'] == "2026-02-06_B.html"
+        index.close()
+
+def test_archive_index_full_text_search():
+    print("[TEST] Testing archive full-text search...")
+    with tempfile.TemporaryDirectory() as tmp:
+        archive_dir = os.path.join(tmp, "archives")
+        os.makedirs(archive_dir)
+        index = ArchiveIndex(os.path.join(tmp, "index.db"), archive_dir)
+
+        def publish(base, title, keyword, text):
+            index.upsert({"title": title, "date": base[:10], "keyword": keyword, "summary": "",
+                          "thumbnail": None, "filename": f"{base}.html"}, text=text)
+
+        publish("2026-02-05_Robots", "휴머노이드 로봇 트렌드", "Humanoid Robot", "공장에서 로봇이 <노동>을 대신합니다.")
+        publish("2026-02-06_Agents", "AI 에이전트의 시대", "AI Agents", "마케팅 자동화와 로봇 프로세스 자동화(RPA) 비교")
+        for day in range(7, 28):
+            publish(f"2026-02-{day:02d}_Other", f"기타 {day}", "Misc", "관련 없는 내용")
+
+        results = index.search("로봇")
+        # 제목에 등장한 발행호가 본문에만 등장한 발행호보다 먼저
+        assert [r['filename'] for r in results] == ["2026-02-05_Robots.html", "2026-02-06_Agents.html"]
+        assert "<mark>로봇이</mark>" in results[0]['snippet'] or "<mark>로봇</mark>" in results[0]['snippet']
+        assert "&lt;<mark>노동</mark>&gt;" in index.search("노동")[0]['snippet']  # 본문 텍스트는 이스케이프
+
+        assert [r['filename'] for r in index.search("마케팅 자동")] == ["2026-02-06_Agents.html"]
+        assert index.search('"OR') == [] and index.search("   ") == []
+
+        # 다시 발행(upsert)하면 검색 색인도 교체
+        publish("2026-02-05_Robots", "휴머노이드 트렌드", "Humanoid", "배터리 기술")
+        assert [r['filename'] for r in index.search("로봇")] == ["2026-02-06_Agents.html"]
+        index.close()
+
+if __name__ == "__main__":
+    test_archive_index_backfill_and_paging()
+    test_archive_index_picks_up_external_changes()
+    test_archive_index_full_text_search()
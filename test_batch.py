@@ -0,0 +1,47 @@
+import asyncio
+import os
+import tempfile
+import batch
+from archive_index import ArchiveIndex
+from bench_rss_fetch import serve_feeds
+from test_ai_agent import FakeModel
+
+def test_batch_fetches_feeds_once(monkeypatch):
+    print("[TEST] Testing batch mode (shared feed store + bounded LLM concurrency)...")
+    topics = ["Topic A", "Topic B", "Topic C", "Topic D"]
+    stats = {}
+    llm = FakeModel(delay=0.1)
+
+    with tempfile.TemporaryDirectory() as tmp, serve_feeds(4, latency=0.05, stats=stats) as feeds:
+        # 주제마다 피드 목록이 일부 겹침 -> 합집합 4개만 한 번씩 내려받아야 함
+        monkeypatch.setattr(batch, "select_feeds", lambda topic: feeds[:2] if topic == "Topic A" else feeds)
+        archive_dir = os.path.join(tmp, "archives")
+        index = ArchiveIndex(os.path.join(tmp, "index.db"), archive_dir)
+
+        outcome = asyncio.run(batch.run_batch(topics, concurrency=2, llm=llm, archive_index=index,
+                                              with_videos=False))
+
+        assert stats == {200: 4}
+        assert all(isinstance(result, dict) for result in outcome.values()), outcome
+        # 확장 1회 + 요약 1회 (예산 이내라 map 단계 없음)
+        assert len(llm.prompts) == 2 * len(topics)
+        assert llm.max_active == 2
+        assert index.count() == len(topics)
+        assert sorted(os.listdir(os.path.join(archive_dir, "fragments"))) == sorted(
+            result['filename'].replace(".html", ".json") for result in outcome.values())
+        index.close()
+    print("[OK] 4 newsletters from one collection pass")
+
+def test_entry_store_routes_like_fetch_rss_news():
+    print("[TEST] Testing entry store routing...")
+    from scrapers.news import fetch_rss_news
+
+    with serve_feeds(3, latency=0.0) as feeds:
+        store = batch.EntryStore.collect(feeds)
+        expected = fetch_rss_news(feeds[1:], ["story 3"])
+
+    assert len(store) == 3 * 30
+    routed = store.route(feeds[1:], ["story 3"])
+    assert [item['link'] for item in routed] == [item['link'] for item in expected]
+    assert store.route(feeds, ["no such keyword"]) == []
+    print("[OK] Routing matches fetch_rss_news")
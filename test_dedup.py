@@ -0,0 +1,108 @@
+import os
+import tempfile
+from datetime import datetime, timedelta
+from dedup import dedup_items, shingles, signature, similarity, StoryHistory
+
+def make_item(title, summary, source="Test Feed", link=None):
+    return {'title': title, 'summary': summary, 'source': source,
+            'link': link or f"https://example.com/{source}/{title}", 'image': 'img'}
+
+SYNDICATED = [
+    make_item("OpenAI launches GPT-5 with new reasoning model",
+              "OpenAI today announced GPT-5, its newest model with improved reasoning and coding abilities.",
+              source="TechCrunch"),
+    make_item("OpenAI launches GPT-5 with a new reasoning model",
+              "OpenAI announced GPT-5 today, its newest model with improved reasoning and coding abilities for users.",
+              source="The Verge"),
+    make_item("Tesla recalls 2 million vehicles over Autopilot",
+              "The recall affects nearly all Tesla cars sold in the US after a federal safety investigation.",
+              source="Wired"),
+    make_item("OpenAI launches GPT-5 with new reasoning model (video)",
+              "[YouTube Video] OpenAI today announced GPT-5, its newest model with improved reasoning and coding "
+              "abilities. In this video we walk through the demo and benchmarks in detail...",
+              source="YouTube"),
+]
+
+def test_signature_estimates_jaccard():
+    print("[TEST] Testing MinHash signature...")
+    a, b, c = (shingles(item) for item in SYNDICATED[:3])
+    exact = len(a & b) / len(a | b)
+    estimate = similarity(signature(a), signature(b))
+    assert abs(exact - estimate) < 0.2, (exact, estimate)
+    assert similarity(signature(a), signature(c)) < 0.2
+    # 단어가 없는 항목은 서명 없음 / 같은 입력이면 항상 같은 서명 (실행 간 비교 가능)
+    assert signature(shingles({'title': "", 'summary': ""})) is None
+    assert signature(a) == signature(set(a))
+
+def test_dedup_items_keeps_one_per_story():
+    print("[TEST] Testing near-duplicate clustering across news and YouTube...")
+    result = dedup_items(SYNDICATED)
+    # GPT-5 3건(뉴스 2 + 유튜브 1)은 하나로, 대표는 내용이 가장 긴 항목
+    # 결과는 대표 항목의 입력 순서
+    assert [item['source'] for item in result] == ["Wired", "YouTube"]
+    assert dedup_items([]) == []
+    print("[OK] 4 items -> 2 stories")
+
+def test_story_history_skips_stories_from_earlier_issues():
+    print("[TEST] Testing cross-run story history...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "history.db")
+        now = [datetime(2026, 1, 1, 7, 0)]
+        history = StoryHistory(path, days=7, clock=lambda: now[0])
+        published = dedup_items(SYNDICATED[:1], history, "AI")
+        assert len(published) == 1
+        history.stage_items(published, "AI")
+        history.commit()
+        history.close()
+
+        # 오후 실행: 다른 매체의 같은 기사는 제외, 새 기사만
+        history = StoryHistory(path, days=7, clock=lambda: now[0])
+        assert len(history) == 1
+        result = dedup_items(SYNDICATED[1:3], history, " ai ")
+        assert [item['source'] for item in result] == ["Wired"]
+        # 다른 주제의 뉴스레터는 막지 않음
+        assert len(dedup_items(SYNDICATED[1:3], history, "Robotics")) == 2
+        history.discard()
+        history.close()
+
+        # 보관 기간이 지나면 다시 다룰 수 있음
+        now[0] += timedelta(days=8)
+        history = StoryHistory(path, days=7, clock=lambda: now[0])
+        assert len(history) == 0
+        assert len(dedup_items(SYNDICATED[1:3], history, "AI")) == 2
+        history.close()
+    print("[OK] Stories from earlier issues skipped")
+
+def test_story_history_records_only_published_items():
+    print("[TEST] Testing that only published items are remembered...")
+    with tempfile.TemporaryDirectory() as tmp:
+        history = StoryHistory(os.path.join(tmp, "history.db"))
+        candidates = dedup_items(SYNDICATED, history, "AI")
+        assert len(candidates) == 2
+        # dedup만으로는 기록하지 않음 -> 랭킹에서 빠진 기사(Wired)는 다음 실행에서 다시 후보
+        history.commit()
+        assert len(history) == 0
+        ranked = [item for item in candidates if item['source'] == "YouTube"]
+        history.stage_items(ranked, "AI")
+        history.commit()
+        assert [item['source'] for item in dedup_items(SYNDICATED, history, "AI")] == ["Wired"]
+        history.close()
+
+def test_dedup_scales_linearly():
+    print("[TEST] Testing dedup on a large synthetic corpus...")
+    import time
+    from bench_dedup import make_corpus
+    items, labels = make_corpus(5_000)
+    start = time.perf_counter()
+    result = dedup_items(items)
+    elapsed = time.perf_counter() - start
+    assert len(result) == len(set(labels))
+    assert elapsed < 5, f"dedup too slow ({elapsed:.2f}s)"
+    print(f"[OK] 5,000 items in {elapsed:.2f}s")
+
+if __name__ == "__main__":
+    test_signature_estimates_jaccard()
+    test_dedup_items_keeps_one_per_story()
+    test_story_history_skips_stories_from_earlier_issues()
+    test_story_history_records_only_published_items()
+    test_dedup_scales_linearly()
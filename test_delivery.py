@@ -0,0 +1,161 @@
+import asyncio
+import smtplib
+import tempfile
+import threading
+import time
+from delivery import deliver_issue, DeliveryJournal, TokenBucket
+
+class FakeConnection:
+    """
+    SmtpConnection 대역. 보낸 주소를 기록하고, 지정한 주소에서 일시적/영구 오류를 냅니다.
+    """
+    def __init__(self, outbox, transient_failures=None, bounce=(), delay=0.0):
+        self.outbox = outbox
+        self.transient_failures = transient_failures if transient_failures is not None else {}
+        self.bounce = set(bounce)
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def send(self, from_addr, to_addr, raw_message):
+        time.sleep(self.delay)
+        if to_addr in self.bounce:
+            raise smtplib.SMTPRecipientsRefused({to_addr: (550, b"No such user")})
+        with self._lock:
+            if self.transient_failures.get(to_addr, 0) > 0:
+                self.transient_failures[to_addr] -= 1
+                raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+            self.outbox.append(to_addr)
+
+    def close(self):
+        pass
+
+def test_token_bucket_limits_rate():
+    print("[TEST] Testing token bucket...")
+
+    bucket = TokenBucket(rate=20)
+    start = time.perf_counter()
+    # 발송 스레드 여러 개가 함께 써도 전체 속도는 같음
+    threads = [threading.Thread(target=lambda: [bucket.acquire() for _ in range(2)]) for _ in range(5)]
+    bucket.acquire()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    # 첫 1개는 즉시, 나머지 10개는 초당 20개 -> 약 0.5초
+    assert 0.45 <= elapsed < 0.8, elapsed
+
+def test_deliver_issue_retries_and_bounces():
+    print("[TEST] Testing retries and permanent failures...")
+    outbox = []
+    recipients = [f"user{i}@example.com" for i in range(10)]
+    failures = {"user1@example.com": 2}
+    factory = lambda: FakeConnection(outbox, transient_failures=failures, bounce=["user3@example.com"])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = asyncio.run(deliver_issue("issue", "subject", "<p>hi</p>", recipients, concurrency=3,
+                                          rate_per_sec=1000, backoff_base=0.01,
+                                          connection_factory=factory, journal_dir=tmp))
+        assert stats['sent'] == 9 and stats['rate'] > 0
+        assert stats['failed'] == ["user3@example.com"]
+        assert sorted(outbox) == sorted(r for r in recipients if r != "user3@example.com")
+        # 영구 실패(bounce)도 기록 -> 재실행 시 다시 시도하지 않음
+        assert DeliveryJournal("issue", tmp).completed() == set(recipients)
+
+def test_deliver_issue_aborts_on_login_failure():
+    print("[TEST] Testing login failure does not mark recipients as bounced...")
+    outbox = []
+    recipients = [f"user{i}@example.com" for i in range(5)]
+
+    class RejectedLogin(FakeConnection):
+        def send(self, from_addr, to_addr, raw_message):
+            raise smtplib.SMTPAuthenticationError(535, b"Username and Password not accepted")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = asyncio.run(deliver_issue("issue", "subject", "<p>hi</p>", recipients, concurrency=2,
+                                          rate_per_sec=1000, connection_factory=lambda: RejectedLogin(outbox),
+                                          journal_dir=tmp))
+        assert stats['sent'] == 0 and stats['aborted']
+        assert sorted(stats['failed']) == sorted(recipients)
+        assert DeliveryJournal("issue", tmp).completed() == set()
+
+        # 인증 정보를 고친 뒤 다시 실행하면 전원에게 발송
+        stats = asyncio.run(deliver_issue("issue", "subject", "<p>hi</p>", recipients, rate_per_sec=1000,
+                                          connection_factory=lambda: FakeConnection(outbox), journal_dir=tmp))
+        assert stats['sent'] == len(recipients) and stats['aborted'] is None
+        assert sorted(outbox) == sorted(recipients)
+
+def test_deliver_issue_resumes_after_interruption():
+    print("[TEST] Testing resumable delivery journal...")
+    outbox = []
+    recipients = [f"user{i}@example.com" for i in range(40)]
+    factory = lambda: FakeConnection(outbox, delay=0.01)
+
+    async def interrupted():
+        task = asyncio.create_task(deliver_issue("issue", "subject", "<p>hi</p>", recipients, concurrency=4,
+                                                 rate_per_sec=1000, connection_factory=factory, journal_dir=tmp))
+        await asyncio.sleep(0.05)
+        task.cancel()  # Ctrl+C와 같은 중단
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        # 중단은 진행 중이던 전송이 저널에 기록된 뒤에 끝남 (그 전에 발송 잠금을 놓으면 안 됨)
+        journaled = len(DeliveryJournal("issue", tmp).entries())
+        await asyncio.sleep(0.05)
+        assert len(DeliveryJournal("issue", tmp).entries()) == journaled
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(interrupted())
+        first_run = len(outbox)
+        assert 0 < first_run < len(recipients)
+
+        stats = asyncio.run(deliver_issue("issue", "subject", "<p>hi</p>", recipients, concurrency=4,
+                                          rate_per_sec=1000, connection_factory=factory, journal_dir=tmp))
+        assert stats['skipped'] + stats['sent'] == len(recipients)
+        assert set(outbox) == set(recipients)
+        # 중단 시 진행 중이던 전송도 기록되므로 중복 발송 없음
+        assert len(outbox) == len(recipients)
+    print(f"[OK] resumed after {first_run} sends")
+
+def test_deliver_issue_respects_daily_limit():
+    print("[TEST] Testing daily limit...")
+    outbox = []
+    recipients = [f"user{i}@example.com" for i in range(10)]
+    factory = lambda: FakeConnection(outbox)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        first = asyncio.run(deliver_issue("a", "s", "<p/>", recipients, rate_per_sec=1000, daily_limit=6,
+                                          connection_factory=factory, journal_dir=tmp))
+        assert first['sent'] == 6 and first['deferred'] == 4
+        # 다른 발행호도 같은 일일 한도를 공유
+        other = asyncio.run(deliver_issue("b", "s", "<p/>", recipients, rate_per_sec=1000, daily_limit=6,
+                                          connection_factory=factory, journal_dir=tmp))
+        assert other['sent'] == 0 and other['deferred'] == 10
+
+def test_concurrent_deliveries_share_daily_limit():
+    print("[TEST] Testing daily limit across concurrent deliveries...")
+    outbox = []
+    factory = lambda: FakeConnection(outbox, delay=0.01)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 스케줄러 작업 여러 개가 같은 시각에 서로 다른 발행호를 보내는 상황
+        def deliver(issue_id):
+            recipients = [f"{issue_id}{i}@example.com" for i in range(5)]
+            asyncio.run(deliver_issue(issue_id, "s", "<p/>", recipients, rate_per_sec=1000, daily_limit=6,
+                                      connection_factory=factory, journal_dir=tmp))
+
+        threads = [threading.Thread(target=deliver, args=(name,)) for name in ("a", "b", "c")]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(outbox) == 6
+
+if __name__ == "__main__":
+    test_token_bucket_limits_rate()
+    test_deliver_issue_retries_and_bounces()
+    test_deliver_issue_aborts_on_login_failure()
+    test_deliver_issue_resumes_after_interruption()
+    test_deliver_issue_respects_daily_limit()
+    test_concurrent_deliveries_share_daily_limit()
@@ -0,0 +1,78 @@
+import email
+import email.header
+import socket
+import threading
+from aiosmtpd.controller import Controller
+from email_sender import send_bulk, SmtpConnection
+
+class RecordingHandler:
+    """
+    받은 메시지를 기록하는 로컬 SMTP 서버 핸들러.
+    한 세션에서 drop_after개를 받으면 421로 세션을 끊어 재접속을 유도합니다.
+    """
+    def __init__(self, drop_after=None):
+        self.drop_after = drop_after
+        self.messages = []
+        self.sessions = {}
+        self._lock = threading.Lock()
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if self.drop_after and self.sessions.get(id(session), 0) >= self.drop_after:
+            return "421 Too many messages in this session"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        with self._lock:
+            self.sessions[id(session)] = self.sessions.get(id(session), 0) + 1
+            self.messages.append((envelope.rcpt_tos[0], envelope.content))
+        return "250 Message accepted"
+
+def free_port():
+    # aiosmtpd Controller는 port=0을 지원하지 않으므로 빈 포트를 미리 골라둠
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def run_bulk(handler, recipients, pool_size):
+    host, port = "127.0.0.1", free_port()
+    controller = Controller(handler, hostname=host, port=port)
+    controller.start()
+    try:
+        factory = lambda: SmtpConnection(host, port, password=None, security='none')
+        return send_bulk("🦄 테스트 뉴스레터", "<h1>안녕하세요</h1>", recipients, pool_size=pool_size, connection_factory=factory)
+    finally:
+        controller.stop()
+
+def test_send_bulk_reuses_pooled_connections():
+    print("[TEST] Testing pooled bulk delivery...")
+    handler = RecordingHandler()
+    recipients = [f"user{i}@example.com" for i in range(30)]
+
+    stats = run_bulk(handler, recipients, pool_size=3)
+
+    assert stats['sent'] == 30 and stats['failed'] == []
+    assert stats['connections'] == 3
+    assert sorted(to for to, _ in handler.messages) == sorted(recipients)
+
+    # 본문은 같고 To 헤더만 수신자별로 다름
+    to, raw = handler.messages[0]
+    parsed = email.message_from_bytes(raw)
+    assert parsed['To'] == to
+    assert "테스트 뉴스레터" in str(email.header.make_header(email.header.decode_header(parsed['Subject'])))
+    print(f"[OK] {stats['sent']} sent at {stats['rate']:.0f} msg/s")
+
+def test_send_bulk_reconnects_when_session_dropped():
+    print("[TEST] Testing reconnect after 421...")
+    handler = RecordingHandler(drop_after=4)
+    recipients = [f"user{i}@example.com" for i in range(20)]
+
+    stats = run_bulk(handler, recipients, pool_size=2)
+
+    assert stats['sent'] == 20 and stats['failed'] == []
+    assert stats['connections'] >= 5
+    assert len(handler.messages) == 20
+
+if __name__ == "__main__":
+    test_send_bulk_reuses_pooled_connections()
+    test_send_bulk_reconnects_when_session_dropped()
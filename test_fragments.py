@@ -0,0 +1,46 @@
+import os
+import tempfile
+from fragments import extract_fragments, load_fragments, newsletter_markup, migrate, fragment_path
+
+SAMPLE = """<html><head><style>.container { color: red; }</style></head>
+<body><div class="container"><h1>제목</h1>
+<div class="summary-box"><h3>3줄 요약</h3><p>첫째 줄입니다.</p></div>
+<p>본문</p></div></body></html>"""
+
+def test_extract_fragments():
+    print("[TEST] Testing fragment extraction...")
+    fragments = extract_fragments(SAMPLE, "AI")
+    assert fragments['style'] == ".container { color: red; }"
+    assert fragments['body'].startswith("<h1>제목</h1>") and "<p>본문</p>" in fragments['body']
+    assert fragments['summary'] == "3줄 요약 첫째 줄입니다."
+
+    markup = newsletter_markup(fragments)
+    assert markup.startswith("<style>.container { color: red; }</style>\n<div class=\"newsletter-paper\">")
+
+    # summary-box가 없으면 키워드 기반 기본 문구
+    assert extract_fragments("<html><body><p>x</p></body></html>", "AI")['summary'] == "AI 트렌드 분석 및 주요 뉴스 요약"
+
+def test_migrate_and_lazy_backfill():
+    print("[TEST] Testing fragment migration...")
+    with tempfile.TemporaryDirectory() as tmp:
+        archive_dir = os.path.join(tmp, "archives")
+        fragment_dir = os.path.join(archive_dir, "fragments")
+        os.makedirs(archive_dir)
+        for name in ("2026-02-05_A.html", "2026-02-06_B.html"):
+            with open(os.path.join(archive_dir, name), "w", encoding="utf-8") as f:
+                f.write(SAMPLE)
+
+        assert migrate(archive_dir, fragment_dir) == 2
+        assert migrate(archive_dir, fragment_dir) == 0  # 이미 있는 조각은 건너뜀
+
+        # 조각이 없는 발행호는 처음 조회할 때 한 번 만들어 저장
+        with open(os.path.join(archive_dir, "2026-02-07_C.html"), "w", encoding="utf-8") as f:
+            f.write(SAMPLE)
+        fragments = load_fragments("2026-02-07_C.html", archive_dir, fragment_dir)
+        assert fragments['style'] == ".container { color: red; }"
+        assert os.path.exists(fragment_path("2026-02-07_C.html", fragment_dir))
+        assert load_fragments("2026-02-08_missing.html", archive_dir, fragment_dir) is None
+
+if __name__ == "__main__":
+    test_extract_fragments()
+    test_migrate_and_lazy_backfill()
@@ -0,0 +1,97 @@
+import gspread
+import google_sheet
+
+class FakeWorksheet:
+    """
+    gspread Worksheet 대역. API 호출 횟수를 셉니다.
+    """
+    def __init__(self, rows=None):
+        self.rows = rows if rows is not None else []
+        self.calls = []
+        self.fail_with = None
+
+    def _call(self, name):
+        self.calls.append(name)
+        if self.fail_with is not None:
+            error, self.fail_with = self.fail_with, None
+            raise error
+
+    def row_values(self, n):
+        self._call("row_values")
+        return self.rows[n - 1] if len(self.rows) >= n else []
+
+    def append_row(self, row):
+        self._call("append_row")
+        self.rows.append(list(row))
+
+    def append_rows(self, rows):
+        self._call("append_rows")
+        self.rows.extend(list(row) for row in rows)
+        return {"updates": {"updatedRows": len(rows)}}
+
+    def get(self, range_name):
+        # "A{n}:C" 형태만 지원 (n행부터 끝까지)
+        self._call("get")
+        first = int(range_name.split(":")[0][1:])
+        return [list(row) for row in self.rows[first - 1:]]
+
+class FakeClient:
+    def __init__(self, worksheet):
+        self.worksheet = worksheet
+        self.opens = 0
+
+    def open(self, name):
+        self.opens += 1
+        return type("Spreadsheet", (), {"sheet1": self.worksheet})()
+
+class FakeResponse:
+    text = ""
+    def json(self):
+        return {"error": {"code": 401, "message": "Request had invalid authentication credentials.", "status": "UNAUTHENTICATED"}}
+
+def test_google_sheet_handle_is_cached(monkeypatch):
+    print("[TEST] Testing cached gspread client/worksheet...")
+    worksheet = FakeWorksheet()
+    client = FakeClient(worksheet)
+    authorizations = []
+    monkeypatch.setattr(google_sheet, "get_gspread_client", lambda: authorizations.append(1) or client)
+    google_sheet.reset_google_sheet()
+
+    source = google_sheet.SheetSubscriberSource()
+    assert source.append_rows([["a@example.com", "A", "2026-02-05"]])
+    assert source.append_rows([["b@example.com", "B", "2026-02-05"]])
+    records = source.fetch_rows()
+
+    assert [r['email'] for r in records] == ["a@example.com", "b@example.com"]
+    # 범위 조회: 지정한 데이터 행부터만, 짧은 행은 빈 칸으로 채움
+    worksheet.rows.append(["c@example.com"])
+    assert source.fetch_rows(2) == [{'email': "c@example.com", 'nickname': "", 'date': ""}]
+    # 인증/시트 열기/헤더 확인은 처음 한 번만
+    assert len(authorizations) == 1 and client.opens == 1
+    assert worksheet.calls.count("row_values") == 1
+    assert worksheet.rows[0] == google_sheet.HEADER
+    google_sheet.reset_google_sheet()
+
+def test_google_sheet_reconnects_on_auth_error(monkeypatch):
+    print("[TEST] Testing reconnect after auth error...")
+    worksheet = FakeWorksheet([google_sheet.HEADER, ["a@example.com", "A", "2026-02-05"]])
+    client = FakeClient(worksheet)
+    monkeypatch.setattr(google_sheet, "get_gspread_client", lambda: client)
+    google_sheet.reset_google_sheet()
+
+    source = google_sheet.SheetSubscriberSource()
+    source.fetch_rows()
+    worksheet.fail_with = gspread.exceptions.APIError(FakeResponse())
+    records = source.fetch_rows()
+
+    assert [r['email'] for r in records] == ["a@example.com"]
+    assert client.opens == 2  # 401 -> 핸들 폐기 후 다시 연결
+    google_sheet.reset_google_sheet()
+
+def test_google_sheet_without_credentials(monkeypatch):
+    monkeypatch.setattr(google_sheet, "get_gspread_client", lambda: None)
+    google_sheet.reset_google_sheet()
+    source = google_sheet.SheetSubscriberSource()
+    # 시트를 열 수 없으면 읽기는 None, 추가는 False (구독자는 로컬에 남아 다음에 다시 시도)
+    assert source.fetch_rows() is None
+    assert source.append_rows([["a@example.com", "A", "2026-02-05"]]) is False
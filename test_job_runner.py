@@ -0,0 +1,120 @@
+import os
+import tempfile
+import time
+from job_runner import JobRunner, RunLedger
+
+# 작업 대역 (spawn 프로세스에서 import되므로 모듈 최상위 함수)
+def quick_job(topic, slot):
+    time.sleep(0.8)
+
+def hanging_job(topic, slot):
+    time.sleep(30)
+
+def failing_job(topic, slot):
+    raise RuntimeError(f"feed exploded for {topic}")
+
+def crashing_job(topic, slot):
+    os._exit(3)
+
+def delivering_job(topic, slot):
+    # main.claim_delivery 흉내: topic = "장부 경로|주제"
+    path, name = topic.split("|")
+    ledger = RunLedger(path)
+    if ledger.claim(f"delivery:{slot}", name):
+        with open(f"{path}.{name}.sent", "w") as f:
+            f.write(slot)
+    ledger.close()
+
+def make_runner(tmp, target, **kwargs):
+    return JobRunner(target=target, ledger=RunLedger(os.path.join(tmp, "ledger.db")), **kwargs)
+
+def test_job_runner_runs_topics_in_parallel():
+    print("[TEST] Testing parallel job dispatch...")
+    with tempfile.TemporaryDirectory() as tmp:
+        runner = make_runner(tmp, quick_job, workers=3, timeout=10)
+        start = time.perf_counter()
+        results = runner.run(["A", "B", "C"])
+        elapsed = time.perf_counter() - start
+
+        assert sorted(r['topic'] for r in results) == ["A", "B", "C"]
+        assert all(r['status'] == "ok" for r in results)
+        # 순차 실행이면 2.4초 이상
+        assert elapsed < 2.0, f"jobs did not run in parallel ({elapsed:.2f}s)"
+        assert [row['status'] for row in runner.ledger.recent()] == ["ok"] * 3
+        runner.ledger.close()
+    print(f"[OK] 3 jobs in {elapsed:.2f}s")
+
+def test_job_runner_isolates_failures_and_timeouts():
+    print("[TEST] Testing timeout / error isolation...")
+    with tempfile.TemporaryDirectory() as tmp:
+        for target, status, message in [(hanging_job, "timeout", "killed after"),
+                                         (failing_job, "error", "RuntimeError: feed exploded for X"),
+                                         (crashing_job, "error", "exited with code 3")]:
+            runner = make_runner(tmp, target, workers=1, timeout=1)
+            start = time.perf_counter()
+            [result] = runner.run(["X"])
+            assert time.perf_counter() - start < 5
+            assert result['status'] == status and message in result['error'], result
+            row = runner.ledger.recent(1)[0]
+            assert row['status'] == status and row['duration'] is not None
+            runner.ledger.close()
+    print("[OK] Hung / failing / crashing jobs are recorded and do not block the runner")
+
+def test_job_runner_skips_overlapping_runs():
+    print("[TEST] Testing overlap skip...")
+    with tempfile.TemporaryDirectory() as tmp:
+        runner = make_runner(tmp, quick_job, workers=1, timeout=10)
+        thread = runner.run_in_background(["slow"])
+        time.sleep(0.2)
+        # 같은 장부를 쓰는 다른 스케줄러 프로세스 흉내
+        other = make_runner(tmp, quick_job)
+        assert other.run(["again"]) is None
+        thread.join()
+        statuses = [row['status'] for row in runner.ledger.recent()]
+        assert statuses == ["skipped", "ok"]
+        # 끝난 뒤에는 다시 실행 가능
+        assert other.run(["again"])[0]['status'] == "ok"
+        runner.ledger.close()
+        other.ledger.close()
+    print("[OK] Overlapping run skipped")
+
+def test_run_ledger_takes_over_stale_lock():
+    print("[TEST] Testing stale lock takeover...")
+    with tempfile.TemporaryDirectory() as tmp:
+        now = [1000.0]
+        ledger = RunLedger(os.path.join(tmp, "ledger.db"), clock=lambda: now[0])
+        assert ledger.try_lock("scheduled", ttl=60)
+        run_id = ledger.start("scheduled", "X")
+        assert not ledger.try_lock("scheduled", ttl=60)
+        # 잠금 만료 (이전 스케줄러가 죽은 경우) -> 넘겨받고 남은 기록은 abandoned
+        now[0] += 61
+        assert ledger.try_lock("scheduled", ttl=60)
+        assert ledger.recent(1)[0]['id'] == run_id
+        assert ledger.recent(1)[0]['status'] == "abandoned"
+        ledger.close()
+    print("[OK] Stale lock taken over")
+
+def test_job_runner_delivers_once_per_slot():
+    print("[TEST] Testing one delivery per scheduled run...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ledger.db")
+        runner = JobRunner(target=delivering_job, ledger=RunLedger(path), workers=3, timeout=10)
+        results = runner.run([f"{path}|{name}" for name in "ABC"])
+        assert all(r['status'] == "ok" for r in results)
+        # 동시에 끝난 작업 3개 중 1개만 발송권을 얻음
+        sent = [name for name in os.listdir(tmp) if name.endswith(".sent")]
+        assert len(sent) == 1, sent
+
+        # 다음 회차는 다시 발송 가능
+        time.sleep(1)
+        runner.run([f"{path}|D"])
+        assert len([name for name in os.listdir(tmp) if name.endswith(".sent")]) == 2
+        runner.ledger.close()
+    print("[OK] One delivery per slot")
+
+if __name__ == "__main__":
+    test_job_runner_runs_topics_in_parallel()
+    test_job_runner_isolates_failures_and_timeouts()
+    test_job_runner_skips_overlapping_runs()
+    test_run_ledger_takes_over_stale_lock()
+    test_job_runner_delivers_once_per_slot()
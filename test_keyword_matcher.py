@@ -0,0 +1,48 @@
+import scrapers.keyword_matcher as keyword_matcher
+from scrapers.keyword_matcher import KeywordMatcher, normalize_keywords
+
+def test_normalize_keywords():
+    print("[TEST] Testing keyword normalization...")
+    # expand_keywords 실패 시 문자열 하나가 그대로 올 수 있음 -> 글자 단위로 쪼개지면 안 됨
+    assert normalize_keywords("Generative AI") == ["Generative AI"]
+    assert normalize_keywords(["LLM", ["Crypto", "Bitcoin"], " ", None]) == ["LLM", "Crypto", "Bitcoin"]
+
+def test_keyword_matcher_counts_and_boundaries():
+    print("[TEST] Testing KeywordMatcher...")
+    text = "Generative AI agents are everywhere, said the AI Agents report"
+
+    matcher = KeywordMatcher(["AI", "AI Agents", "Generative AI", "LLM"])
+    assert matcher.search(text)
+    assert matcher.matches(text) == ["AI", "AI Agents", "Generative AI"]
+    # "said"의 "ai"까지 부분 문자열로 셈
+    assert matcher.counts(text)["AI"] == 3
+
+    bounded = KeywordMatcher(["AI", "AI Agents", "Generative AI"], word_boundary=True)
+    assert bounded.counts(text) == {"AI": 2, "AI Agents": 2, "Generative AI": 1}
+    assert not bounded.search("she said so")
+
+    strict = KeywordMatcher(["AI"], case_sensitive=True)
+    assert strict.search("OpenAI")
+    assert not strict.search("openai")
+
+def test_keyword_matcher_regex_path_matches_substring_path():
+    print("[TEST] Testing regex automaton against substring scan...")
+    keywords = [f"topic {i}" for i in range(60)] + ["AI", "ai chips"]
+    texts = ["new AI chips from topic 42", "nothing here", "Topic 7 and TOPIC 59", "sai"]
+
+    original = keyword_matcher.SUBSTRING_SCAN_LIMIT
+    try:
+        keyword_matcher.SUBSTRING_SCAN_LIMIT = 0
+        regex_results = [KeywordMatcher(keywords).search(t) for t in texts]
+        keyword_matcher.SUBSTRING_SCAN_LIMIT = 1000
+        substring_results = [KeywordMatcher(keywords).search(t) for t in texts]
+    finally:
+        keyword_matcher.SUBSTRING_SCAN_LIMIT = original
+
+    assert regex_results == substring_results == [True, False, True, True]
+    print("[OK] KeywordMatcher paths agree")
+
+if __name__ == "__main__":
+    test_normalize_keywords()
+    test_keyword_matcher_counts_and_boundaries()
+    test_keyword_matcher_regex_path_matches_substring_path()
@@ -0,0 +1,83 @@
+import os
+import tempfile
+from llm_cache import LLMCache, CachedModel, make_cache_key
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+class FakeModel:
+    model_name = "models/fake-model"
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate_content(self, prompt, **kwargs):
+        self.calls += 1
+        return FakeResponse(f"answer #{self.calls} to {prompt}")
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def test_cached_model_reuses_responses_across_instances():
+    print("[TEST] Testing LLM response cache...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "llm.db")
+        fake = FakeModel()
+
+        model = CachedModel(fake, LLMCache(path))
+        first = model.generate_content("expand: Generative AI").text
+        assert model.generate_content("expand: Generative AI").text == first
+        # 파라미터가 다르면 다른 키
+        model.generate_content("expand: Generative AI", generation_config={"temperature": 0.2})
+        assert fake.calls == 2
+
+        # 다음 실행(새 인스턴스)에서도 디스크에서 재사용
+        reopened = CachedModel(fake, LLMCache(path))
+        assert reopened.generate_content("expand: Generative AI").text == first
+        assert fake.calls == 2
+        assert reopened.model_name == "models/fake-model"
+
+def test_cached_model_opens_cache_on_first_call():
+    print("[TEST] Testing lazy LLM cache creation...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cache", "llm.db")
+        model = CachedModel(FakeModel(), cache_factory=lambda: LLMCache(path))
+        # 모델을 만들기만 해서는(ai_agent import 시점) 캐시 파일이 생기지 않음
+        assert not os.path.exists(path)
+        model.generate_content("expand: Robotics")
+        assert os.path.exists(path) and len(model.cache) == 1
+        model.cache.close()
+
+def test_llm_cache_ttl_and_lru_eviction():
+    print("[TEST] Testing TTL and size eviction...")
+    clock = FakeClock()
+    cache = LLMCache(":memory:", ttl=60, max_entries=3, clock=clock)
+
+    keys = [make_cache_key("m", f"prompt {i}") for i in range(4)]
+    for key in keys[:3]:
+        cache.put(key, "m", "value")
+        clock.now += 1
+    cache.get(keys[0])          # keys[0]을 최근 사용으로
+    cache.put(keys[3], "m", "value")
+
+    assert len(cache) == 3
+    assert cache.get(keys[1]) is None          # 가장 오래 안 쓴 항목이 밀려남
+    assert cache.get(keys[0]) == "value"
+
+    clock.now += 120
+    assert cache.get(keys[0]) is None          # TTL 만료
+
+    byte_limited = LLMCache(":memory:", max_bytes=10, clock=clock)
+    byte_limited.put("a", "m", "12345")
+    byte_limited.put("b", "m", "123456")
+    assert byte_limited.get("a") is None and byte_limited.get("b") == "123456"
+
+if __name__ == "__main__":
+    test_cached_model_reuses_responses_across_instances()
+    test_cached_model_opens_cache_on_first_call()
+    test_llm_cache_ttl_and_lru_eviction()
@@ -1,6 +1,14 @@
 import asyncio
+import os
+import tempfile
+import threading
+import time
+import requests
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from config import RSS_FEEDS
-from scrapers.news import fetch_rss_news
+from scrapers.news import fetch_rss_news, download_feed, HostLimiter, _iter_body
+from scrapers.feed_cache import FeedCache
+from bench_rss_fetch import serve_feeds
 
 def test_news_scraper():
     print("[TEST] Testing News Scraper...")
@@ -30,5 +38,104 @@ def test_news_scraper():
     except Exception as e:
         print(f"[ERROR] Error during test: {e}")
 
+def test_fetch_rss_news_concurrent_local():
+    print("[TEST] Testing concurrent fetch against local stub feeds...")
+
+    # 피드 2번은 타임아웃보다 느리게 응답 -> 전체 수집을 막지 않아야 함
+    with serve_feeds(6, latency=0.2, slow_paths=[2], slow_latency=3.0) as feeds:
+        start = time.perf_counter()
+        results = fetch_rss_news(feeds, ["generative ai"], timeout=1)
+        elapsed = time.perf_counter() - start
+
+    assert elapsed < 2.5, f"slow feed blocked the run ({elapsed:.2f}s)"
+
+    # 중복 링크는 한 번만, 순서는 피드 순서(0, 1, 3, 4, 5) 그대로
+    links = [item['link'] for item in results]
+    assert len(links) == len(set(links))
+    sources = []
+    for item in results:
+        if not sources or sources[-1] != item['source']:
+            sources.append(item['source'])
+    assert sources == [f"Stub Feed {i}" for i in (0, 1, 3, 4, 5)]
+    assert len(results) == 5 + 5 * 25
+    print(f"[OK] {len(results)} items in {elapsed:.2f}s")
+
+def test_feed_cache_conditional_get():
+    print("[TEST] Testing conditional GET feed cache...")
+
+    stats = {}
+    with tempfile.TemporaryDirectory() as tmp, serve_feeds(4, latency=0, stats=stats) as feeds:
+        cache_path = os.path.join(tmp, "feed_cache.json")
+        first = fetch_rss_news(feeds, ["generative ai"], cache=FeedCache(cache_path))
+        assert stats == {200: 4}
+
+        # 새 프로세스에서 다시 실행한 것처럼 디스크에서 캐시를 다시 읽음
+        second = fetch_rss_news(feeds, ["generative ai"], cache=FeedCache(cache_path))
+        assert stats == {200: 4, 304: 4}
+
+    assert second == first
+    print(f"[OK] second run served {len(second)} items from cache")
+
+def test_trickling_feed_hits_total_deadline():
+    print("[TEST] Testing total deadline against a trickling server...")
+
+    # 0.2초마다 1바이트씩 보내는 서버: 읽기 1번은 타임아웃에 걸리지 않지만 전체로는 끝없이 느림
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/rss+xml")
+            self.send_header("Content-Length", "1000")
+            self.end_headers()
+            try:
+                for _ in range(1000):
+                    self.wfile.write(b" ")
+                    self.wfile.flush()
+                    time.sleep(0.2)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with requests.Session() as session:
+            start = time.perf_counter()
+            result = download_feed(session, f"http://127.0.0.1:{server.server_address[1]}/feed", HostLimiter(),
+                                   timeout=1)
+            elapsed = time.perf_counter() - start
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert result['error'] is not None and result['content'] is None
+    assert elapsed < 1.5, f"trickling body held the download for {elapsed:.2f}s"
+    print(f"[OK] gave up after {elapsed:.2f}s ({type(result['error']).__name__})")
+
+def test_iter_body_without_read1():
+    print("[TEST] Testing body reads on urllib3 1.26 (no read1)...")
+
+    # urllib3 1.26 HTTPResponse 대역: read만 있음
+    class LegacyRaw:
+        connection = None
+
+        def __init__(self, body):
+            self.body = body
+
+        def read(self, amt, decode_content=False):
+            chunk, self.body = self.body[:amt], self.body[amt:]
+            return chunk
+
+    class Response:
+        raw = LegacyRaw(b"x" * 10)
+
+    chunks = list(_iter_body(Response(), time.monotonic() + 5, 5, chunk_size=4))
+    assert b"".join(chunks) == b"x" * 10 and len(chunks) == 3
+
 if __name__ == "__main__":
     test_news_scraper()
+    test_fetch_rss_news_concurrent_local()
+    test_feed_cache_conditional_get()
+    test_trickling_feed_hits_total_deadline()
+    test_iter_body_without_read1()
@@ -0,0 +1,40 @@
+from datetime import datetime
+from ranking import select_top_items, prompt_block
+
+NOW = datetime(2026, 2, 6, 12, 0)
+
+def make_item(title, summary="", published="2026-02-06", source="Test Feed"):
+    return {'title': title, 'link': f"https://example.com/{title}", 'published': published,
+            'summary': summary, 'source': source, 'image': 'https://example.com/img.png'}
+
+def test_select_top_items_orders_by_relevance():
+    print("[TEST] Testing relevance ranking...")
+    items = [
+        make_item("Weekly roundup", "mentions AI once"),
+        make_item("Generative AI startups raise", "Generative AI and LLM funding"),
+        make_item("Old Generative AI story", "Generative AI and LLM funding", published="2026-01-01"),
+        make_item("Video about LLM agents", "[YouTube Video] LLM", source="YouTube"),
+    ]
+    result = select_top_items(items, ["Generative AI", "LLM"], k=3, char_budget=100000, now=NOW)
+
+    titles = [item['title'] for item in result]
+    assert titles[0] == "Generative AI startups raise"
+    assert titles.index("Generative AI startups raise") < titles.index("Old Generative AI story")
+    assert "Weekly roundup" not in titles
+
+def test_select_top_items_respects_char_budget():
+    print("[TEST] Testing character budget...")
+    items = [make_item(f"Generative AI {i}", "x" * 500) for i in range(10)]
+    items.append(make_item("Generative AI short"))
+    budget = len(prompt_block(items[0])) * 2 + len(prompt_block(items[-1]))
+
+    result = select_top_items(items, ["Generative AI"], k=10, char_budget=budget, now=NOW)
+
+    assert sum(len(prompt_block(item)) for item in result) <= budget
+    # 예산이 꽉 차도 남은 자리에 들어가는 짧은 항목은 채워 넣음
+    assert len(result) == 3
+    print(f"[OK] {len(result)} items within {budget} chars")
+
+if __name__ == "__main__":
+    test_select_top_items_orders_by_relevance()
+    test_select_top_items_respects_char_budget()
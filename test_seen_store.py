@@ -0,0 +1,120 @@
+import os
+import tempfile
+import multiprocessing
+from datetime import datetime, timedelta
+from scrapers.news import fetch_rss_news
+from scrapers.seen_store import SeenEntries
+from scrapers.feed_cache import FeedCache
+from scrapers.transcript_cache import TranscriptCache
+from bench_rss_fetch import serve_feeds
+
+def test_incremental_collection_skips_processed_entries():
+    print("[TEST] Testing incremental collection (seen entries)...")
+    with tempfile.TemporaryDirectory() as tmp, serve_feeds(3, latency=0.0) as feeds:
+        path = os.path.join(tmp, "seen.json")
+
+        first = fetch_rss_news(feeds, ["generative ai"], seen=SeenEntries(path), scope="AI")
+        assert len(first) == 5 + 3 * 25
+
+        # 발행 전에 실패한 실행 (commit 없음) -> 다음 실행에서 다시 처리
+        seen = SeenEntries(path)
+        assert len(fetch_rss_news(feeds, ["generative ai"], seen=seen, scope="AI")) == len(first)
+        seen.commit()
+
+        # 발행이 끝난 뒤 같은 주제의 다음 실행은 새 엔트리만
+        later = SeenEntries(path)
+        assert ("ai", feeds[0], first[0]['link']) in later
+        assert fetch_rss_news(feeds, ["story"], seen=later, scope=" ai ") == []
+        # 다른 주제의 실행은 앞 실행이 훑은 엔트리도 그대로 받음
+        other = fetch_rss_news(feeds, ["story"], seen=later, scope="Startups")
+        assert len(other) == len(fetch_rss_news(feeds, ["story"]))
+        assert other
+    print("[OK] Processed entries are skipped on the next run")
+
+def test_seen_entries_expire():
+    print("[TEST] Testing seen entry expiry...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "seen.json")
+        now = [datetime(2026, 1, 1, 7, 0)]
+        feed = {'url': "https://example.com/feed", 'error': None, 'source': "S",
+                'entries': [{'link': "https://example.com/a"}, {'link': None}]}
+
+        seen = SeenEntries(path, days=14, clock=lambda: now[0])
+        assert len(seen.exclude_seen([feed])[0]['entries']) == 2
+        seen.commit()
+        assert len(seen.exclude_seen([feed])[0]['entries']) == 1  # 링크 없는 엔트리는 기록 불가
+
+        # 보관 기간이 지나면 기록 삭제 (피드 자체도 정리)
+        now[0] += timedelta(days=15)
+        seen.commit()
+        reloaded = SeenEntries(path, days=14, clock=lambda: now[0])
+        assert ("", "https://example.com/feed", "https://example.com/a") not in reloaded
+        assert reloaded.exclude_seen([feed])[0]['entries'] == feed['entries']
+    print("[OK] Expired entries are pruned")
+
+def test_seen_entries_discard_one_topic():
+    print("[TEST] Testing per-topic discard (batch with a failed topic)...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "seen.json")
+        feed = {'url': "https://example.com/feed", 'error': None, 'source': "S",
+                'entries': [{'link': "https://example.com/a"}]}
+
+        seen = SeenEntries(path)
+        seen.exclude_seen([feed], "Published")
+        seen.exclude_seen([feed], "Failed")
+        seen.discard("Failed")
+        seen.commit()
+
+        reloaded = SeenEntries(path)
+        assert ("published", feed['url'], "https://example.com/a") in reloaded
+        assert reloaded.exclude_seen([feed], "Failed")[0]['entries'] == feed['entries']
+    print("[OK] Only published topics are recorded")
+
+def commit_feed(path, feed_id, start_event):
+    # 작업 프로세스 흉내: 시작할 때 읽어두고, 다른 프로세스와 동시에 commit
+    seen = SeenEntries(path)
+    feed = {'url': f"https://example.com/feed/{feed_id}", 'error': None, 'source': "S",
+            'entries': [{'link': f"https://example.com/{feed_id}/{i}"} for i in range(50)]}
+    seen.exclude_seen([feed])
+    start_event.wait()
+    seen.commit()
+
+def test_concurrent_runs_keep_each_others_records():
+    print("[TEST] Testing concurrent commits from several processes...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "seen.json")
+        context = multiprocessing.get_context("spawn")
+        start_event = context.Event()
+        processes = [context.Process(target=commit_feed, args=(path, i, start_event)) for i in range(4)]
+        for process in processes:
+            process.start()
+        start_event.set()
+        for process in processes:
+            process.join(30)
+            assert process.exitcode == 0
+
+        reloaded = SeenEntries(path)
+        # 마지막에 저장한 프로세스가 다른 프로세스의 기록을 덮어쓰지 않음
+        assert all(("", f"https://example.com/feed/{i}", f"https://example.com/{i}/49") in reloaded for i in range(4))
+
+        # 피드/자막 캐시도 같은 방식 (먼저 열어둔 인스턴스가 나중에 저장해도 합쳐짐)
+        feed_path, transcript_path = os.path.join(tmp, "feeds.json"), os.path.join(tmp, "transcripts.json")
+        first, second = FeedCache(feed_path), FeedCache(feed_path)
+        first.store("https://a.example/feed", {'ETag': '"a"'}, "A", [])
+        second.store("https://b.example/feed", {'ETag': '"b"'}, "B", [])
+        first.save()
+        second.save()
+        assert FeedCache(feed_path).get("https://a.example/feed")['source'] == "A"
+        first, second = TranscriptCache(transcript_path), TranscriptCache(transcript_path)
+        first.put("video-a", "text a")
+        second.put("video-b", "text b")
+        first.save()
+        second.save()
+        assert TranscriptCache(transcript_path).get("video-a") == "text a"
+    print("[OK] Concurrent commits merged")
+
+if __name__ == "__main__":
+    test_incremental_collection_skips_processed_entries()
+    test_seen_entries_expire()
+    test_seen_entries_discard_one_topic()
+    test_concurrent_runs_keep_each_others_records()
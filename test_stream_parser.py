@@ -0,0 +1,162 @@
+import threading
+import contextlib
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from scrapers.stream_parser import FeedStream, parse_date
+from scrapers.news import download_feed, parse_feed, fetch_feeds, HostLimiter, DEFAULT_IMAGE
+from bench_rss_fetch import make_rss, serve_feeds
+import requests
+
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+def rss_chunks(count, chunk_items=200, start=NOW):
+    """
+    최신순 RSS 문서를 조각 단위로 생성합니다 (문서 전체를 메모리에 만들지 않음).
+    """
+    yield b'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>Big Feed</title>'
+    for base in range(0, count, chunk_items):
+        parts = []
+        for i in range(base, min(base + chunk_items, count)):
+            pub = format_datetime(start - timedelta(minutes=10 * i))
+            parts.append(f"<item><title>Aggregated story {i}</title><link>https://example.com/big/{i}</link>"
+                         f"<pubDate>{pub}</pubDate><description>{'lorem ipsum ' * 80}</description></item>")
+        yield "".join(parts).encode("utf-8")
+    yield b"</channel></rss>"
+
+def split(document, size=1000):
+    return [document[i:i + size] for i in range(0, len(document), size)]
+
+def test_stream_matches_feedparser():
+    print("[TEST] Testing streaming parser against feedparser...")
+    document = make_rss(7)
+    expected = parse_feed({'url': "u", 'content': document, 'headers': {}, 'not_modified': False, 'error': None})
+
+    stream = FeedStream()
+    entries = list(stream.iter_entries(split(document, 97)))
+    assert stream.source == expected['source'] == "Stub Feed 7"
+    assert len(entries) == len(expected['entries']) == 30
+    for got, want in zip(entries, expected['entries']):
+        assert got['title'] == want['title']
+        assert got['link'] == want['link']
+        assert got['summary'] == want['summary']
+        assert got['published'] == want['published']
+    print("[OK] Same records as feedparser")
+
+def test_stream_parses_atom():
+    print("[TEST] Testing Atom entries...")
+    document = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:media="http://search.yahoo.com/mrss/">
+  <title>Atom Feed</title>
+  <entry>
+    <title>Robots &amp; AI</title>
+    <link rel="self" href="https://example.com/self"/>
+    <link rel="alternate" href="https://example.com/robots"/>
+    <updated>2026-02-06T09:30:00+09:00</updated>
+    <summary>Robot summary</summary>
+    <media:thumbnail url="https://example.com/robot.png"/>
+  </entry>
+  <entry>
+    <title>No image</title>
+    <link href="https://example.com/plain"/>
+    <published>2026-02-05T10:00:00Z</published>
+    <content type="html">Plain content</content>
+  </entry>
+</feed>"""
+    stream = FeedStream()
+    first, second = stream.iter_entries(split(document, 50))
+    assert stream.source == "Atom Feed"
+    assert first == {'title': "Robots & AI", 'link': "https://example.com/robots", 'summary': "Robot summary",
+                     'published': datetime(2026, 2, 6, 0, 30), 'image': "https://example.com/robot.png"}
+    assert second['link'] == "https://example.com/plain" and second['summary'] == "Plain content"
+    assert second['published'] == datetime(2026, 2, 5, 10, 0) and second['image'] is None
+    assert parse_date("not a date") is None
+    print("[OK] Atom parsed")
+
+def test_stream_stops_at_date_cutoff():
+    print("[TEST] Testing early stop at date cutoff...")
+    consumed = []
+
+    def counted(chunks):
+        for chunk in chunks:
+            consumed.append(len(chunk))
+            yield chunk
+
+    # 10분 간격 2만 건 (약 139일치) 중 최근 1일만 필요
+    cutoff = (NOW - timedelta(days=1, minutes=5)).replace(tzinfo=None)
+    stream = FeedStream(date_cutoff=cutoff)
+    entries = list(stream.iter_entries(counted(rss_chunks(20_000))))
+
+    assert len(entries) == 145
+    assert stream.stopped_early
+    assert stream.entries_parsed == 145 + 3
+    # 조각 100개 중 처음 몇 개만 읽음
+    assert len(consumed) <= 3, len(consumed)
+    print(f"[OK] Stopped after {len(consumed)} chunks ({sum(consumed):,} bytes)")
+
+def test_stream_memory_is_bounded():
+    print("[TEST] Testing bounded memory on a large feed...")
+    tracemalloc.start()
+    stream = FeedStream()
+    count = 0
+    total = 0
+    for chunk in rss_chunks(20_000):
+        total += len(chunk)
+        count += len(stream.feed(chunk))
+    count += len(stream.close())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert count == 20_000
+    assert total > 15_000_000
+    # 문서 크기(약 20MB)와 무관하게 조각 1개 + 엔트리 몇 개 수준
+    assert peak < 3_000_000, f"peak {peak:,} bytes"
+    print(f"[OK] {total:,} byte feed parsed with peak {peak:,} bytes")
+
+@contextlib.contextmanager
+def serve_document(body):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/rss+xml")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/feed"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_streaming_feeds_in_fetch_pipeline():
+    print("[TEST] Testing streaming feeds in fetch_feeds...")
+    with serve_feeds(3, latency=0.0) as feeds:
+        expected = fetch_feeds(feeds)
+        streamed = fetch_feeds(feeds, streaming_feeds=set(feeds[1:]))
+    for got, want in zip(streamed, expected):
+        assert got['error'] is None and got['source'] == want['source']
+        assert got['entries'] == want['entries']
+
+    # XML 오류(정의되지 않은 엔티티)가 있는 피드는 feedparser로 다시 처리
+    broken = make_rss(1).replace(b"Startup news number 0", b"Startup&nbsp;news number 0")
+    with serve_document(broken) as url, requests.Session() as session:
+        download = download_feed(session, url, HostLimiter(), stream=True)
+        parsed = parse_feed(download)
+    assert parsed['error'] is None and len(parsed['entries']) == 30
+    assert parsed['entries'][0]['image'] == DEFAULT_IMAGE
+    print("[OK] Streaming results match; malformed feed falls back")
+
+if __name__ == "__main__":
+    test_stream_matches_feedparser()
+    test_stream_parses_atom()
+    test_stream_stops_at_date_cutoff()
+    test_stream_memory_is_bounded()
+    test_streaming_feeds_in_fetch_pipeline()
@@ -0,0 +1,162 @@
+import os
+import csv
+import tempfile
+import threading
+import time
+from subscriber_repo import SubscriberRepository, SheetSyncWorker
+
+class FakeSheet:
+    """
+    google_sheet.SheetSubscriberSource 대역.
+    """
+    def __init__(self, rows=None, connected=True, can_append=True):
+        self.rows = rows if rows is not None else []
+        self.connected = connected
+        self.can_append = can_append
+        self.appends = []
+        self.reads = []
+
+    def fetch_rows(self, start=0):
+        if not self.connected:
+            return None
+        self.reads.append(start)
+        return [dict(zip(["email", "nickname", "date"], row)) for row in self.rows[start:]]
+
+    def append_rows(self, rows):
+        if not self.can_append:
+            return False
+        self.appends.append(rows)
+        self.rows.extend(rows)
+        return True
+
+def test_subscriber_repo_add_import_and_stream():
+    print("[TEST] Testing subscriber repository...")
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "subscribers.csv")
+        with open(csv_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["email", "nickname", "date"])
+            writer.writerow(["old@example.com", "Old", "2026-01-01 00:00:00"])
+            writer.writerow(["not-an-email", "x", ""])
+
+        repo = SubscriberRepository(os.path.join(tmp, "subscribers.db"))
+        assert repo.import_csv(csv_path) == 1
+        assert repo.import_csv(csv_path) == 0  # 바뀌지 않은 파일은 다시 읽지 않음
+
+        assert repo.add("new@example.com", "New")
+        assert not repo.add("NEW@example.com ", "Dup")  # 대소문자/공백 무시
+        assert "old@example.com" in repo
+
+        for i in range(1200):
+            repo.add(f"user{i:04d}@example.com", "U")
+        repo.unsubscribe("user0000@example.com")
+
+        emails = list(repo.iter_active(batch_size=100))
+        assert len(emails) == repo.count() == 1201
+        assert "user0000@example.com" not in emails
+        assert len(set(emails)) == len(emails)
+        repo.close()
+
+def test_subscriber_repo_two_way_sheet_sync():
+    print("[TEST] Testing two-way Google Sheet sync...")
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = SubscriberRepository(os.path.join(tmp, "subscribers.db"))
+        repo.add("local@example.com", "Local")
+        repo.add("both@example.com", "Both")
+        sheet = FakeSheet([["sheet@example.com", "Sheet", "2026-02-01"], ["Both@example.com", "Both", "2026-02-01"]])
+
+        assert repo.sync(sheet) == {'pulled': 1, 'pushed': 1}
+        assert "sheet@example.com" in repo
+        assert [row[0] for row in sheet.appends[0]] == ["local@example.com"]  # 시트에 이미 있는 주소는 올리지 않음
+        assert repo.sync(sheet) == {'pulled': 0, 'pushed': 0}
+
+        # 시트 미설정이면 아무것도 하지 않음
+        assert repo.sync(FakeSheet(connected=False)) is None
+
+        # 백그라운드 워커: 가입 직후 request()로 즉시 동기화
+        worker = SheetSyncWorker(repo, sheet, interval=3600).start()
+        synced = threading.Event()
+        original = sheet.append_rows
+        sheet.append_rows = lambda rows: (original(rows), synced.set())
+        repo.add("late@example.com", "Late")
+        worker.request()
+        assert synced.wait(5)
+        worker.stop(timeout=5)
+        assert sheet.rows[-1][0] == "late@example.com"
+        repo.close()
+
+def test_subscriber_repo_retries_failed_sheet_append():
+    print("[TEST] Testing failed sheet append...")
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = SubscriberRepository(os.path.join(tmp, "subscribers.db"))
+        repo.add("local@example.com", "Local")
+        sheet = FakeSheet([["sheet@example.com", "Sheet", "2026-02-01"]], can_append=False)
+
+        # 시트는 읽히지만 추가가 실패 -> 로컬 구독자는 동기화되지 않은 상태로 남음
+        assert repo.sync(sheet) == {'pulled': 1, 'pushed': 0}
+        sheet.can_append = True
+        assert repo.sync(sheet) == {'pulled': 0, 'pushed': 1}
+        assert [row[0] for row in sheet.appends[0]] == ["local@example.com"]
+        assert repo.sync(sheet) == {'pulled': 0, 'pushed': 0}
+        repo.close()
+
+def test_subscriber_repo_reads_sheet_incrementally():
+    print("[TEST] Testing incremental sheet reads...")
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = SubscriberRepository(os.path.join(tmp, "subscribers.db"))
+        sheet = FakeSheet([[f"s{i}@example.com", "S", "2026-02-01"] for i in range(50)])
+        assert repo.sync(sheet) == {'pulled': 50, 'pushed': 0}
+
+        # 이후 동기화는 마지막으로 읽은 행부터만 (전체 시트를 다시 받지 않음)
+        sheet.rows.append(["new@example.com", "New", "2026-02-02"])
+        repo.add("local@example.com", "Local")
+        assert repo.sync(sheet) == {'pulled': 1, 'pushed': 1}
+        assert repo.sync(sheet) == {'pulled': 0, 'pushed': 0}
+        assert sheet.reads == [0, 49, 50]
+        assert "new@example.com" in repo
+
+        # 시트를 직접 편집(행 삭제)하면 처음부터 다시 읽음
+        del sheet.rows[:10]
+        sheet.rows.append(["after-edit@example.com", "E", "2026-02-03"])
+        assert repo.sync(sheet) == {'pulled': 1, 'pushed': 0}
+        assert sheet.reads[-2:] == [51, 0]
+
+        # 다시 연 저장소도 읽은 위치를 기억함
+        repo.close()
+        repo = SubscriberRepository(os.path.join(tmp, "subscribers.db"))
+        assert repo.sync(sheet) == {'pulled': 0, 'pushed': 0}
+        assert sheet.reads[-1] == len(sheet.rows) - 1
+        repo.close()
+
+def test_concurrent_syncs_push_each_subscriber_once():
+    print("[TEST] Testing concurrent sheet syncs from two processes...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "subscribers.db")
+        # 앱과 main.py처럼 같은 DB를 각자 연 저장소 2개
+        app_repo, job_repo = SubscriberRepository(path), SubscriberRepository(path)
+        for i in range(5):
+            app_repo.add(f"user{i}@example.com", "U")
+
+        sheet = FakeSheet()
+        original = sheet.append_rows
+        def slow_append(rows):
+            time.sleep(0.1)  # 느린 시트 API: 앞의 sync가 올리는 동안 다른 sync가 시작됨
+            return original(rows)
+        sheet.append_rows = slow_append
+
+        threads = [threading.Thread(target=repo.sync, args=(sheet,)) for repo in (app_repo, job_repo)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        emails = [row[0] for row in sheet.rows]
+        assert sorted(emails) == [f"user{i}@example.com" for i in range(5)]
+        app_repo.close()
+        job_repo.close()
+
+if __name__ == "__main__":
+    test_subscriber_repo_add_import_and_stream()
+    test_subscriber_repo_two_way_sheet_sync()
+    test_subscriber_repo_retries_failed_sheet_append()
+    test_subscriber_repo_reads_sheet_incrementally()
+    test_concurrent_syncs_push_each_subscriber_once()
@@ -0,0 +1,60 @@
+import threading
+from subscriber_store import SubscriberStore
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+def test_subscriber_store_ttl_and_background_refresh():
+    print("[TEST] Testing subscriber store TTL cache...")
+    clock = FakeClock()
+    release = threading.Event()
+    versions = iter(["v1", "v2", "v3"])
+    calls = []
+
+    def loader():
+        calls.append(clock.now)
+        if len(calls) > 1:
+            release.wait(5)  # 느린 구글 시트 호출 흉내
+        return next(versions)
+
+    store = SubscriberStore(loader, ttl=60, clock=clock)
+    assert store.get() == "v1"           # 첫 조회만 기다림
+    clock.now = 30
+    assert store.get() == "v1" and len(calls) == 1  # TTL 이내 -> 호출 없음
+
+    clock.now = 61
+    assert store.get() == "v1"           # 만료: 이전 목록을 바로 반환하고 백그라운드로 새로고침
+    assert store.get() == "v1"
+    assert len(calls) == 2               # 진행 중인 새로고침은 공유
+    release.set()
+    store._refreshing.join()
+    assert store.get() == "v2" and store.loads == 2
+
+    store.invalidate()
+    store.get()
+    store._refreshing.join()
+    assert store.get() == "v3"
+
+def test_subscriber_store_keeps_data_on_failure():
+    print("[TEST] Testing subscriber store failure handling...")
+    clock = FakeClock()
+    results = ["ok", RuntimeError("quota exceeded")]
+
+    def loader():
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    store = SubscriberStore(loader, ttl=10, clock=clock)
+    assert store.get() == "ok"
+    clock.now = 11
+    store.refresh(wait=True)
+    assert store.get() == "ok"
+
+if __name__ == "__main__":
+    test_subscriber_store_ttl_and_background_refresh()
+    test_subscriber_store_keeps_data_on_failure()
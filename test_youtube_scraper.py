@@ -1,4 +1,9 @@
+import os
+import tempfile
+import threading
+import time
 from scrapers.youtube import fetch_youtube_videos
+from scrapers.transcript_cache import TranscriptCache
 
 def test_youtube_scraper():
     print("[TEST] Testing YouTube Scraper...")
@@ -21,5 +26,58 @@ def test_youtube_scraper():
     except Exception as e:
         print(f"[ERROR] Error during test: {e}")
 
+class FakeYouTube:
+    """
+    검색/자막 클라이언트 대역. 호출마다 delay만큼 지연되고, 자막 다운로드 횟수를 기록합니다.
+    """
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.transcript_calls = []
+        self._lock = threading.Lock()
+
+    def search(self, keyword, max_results):
+        time.sleep(self.delay)
+        # "shared" 영상은 모든 키워드 검색 결과에 나옴
+        return [
+            {'id': 'shared', 'title': 'Shared video', 'url_suffix': '/watch?v=shared'},
+            {'id': f"{keyword}-1", 'title': f"{keyword} video", 'url_suffix': f"/watch?v={keyword}-1"},
+        ][:max_results]
+
+    def get_transcript(self, video_id):
+        time.sleep(self.delay)
+        with self._lock:
+            self.transcript_calls.append(video_id)
+        if video_id.startswith('nosub'):
+            raise RuntimeError("Transcripts are disabled")
+        return f"transcript of {video_id}"
+
+def test_fetch_youtube_videos_parallel_with_cache():
+    print("[TEST] Testing parallel YouTube fetch with fake clients...")
+    fake = FakeYouTube()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "transcripts.json")
+
+        start = time.perf_counter()
+        first = fetch_youtube_videos(["ai", "nosub"], search=fake.search, get_transcript=fake.get_transcript,
+                                     cache=TranscriptCache(cache_path))
+        elapsed = time.perf_counter() - start
+
+        # 검색 2회 + 자막 3개가 순차라면 1초, 동시 실행이면 약 0.4초
+        assert elapsed < 0.8, f"not concurrent ({elapsed:.2f}s)"
+        assert [v['title'] for v in first] == ['Shared video', 'ai video', 'Shared video', 'nosub video']
+        assert first[0]['summary'] == "[YouTube Video] transcript of shared..."
+        assert first[3]['summary'] == "[YouTube Video] (No Transcript Available)"
+        assert sorted(fake.transcript_calls) == ['ai-1', 'nosub-1', 'shared']
+
+        # 다음 실행: 자막이 있던 영상은 디스크 캐시에서, 자막 없던 영상만 재시도
+        fake.transcript_calls.clear()
+        second = fetch_youtube_videos(["ai", "nosub"], search=fake.search, get_transcript=fake.get_transcript,
+                                      cache=TranscriptCache(cache_path))
+        assert second == first
+        assert fake.transcript_calls == ['nosub-1']
+    print("[OK] transcripts fetched once per video")
+
 if __name__ == "__main__":
     test_youtube_scraper()
+    test_fetch_youtube_videos_parallel_with_cache()
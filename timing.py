@@ -0,0 +1,36 @@
+import time
+import threading
+import contextlib
+
+
+class StageTimer:
+    """
+    파이프라인 단계별 소요 시간(wall-clock)을 기록합니다.
+    동시에 실행되는 단계(스레드/코루틴)에서도 안전하게 사용할 수 있습니다.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self.timings = {}  # 단계 이름 -> (시작 오프셋, 소요 시간)
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self.timings[name] = (start - self._start, end - start)
+
+    def total(self):
+        return time.perf_counter() - self._start
+
+    def report(self, title="[TIMING]"):
+        """
+        단계별 시작 시점/소요 시간을 출력합니다. 시작 시점이 겹치는 단계는 동시에 실행된 것입니다.
+        """
+        print(f"\n{title} Stage timings (wall-clock)")
+        for name, (offset, duration) in sorted(self.timings.items(), key=lambda kv: kv[1][0]):
+            print(f"{title}   {name:<22} start +{offset:6.2f}s  took {duration:6.2f}s")
+        print(f"{title}   {'total':<22} {self.total():.2f}s")